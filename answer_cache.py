@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from config_loader import get_resume_profile, load_config
+
+
+def context_hash(resume_context):
+    """Stable short hash of the resume context used to scope cached answers."""
+    if not isinstance(resume_context, str):
+        resume_context = json.dumps(resume_context, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(resume_context.encode("utf-8")).hexdigest()[:16]
+
+
+def file_hash(path):
+    if not path or not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def resume_fingerprint(config_path):
+    """Hash of the config's resume part only, so editing bot settings keeps cached answers."""
+    if not config_path or not os.path.exists(config_path):
+        return ""
+    try:
+        return context_hash(get_resume_profile(load_config(config_path)))
+    except ValueError:
+        return file_hash(config_path)
+
+
+def normalize_label(label):
+    label = re.sub(r"\s+", " ", (label or "").strip().lower())
+    return label.rstrip("?:*. ")
+
+
+class AnswerCache:
+    def __init__(self, path="answer_cache.json", max_entries=2000, ttl_seconds=30 * 24 * 3600,
+                 config_path="config.json"):
+        """
+        On-disk LRU/TTL cache of field answers.
+
+        Args:
+            path (str): JSON file the cache is persisted to.
+            max_entries (int): Least recently used entries are evicted beyond this size.
+            ttl_seconds (float): Entries older than this are treated as misses.
+            config_path (str): The whole cache is dropped when the resume part of this config
+                changes; the "bot" settings don't count.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.config_fingerprint = resume_fingerprint(config_path)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()  # shared between worker threads
+        self._dirty = False
+        self._entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return OrderedDict()
+        with open(self.path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                return OrderedDict()
+        if data.get("config_fingerprint") != self.config_fingerprint:
+            self._dirty = True
+            return OrderedDict()
+        return OrderedDict(data.get("entries", []))
+
+    @staticmethod
+    def make_key(label, input_type, options=None, validation_hint="", resume_hash=""):
+        parts = [
+            normalize_label(label),
+            (input_type or "").lower(),
+            "|".join(sorted(normalize_label(o) for o in options or [])),
+            normalize_label(validation_hint),
+            resume_hash,
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if self.ttl_seconds and time.time() - entry["stored_at"] > self.ttl_seconds:
+            del self._entries[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry["answer"]
+
+    def peek(self, key):
+        """
+        The live answer for `key`, or None, without counting a hit or miss or refreshing
+        its LRU position: for look-ahead checks that aren't real lookups.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (self.ttl_seconds and time.time() - entry["stored_at"] > self.ttl_seconds):
+                return None
+            return entry["answer"]
+
+    def __contains__(self, key):
+        return self.peek(key) is not None
+
+    def put(self, key, answer, label=""):
+        with self._lock:
+            self._put(key, answer, label)
+
+    def _put(self, key, answer, label):
+        self._entries[key] = {"answer": answer, "label": label, "stored_at": time.time()}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._dirty = True
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "config_fingerprint": self.config_fingerprint,
+                    "entries": list(self._entries.items()),
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
@@ -0,0 +1,201 @@
+import re
+
+from answer_cache import normalize_label
+
+
+def parse_years(duration):
+    """'4 years' -> 4.0, '18 months' -> 1.5, '2 years 6 months' -> 2.5. None if unparseable."""
+    text = str(duration or "").lower()
+    years = re.search(r"(\d+(?:\.\d+)?)\s*(?:years?|yrs?)", text)
+    months = re.search(r"(\d+(?:\.\d+)?)\s*(?:months?|mos?)", text)
+    if not years and not months:
+        return None
+    return (float(years.group(1)) if years else 0.0) + (float(months.group(1)) / 12 if months else 0.0)
+
+
+DAYS_PER_UNIT = {"day": 1, "week": 7, "month": 30, "year": 365}
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(day|week|month|mo|year|yr)s?\b")
+# Only the plain phrasings: "years of experience", "how many years of work experience do you have"
+TOTAL_EXPERIENCE = re.compile(
+    r"^(?:(?:how many|number of|total|overall)\s+)*years of "
+    r"(?:(?:total|overall|work|professional|relevant|industry)\s+)*experience"
+    r"(?: do you (?:currently )?have)?(?: in total| overall)?$"
+    r"|^total (?:work )?experience(?: \(?in years\)?)?$"
+)
+# Stated willingness only; "relocation assistance/package" questions go to the LLM
+RELOCATION = re.compile(
+    r"\b(?:willing|open|ready|able|comfortable|prepared|happy)\b(?: to)? relocat|\b(?:can|could|would) you relocate"
+)
+
+
+def parse_days(duration):
+    """'1 month' -> 30, '2 weeks' -> 14, 'Immediate' -> 0. None if unparseable."""
+    text = str(duration or "").lower()
+    if re.search(r"\bimmediate", text):
+        return 0.0
+    parts = DURATION_PATTERN.findall(text)
+    if not parts:
+        return None
+    units = {"mo": "month", "yr": "year"}
+    return sum(float(n) * DAYS_PER_UNIT[units.get(unit, unit)] for n, unit in parts)
+
+
+def requested_unit(label):
+    """The duration unit a question asks for, e.g. "day" for "Notice period (in days)"."""
+    match = re.search(r"\(?in (day|week|month)s\)?|\((day|week|month)s\)", label)
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def format_number(value, whole=False):
+    if whole or float(value).is_integer():
+        return str(int(round(float(value))))
+    return f"{float(value):g}"
+
+
+def coerce_numeric(answer, validation_hint="", input_type=""):
+    """
+    Reduces a free-text answer to the number a numeric field expects.
+
+    Understands LinkedIn hints such as "Enter a decimal number larger than 0.0"
+    and "Enter a whole number between 0 and 99", and the one-sided bounds
+    field_extractor.constraint_hint writes. Returns None when the answer
+    has no number or the number breaks the hint's bounds.
+    """
+    match = re.search(r"-?\d[\d,]*(?:\.\d+)?", str(answer or ""))
+    if not match:
+        return None
+    value = float(match.group(0).replace(",", ""))
+    hint = (validation_hint or "").lower()
+
+    larger = re.search(r"(?:larger|greater|more) than (-?\d+(?:\.\d+)?)", hint)
+    if larger and not value > float(larger.group(1)):
+        return None
+    at_least = re.search(r"at least (-?\d+(?:\.\d+)?)", hint)
+    if at_least and not value >= float(at_least.group(1)):
+        return None
+    at_most = re.search(r"(?:no more than|at most) (-?\d+(?:\.\d+)?)", hint)
+    if at_most and not value <= float(at_most.group(1)):
+        return None
+    between = re.search(r"between (-?\d+(?:\.\d+)?) and (-?\d+(?:\.\d+)?)", hint)
+    if between and not float(between.group(1)) <= value <= float(between.group(2)):
+        return None
+    whole = "whole number" in hint or "integer" in hint
+    return format_number(value, whole=whole)
+
+
+def is_numeric_field(input_type, validation_hint):
+    hint = (validation_hint or "").lower()
+    return (input_type or "").lower() in ("number", "decimal", "numeric") or "number" in hint
+
+
+def match_option(answer, options):
+    """Maps an answer onto one of the field's options, or None if nothing fits."""
+    if not options:
+        return answer
+    wanted = normalize_label(answer)
+    if not wanted:
+        return None
+    normalized = [(normalize_label(o), o) for o in options]
+    for norm, original in normalized:
+        if norm == wanted:
+            return original
+    for norm, original in normalized:
+        if norm and (wanted.startswith(norm) or norm in wanted or wanted in norm):
+            return original
+    return None
+
+
+class AnswerRules:
+    def __init__(self, resume_context):
+        """
+        Deterministic answers for common Easy Apply questions, taken straight from
+        the structured resume context. Everything here runs in microseconds; fields
+        it cannot answer confidently return None and go to the LLM.
+        """
+        self.context = resume_context or {}
+        self.total_years, self.skill_years = self._index_experience()
+        self.rules = [
+            (re.compile(r"notice period|how soon can you (join|start)|earliest (start|joining)"), self._key_rule("notice_period")),
+            (re.compile(r"expected (ctc|salary|compensation|annual|pay)"), self._key_rule("expected_salary")),
+            (re.compile(r"current (ctc|salary|compensation|annual|pay)|present (ctc|salary)"), self._key_rule("current_salary")),
+            (RELOCATION, self._key_rule("relocation")),
+            (re.compile(r"preferred (work )?location|location preference|preferred cit"), self._location_preference),
+            (re.compile(r"years\b.*\bexperience|experience\b.*\byears"), self._years_of_experience),
+        ]
+
+    def _index_experience(self):
+        total = 0.0
+        skill_years = {}
+        for entry in self.context.get("experience", []) or []:
+            if not isinstance(entry, dict):
+                continue
+            years = parse_years(entry.get("duration"))
+            if years is None:
+                continue
+            total += years
+            for skill in entry.get("tech_stack", []) or []:
+                key = normalize_label(skill)
+                skill_years[key] = skill_years.get(key, 0.0) + years
+        # Primary skills are what the candidate has been doing all along
+        for skill in self.context.get("primary_skills", []) or []:
+            skill_years.setdefault(normalize_label(skill), total)
+        return (total or None), skill_years
+
+    def _key_rule(self, key):
+        def rule(label):
+            value = self.context.get(key)
+            if isinstance(value, str):
+                # Unset ${ENV} placeholders leave only decorations such as " (negotiable)"
+                value = value.strip()
+                if not re.search(r"\w", re.sub(r"\(.*?\)", "", value)):
+                    return None
+            return value or None
+        return rule
+
+    def _location_preference(self, label):
+        return self.context.get("location_preference") or None
+
+    def _years_of_experience(self, label):
+        # A known skill as the object of the question ("with AWS Glue", "of Python experience");
+        # longest skill names first so "aws glue" wins over "aws"
+        for skill in sorted(self.skill_years, key=len, reverse=True):
+            if re.search(rf"\b(?:with|in|using|on|of) {re.escape(skill)}(?!\w)", label):
+                return format_number(self.skill_years[skill])
+        # Total experience only for the unqualified question; "managing teams", other skills etc. go to the LLM
+        if self.total_years and TOTAL_EXPERIENCE.search(label):
+            return format_number(self.total_years)
+        return None
+
+    def resolve(self, label, input_type, options=None, validation_hint=""):
+        """
+        Returns the answer for a field, or None if no rule resolves it.
+
+        Args:
+            label (str): The field's question text.
+            input_type (str): The field's input type ("text", "radio", "select-one", ...).
+            options (list): Option texts for selects and radio groups.
+            validation_hint (str): Inline validation message, e.g. "Enter a decimal number larger than 0.0".
+        """
+        normalized = normalize_label(label)
+        for pattern, rule in self.rules:
+            if not pattern.search(normalized):
+                continue
+            answer = rule(normalized)
+            if answer is None:
+                return None
+            if isinstance(answer, list):
+                if not options:
+                    return ", ".join(str(a) for a in answer)
+                # Pick the first preference that is on offer
+                return next((m for m in (match_option(str(a), options) for a in answer) if m), None)
+            if options:
+                return match_option(str(answer), options)
+            unit = requested_unit(normalized)
+            days = parse_days(answer) if unit else None
+            if days is not None:
+                # "1 month" for "Notice period (in days)" is 30, not 1
+                answer = format_number(round(days / DAYS_PER_UNIT[unit], 1))
+            if is_numeric_field(input_type, validation_hint):
+                return coerce_numeric(answer, validation_hint, input_type)
+            return str(answer)
+        return None
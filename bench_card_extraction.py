@@ -0,0 +1,73 @@
+# bench_card_extraction.py
+#
+# Compares the old per-card find_element parsing with the single execute_script
+# card snapshot on generated result lists of 25, 100 and 500 cards (card markup
+# from mock_linkedin).
+# Usage: python bench_card_extraction.py [repeats]
+
+import html
+import os
+import re
+import sys
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+
+from card_extractor import extract_job_cards
+from driver_metrics import CommandCounter, measure
+from mock_linkedin import CARD, PAGE, build_catalog
+
+SIZES = (25, 100, 500)
+
+
+def write_fixture(directory, count):
+    items = "".join(
+        f'<li data-occludable-job-id="{job["job_id"]}">'
+        + CARD.format(**{k: html.escape(str(v)) for k, v in job.items()}) + "</li>"
+        for job in build_catalog(count)
+    )
+    path = os.path.join(directory, f"job_cards_{count}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(PAGE.format(title="Jobs", body=f'<ul class="jobs-search-results-list">{items}</ul>'))
+    return path
+
+
+def legacy_scan(driver):
+    """The per-card reads _read_visible_job_cards used to make."""
+    cards = []
+    for job in driver.find_elements(By.CLASS_NAME, "job-card-container"):
+        title = job.find_element(By.CSS_SELECTOR, "a.job-card-container__link span strong").text.strip()
+        company = job.find_element(By.CSS_SELECTOR, "div.artdeco-entity-lockup__subtitle span").text.strip()
+        location = job.find_element(By.CSS_SELECTOR, "ul.job-card-container__metadata-wrapper li").text.strip()
+        link = job.find_element(By.TAG_NAME, "a").get_attribute("href")
+        match = re.search(r"/jobs/view/(\d+)", link)
+        cards.append({"title": title, "company": company, "location": location, "link": link,
+                      "job_id": match.group(1) if match else None})
+    return cards
+
+
+def snapshot_scan(driver):
+    return extract_job_cards(driver)[0]
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    options = Options()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for count in SIZES:
+                driver.get("file://" + write_fixture(directory, count))
+                counter = CommandCounter(driver)
+                legacy, legacy_ms, legacy_calls = measure(driver, counter, legacy_scan, repeats)
+                snapshot, snapshot_ms, snapshot_calls = measure(driver, counter, snapshot_scan, repeats)
+                counter.detach()
+
+                assert [c["job_id"] for c in legacy] == [c["job_id"] for c in snapshot], "paths disagree on job ids"
+                print(f"{count:4d} cards  per-element: {legacy_ms:8.1f} ms  {legacy_calls:6.0f} calls   "
+                      f"snapshot: {snapshot_ms:6.1f} ms  {snapshot_calls:3.0f} calls")
+    finally:
+        driver.quit()
@@ -0,0 +1,132 @@
+# bench_end_to_end.py
+#
+# Runs LinkedInBot end to end against mock_linkedin (search pages, multi-step
+# Easy Apply modals with text, select and radio fields and validation errors)
+# and a FakeGeminiModel, with no network access. Reports jobs/minute, per-phase
+# latency percentiles and WebDriver round trips. With --baseline it compares
+# against a previous --output file and exits non-zero on a regression.
+#
+# Usage: python bench_end_to_end.py [--jobs 12] [--mode side_panel] [--llm-latency 0.8]
+#            [--site-latency 0.05] [--lean] [--output run.json] [--baseline run.json]
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from answer_cache import AnswerCache
+from config_loader import get_resume_profile, load_config
+from driver_metrics import CommandCounter
+from fake_gemini import FakeGeminiModel
+from job_tracker import JobTracker
+from linkedin_bot import LinkedInBot
+from llm_client import LLMClient
+from metrics import Metrics
+from mock_linkedin import MockLinkedIn
+from schema_cache import SchemaCache
+
+# Relative slack allowed against --baseline before a metric counts as a regression
+TOLERANCE = 0.15
+
+
+def run(args):
+    state_dir = tempfile.mkdtemp(prefix="bench_e2e_")
+    model = FakeGeminiModel(latency=args.llm_latency, jitter=args.llm_latency / 5, seed=1)
+    metrics = Metrics(os.path.join(state_dir, "metrics.jsonl"), prometheus_path=None, summary_path=None)
+    llm = LLMClient(model, requests_per_minute=args.llm_rpm, metrics=metrics)
+    tracker = JobTracker(os.path.join(state_dir, "applied_jobs.json"), backend="sqlite")
+
+    with MockLinkedIn(job_count=args.jobs, latency=args.site_latency) as site:
+        bot = LinkedInBot(
+            headless=not args.headed,
+            resume_context=get_resume_profile(load_config()),
+            base_url=site.base_url,
+            tracker=tracker,
+            answer_cache=AnswerCache(os.path.join(state_dir, "answer_cache.json")),
+            schema_cache=SchemaCache(os.path.join(state_dir, "schema_cache.json")),
+            llm_client=llm,
+            apply_mode=args.mode,
+            lean=args.lean,
+            metrics=metrics,
+        )
+        bot.waits.stats_path = os.path.join(state_dir, "wait_stats.json")
+        counter = CommandCounter(bot.driver)
+        try:
+            started = time.perf_counter()
+            bot.login("mock@example.com", "mock-password")
+            bot.search_jobs("Data Engineer", "India")
+            attempted = bot.apply_to_jobs(bot.iter_job_cards(max_jobs=args.jobs))
+            elapsed = time.perf_counter() - started
+        finally:
+            bot.close()
+            llm.shutdown()
+            tracker.close()
+            metrics.close()
+        submitted = sum(site.submissions.values())
+        http_requests = site.requests
+
+    return {
+        "mode": args.mode,
+        "lean": args.lean,
+        "jobs": args.jobs,
+        "attempted": attempted,
+        "submitted": submitted,
+        "elapsed_s": round(elapsed, 1),
+        "jobs_per_minute": round(submitted / (elapsed / 60), 2) if elapsed else 0.0,
+        "driver_calls": counter.total,
+        "driver_calls_per_job": round(counter.total / max(attempted, 1), 1),
+        "driver_calls_per_modal_step": round(sum(bot.step_driver_calls) / max(len(bot.step_driver_calls), 1), 1),
+        "http_requests": http_requests,
+        "llm_calls": model.calls,
+        "answer_sources": dict(bot.answer_sources),
+        # Span names from linkedin_bot (login, search, navigation, modal, field_scan, fill, resolve,
+        # llm_call, ...). Spans nest (resolve runs inside modal), so times are inclusive.
+        "phases": metrics.summary()["phases"],
+    }
+
+
+def regressions(report, baseline):
+    """Metrics that got worse than the baseline by more than TOLERANCE."""
+    found = []
+    if report["jobs_per_minute"] < baseline["jobs_per_minute"] * (1 - TOLERANCE):
+        found.append(f"jobs_per_minute {baseline['jobs_per_minute']} -> {report['jobs_per_minute']}")
+    if report["driver_calls_per_job"] > baseline["driver_calls_per_job"] * (1 + TOLERANCE):
+        found.append(f"driver_calls_per_job {baseline['driver_calls_per_job']} -> {report['driver_calls_per_job']}")
+    if report["submitted"] < baseline["submitted"]:
+        found.append(f"submitted {baseline['submitted']} -> {report['submitted']}")
+    for phase, stats in report["phases"].items():
+        before = baseline.get("phases", {}).get(phase)
+        if before and "p95_s" in before and stats["p95_s"] > before["p95_s"] * (1 + TOLERANCE):
+            found.append(f"{phase} p95 {before['p95_s']}s -> {stats['p95_s']}s")
+    return found
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark of LinkedInBot.")
+    parser.add_argument("--jobs", type=int, default=12)
+    parser.add_argument("--mode", default="side_panel", choices=["page", "side_panel", "prefetch"])
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="mean seconds per fake Gemini call")
+    parser.add_argument("--llm-rpm", type=float, default=600)
+    parser.add_argument("--site-latency", type=float, default=0.05, help="seconds added to every mock response")
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--output", help="write the report here (JSON)")
+    parser.add_argument("--baseline", help="compare against a previous --output report")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = run(args)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            found = regressions(report, json.load(f))
+        for line in found:
+            print(f"REGRESSION: {line}")
+        sys.exit(1 if found else 0)
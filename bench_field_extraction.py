@@ -0,0 +1,66 @@
+# bench_field_extraction.py
+#
+# Compares the old per-element field scan with the single execute_script snapshot
+# on a local Easy Apply fixture. Validation probing is left out of both paths so
+# only extraction cost is measured.
+# Usage: python bench_field_extraction.py [repeats]
+
+import os
+import sys
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+
+from driver_metrics import CommandCounter, measure
+from field_extractor import REQUIRED_FIELD_SELECTOR, snapshot_fields
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "easy_apply_step.html")
+
+
+def legacy_scan(driver):
+    """The per-element reads check_required_fields used to make."""
+    fields = []
+    for field in driver.find_elements(By.CSS_SELECTOR, REQUIRED_FIELD_SELECTOR):
+        tag = field.tag_name.lower()
+        if tag == "fieldset":
+            label = field.find_element(By.TAG_NAME, "legend").text.strip()
+            radios = field.find_elements(By.CSS_SELECTOR, "input[type='radio']")
+            filled = any(radio.is_selected() for radio in radios)
+            options = [radio.get_attribute("value") for radio in radios]
+            fields.append({"label": label, "tag": tag, "filled": filled, "options": options})
+        else:
+            label = (
+                field.get_attribute("aria-label")
+                or field.get_attribute("name")
+                or field.get_attribute("placeholder")
+                or field.find_element(By.XPATH, "./preceding-sibling::label").text.strip()
+            )
+            value = field.get_attribute("value") or ""
+            filled = bool(value.strip()) if tag != "select" else field.get_attribute("selectedIndex") not in ["", "0", None]
+            validation = ""
+            if "fb-dash-form-element__error-field" in field.get_attribute("class"):
+                error_id = field.get_attribute("aria-describedby")
+                validation = driver.find_element(By.CSS_SELECTOR, f"#{error_id} .artdeco-inline-feedback__message").text
+            fields.append({"label": label, "tag": tag, "filled": filled, "validation": validation})
+    return fields
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    options = Options()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get("file://" + FIXTURE)
+        counter = CommandCounter(driver)
+
+        legacy, legacy_ms, legacy_calls = measure(driver, counter, legacy_scan, repeats)
+        snapshot, snapshot_ms, snapshot_calls = measure(driver, counter, snapshot_fields, repeats)
+
+        assert [f["label"] for f in legacy] == [f["label"] for f in snapshot], "paths disagree on labels"
+        print(f"fields      : {len(snapshot)}")
+        print(f"per-element : {legacy_ms:7.1f} ms/scan  {legacy_calls:5.0f} driver calls")
+        print(f"snapshot    : {snapshot_ms:7.1f} ms/scan  {snapshot_calls:5.0f} driver calls")
+    finally:
+        driver.quit()
@@ -0,0 +1,73 @@
+# bench_job_navigation.py
+#
+# Per-job navigation cost of opening jobs with a full page load (in a tab of
+# its own) versus the search page's side panel, against mock_linkedin. Each job
+# is opened and closed the way apply_to_jobs would, but no application is
+# submitted.
+# Usage: python bench_job_navigation.py [jobs] [latency_seconds]
+
+import os
+import sys
+import tempfile
+import time
+
+from answer_cache import AnswerCache
+from driver_metrics import CommandCounter
+from fake_gemini import FakeGeminiModel
+from job_tracker import JobTracker
+from linkedin_bot import LinkedInBot
+from llm_client import LLMClient
+from metrics import Metrics
+from mock_linkedin import MockLinkedIn
+from schema_cache import SchemaCache
+
+
+def run(bot, site, mode, jobs):
+    bot.apply_mode = mode
+    bot.search_jobs("Data Engineer", "India")
+    counter = CommandCounter(bot.driver)
+    requests_before = site.requests
+    started = time.perf_counter()
+    opened = 0
+    for card in bot.iter_job_cards(max_jobs=jobs):
+        bot.open_job(card)
+        bot.close_job_tab()
+        opened += 1
+    elapsed = time.perf_counter() - started
+    calls = counter.total
+    counter.detach()
+    return {
+        "mode": mode,
+        "jobs": opened,
+        "ms_per_job": round(elapsed / max(opened, 1) * 1e3, 1),
+        "driver_calls_per_job": round(calls / max(opened, 1), 1),
+        "http_requests_per_job": round((site.requests - requests_before) / max(opened, 1), 1),
+    }
+
+
+if __name__ == "__main__":
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    state_dir = tempfile.mkdtemp(prefix="bench_navigation_")
+    llm = LLMClient(FakeGeminiModel(latency=0.0), requests_per_minute=6000)
+
+    with MockLinkedIn(job_count=jobs, latency=latency) as site:
+        bot = LinkedInBot(
+            headless=True,
+            base_url=site.base_url,
+            tracker=JobTracker(os.path.join(state_dir, "applied_jobs.json")),
+            answer_cache=AnswerCache(os.path.join(state_dir, "answer_cache.json")),
+            schema_cache=SchemaCache(os.path.join(state_dir, "schema_cache.json")),
+            llm_client=llm,
+            metrics=Metrics(os.path.join(state_dir, "metrics.jsonl"), prometheus_path=None, summary_path=None),
+        )
+        bot.waits.stats_path = os.path.join(state_dir, "wait_stats.json")
+        try:
+            bot.login("mock@example.com", "mock-password")
+            for mode in ("page", "side_panel"):
+                print(run(bot, site, mode, jobs))
+            print(f"open timings: {bot.open_timing_summary()}")
+        finally:
+            bot.close()
+            bot.tracker.close()
+            llm.shutdown()
@@ -0,0 +1,80 @@
+# bench_job_tracker.py
+#
+# Micro-benchmark for JobTracker lookup/insert cost at large history sizes.
+# Usage: python bench_job_tracker.py [records]
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from job_tracker import JobTracker
+
+
+class LegacyJsonTracker:
+    """The original tracker: linear scan lookups, full indent=2 rewrite per insert."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "r", encoding="utf-8") as f:
+            self.jobs = json.load(f)
+
+    def has_applied(self, job_id):
+        return any(job.get("job_id") == job_id for job in self.jobs)
+
+    def mark_as_applied(self, job_id, job_title, company):
+        self.jobs.append({"job_id": job_id, "job_title": job_title, "company": company,
+                          "applied_at": datetime.utcnow().isoformat()})
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.jobs, f, indent=2, ensure_ascii=False)
+
+
+def seed_legacy_file(path, n):
+    jobs = [{"job_id": str(i), "job_title": "Data Engineer", "company": f"Company {i % 500}",
+             "applied_at": "2025-01-01T00:00:00"} for i in range(n)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, indent=2)
+
+
+def time_per_op(fn, ops):
+    start = time.perf_counter()
+    for arg in ops:
+        fn(arg)
+    return (time.perf_counter() - start) / len(ops) * 1e6
+
+
+def run(n):
+    lookups = [str(i) for i in range(0, n, max(1, n // 1000))] + [f"missing-{i}" for i in range(100)]
+    print(f"Records: {n:,}")
+    print(f"{'backend':<10}{'startup ms':>12}{'lookup us':>12}{'insert us':>12}")
+
+    for backend in ("legacy", "jsonl", "sqlite"):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "applied_jobs.json")
+            seed_legacy_file(path, n)
+
+            start = time.perf_counter()
+            if backend == "legacy":
+                tracker = LegacyJsonTracker(path)
+                insert_count = 5  # every insert rewrites the whole file
+            else:
+                # First construction migrates the legacy file; time a warm restart
+                JobTracker(path, backend=backend).close()
+                start = time.perf_counter()
+                tracker = JobTracker(path, backend=backend)
+                insert_count = 1000
+            startup_ms = (time.perf_counter() - start) * 1e3
+
+            lookup_us = time_per_op(tracker.has_applied, lookups)
+            inserts = [f"new-{i}" for i in range(insert_count)]
+            insert_us = time_per_op(lambda job_id: tracker.mark_as_applied(job_id, "Data Engineer", "Acme"), inserts)
+            if hasattr(tracker, "close"):
+                tracker.close()
+
+        print(f"{backend:<10}{startup_ms:>12.1f}{lookup_us:>12.2f}{insert_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
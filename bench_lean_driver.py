@@ -0,0 +1,55 @@
+# bench_lean_driver.py
+#
+# Page-load time, bytes transferred and Chrome resident memory with the default
+# driver versus lean mode (LinkedInBot._setup_driver(lean=True)). Defaults to
+# LinkedIn's public jobs page, so it needs network access; pass other URLs to
+# measure those instead.
+# Usage: python bench_lean_driver.py [url ...]
+
+import sys
+import time
+
+from driver_metrics import browser_rss_mb
+from linkedin_bot import LinkedInBot
+
+DEFAULT_URLS = ["https://www.linkedin.com/jobs/search/?keywords=Data%20Engineer&location=India"]
+REPEATS = 3
+
+PAGE_STATS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    resources: resources.length,
+    transferred_kb: resources.reduce((sum, r) => sum + (r.transferSize || 0), nav ? nav.transferSize : 0) / 1024
+};
+"""
+
+
+def measure(lean, urls):
+    driver = LinkedInBot._setup_driver(headless=True, lean=lean)
+    try:
+        loads, resources, transferred = [], [], []
+        for url in urls:
+            for _ in range(REPEATS):
+                driver.get(url)
+                time.sleep(0.5)  # let loadEventEnd settle before reading it
+                stats = driver.execute_script(PAGE_STATS_SCRIPT)
+                loads.append(stats["load_ms"] or 0)
+                resources.append(stats["resources"])
+                transferred.append(stats["transferred_kb"])
+        return {
+            "mode": "lean" if lean else "default",
+            "load_ms": round(sum(loads) / len(loads)),
+            "resources": round(sum(resources) / len(resources)),
+            "transferred_kb": round(sum(transferred) / len(transferred)),
+            "chrome_rss_mb": browser_rss_mb(driver),
+        }
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    urls = sys.argv[1:] or DEFAULT_URLS
+    for lean in (False, True):
+        print(measure(lean, urls))
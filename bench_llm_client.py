@@ -0,0 +1,57 @@
+# bench_llm_client.py
+#
+# Compares the old serial, no-retry path with LLMClient against a fake Gemini
+# model that has real-looking latency and a 429 quota.
+# Usage: python bench_llm_client.py [fields] [quota_rpm]
+
+import sys
+import time
+
+from fake_gemini import FakeGeminiModel
+from gemini_helper import answer_question
+from llm_client import LLMClient
+
+
+def run_serial(model, prompts):
+    answered = 0
+    start = time.perf_counter()
+    for prompt in prompts:
+        try:
+            answer_question(model, context="", question=prompt)
+            answered += 1
+        except Exception:
+            pass  # the bot typed "Sample Text" here
+    return answered, time.perf_counter() - start
+
+
+def run_client(model, fallback, prompts, quota_rpm):
+    client = LLMClient(model, fallback_model=fallback, max_workers=8, requests_per_minute=quota_rpm,
+                       base_delay=0.2, max_delay=2.0)
+    start = time.perf_counter()
+    futures = [client.submit(answer_question, context="", question=p) for p in prompts]
+    answered = 0
+    for future in futures:
+        try:
+            future.result()
+            answered += 1
+        except Exception:
+            pass
+    elapsed = time.perf_counter() - start
+    stats = client.stats()
+    client.shutdown()
+    return answered, elapsed, stats
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    quota = float(sys.argv[2]) if len(sys.argv) > 2 else 600
+    prompts = [f"- Label: Question {i}\n- Input Type: text" for i in range(n)]
+
+    answered, elapsed = run_serial(FakeGeminiModel(latency=0.3, failure_rate=0.1, seed=1), prompts)
+    print(f"serial : {answered}/{n} answered in {elapsed:.1f}s ({answered / elapsed * 60:.0f}/min)")
+
+    primary = FakeGeminiModel(latency=0.3, failure_rate=0.1, requests_per_minute=quota, seed=1)
+    fallback = FakeGeminiModel(latency=0.15, seed=2)
+    answered, elapsed, stats = run_client(primary, fallback, prompts, quota)
+    print(f"client : {answered}/{n} answered in {elapsed:.1f}s ({answered / elapsed * 60:.0f}/min)")
+    print(f"         {stats}")
@@ -0,0 +1,55 @@
+# bench_prompt_build.py
+#
+# Times prompt construction per field: building prompts from the raw resume
+# dict (the summary is rendered again on every call) against a ResumeProfile
+# compiled once (cached summary and prompt heads). Both produce identical text.
+# Usage: python bench_prompt_build.py [iterations]
+
+import sys
+import time
+
+from config_loader import get_resume_profile, load_config
+from gemini_prompter import ResumeProfile, generate_batch_prompt, generate_gemini_prompt
+
+FIELDS = [
+    {"id": "0", "label": "How many years of experience do you have with Python?", "input_type": "text",
+     "validation_hint": "Enter a whole number between 0 and 99"},
+    {"id": "1", "label": "Are you willing to relocate?", "input_type": "radio", "options": ["Yes", "No"]},
+    {"id": "2", "label": "Expected CTC (in LPA)", "input_type": "text"},
+    {"id": "3", "label": "English proficiency", "input_type": "select",
+     "options": ["Native", "Professional", "Conversational", "None"]},
+]
+
+
+def per_field_us(build, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for field in FIELDS:
+            build(field)
+    return (time.perf_counter() - started) / (iterations * len(FIELDS)) * 1e6
+
+
+def single(context):
+    return lambda field: generate_gemini_prompt(field["label"], field["input_type"], context,
+                                                field.get("options"), field.get("validation_hint", ""))
+
+
+def batch(context):
+    return lambda field: generate_batch_prompt([field], context)
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    resume = get_resume_profile(load_config())
+
+    started = time.perf_counter()
+    profile = ResumeProfile(resume)
+    compile_ms = (time.perf_counter() - started) * 1e3
+    assert all(single(resume)(f) == single(profile)(f) and batch(resume)(f) == batch(profile)(f) for f in FIELDS)
+
+    print(f"Profile compiled in {compile_ms:.2f} ms ({profile.token_count} tokens, hash {profile.content_hash})")
+    print(f"{'prompt':<8} {'raw dict (us)':>14} {'profile (us)':>13} {'speedup':>8}")
+    for name, builder in (("single", single), ("batch", batch)):
+        raw = per_field_us(builder(resume), iterations)
+        compiled = per_field_us(builder(profile), iterations)
+        print(f"{name:<8} {raw:>14.1f} {compiled:>13.1f} {raw / compiled:>7.1f}x")
@@ -0,0 +1,84 @@
+# bench_resume_retrieval.py
+#
+# Compares full-summary prompts with retrieval prompts (top-k resume snippets
+# per field) on a fixed set of application questions. Offline it reports the
+# prompt-size reduction and whether the snippets holding each answer were
+# retrieved; with --live it also asks Gemini both prompts and reports how
+# often the answers agree (needs GEMINI_API_KEY).
+# Usage: python bench_resume_retrieval.py [--top-k 4] [--live]
+
+import argparse
+import os
+
+from config_loader import get_resume_profile, load_config
+from gemini_prompter import ResumeProfile, estimate_tokens, generate_gemini_prompt
+
+# (label, input type, options, resume keys the answer comes from)
+QUESTIONS = [
+    ("Are you willing to relocate?", "radio", ["Yes", "No"], ["relocation"]),
+    ("How many years of experience do you have with Python?", "text", None, ["experience"]),
+    ("How many years of work experience do you have with Amazon Web Services (AWS)?", "text", None, ["experience"]),
+    ("Have you worked with SnapLogic?", "radio", ["Yes", "No"], ["primary_skills"]),
+    ("What is your notice period?", "text", None, ["notice_period"]),
+    ("Current CTC (in LPA)", "text", None, ["current_salary"]),
+    ("Expected salary", "text", None, ["expected_salary"]),
+    ("What is your highest level of education?", "select", ["High School", "Bachelor's Degree", "Master's Degree"],
+     ["education"]),
+    ("Do you hold an AWS certification?", "radio", ["Yes", "No"], ["certification"]),
+    ("Which city do you prefer to work in?", "select", ["Bangalore", "Mumbai", "Hyderabad"], ["location_preference"]),
+    ("Describe your experience with data warehousing", "text", None, ["project_details", "secondary_skills"]),
+    ("Have you built ETL pipelines in Redshift?", "radio", ["Yes", "No"], ["experience", "project_details"]),
+    ("What is your current designation?", "text", None, ["experience"]),
+    ("Are you comfortable working with Maximo?", "radio", ["Yes", "No"], ["secondary_skills"]),
+]
+
+
+def normalize(answer):
+    return " ".join(answer.lower().strip(" .").split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-context vs retrieved-context prompts.")
+    parser.add_argument("--top-k", type=int, default=4)
+    parser.add_argument("--live", action="store_true", help="ask Gemini both prompts and compare answers")
+    args = parser.parse_args()
+
+    resume = get_resume_profile(load_config())
+    full = ResumeProfile(resume)
+    retrieved = ResumeProfile(resume, top_k=args.top_k)
+
+    model = None
+    if args.live:
+        from gemini_helper import answer_question, configure_api, create_model
+        configure_api(os.getenv("GEMINI_API_KEY"))
+        model = create_model("gemini-1.5-flash", "You are a helpful assistant that fills job application fields correctly.")
+
+    full_tokens = retrieved_tokens = covered = agreed = 0
+    print(f"{'question':<58} {'full':>5} {'top-k':>6} {'evidence':>9}" + ("  answers" if model else ""))
+    for label, input_type, options, keys in QUESTIONS:
+        prompts = [generate_gemini_prompt(label, input_type, profile, options) for profile in (full, retrieved)]
+        tokens = [estimate_tokens(prompt) for prompt in prompts]
+        snippets = retrieved.retriever.snippets
+        hits = retrieved.retriever.retrieve(" ".join([label] + (options or [])))
+        found = all(any(snippets[i][0] == key for i in hits) or key in ("job_title", "location") for key in keys)
+        full_tokens += tokens[0]
+        retrieved_tokens += tokens[1]
+        covered += found
+        line = f"{label[:58]:<58} {tokens[0]:>5} {tokens[1]:>6} {'yes' if found else 'MISSED':>9}"
+        if model:
+            answers = [answer_question(model, context="", question=prompt) for prompt in prompts]
+            same = normalize(answers[0]) == normalize(answers[1])
+            agreed += same
+            line += f"  {'same' if same else 'DIFF'}: {answers[0]!r} / {answers[1]!r}"
+        print(line)
+
+    count = len(QUESTIONS)
+    print(f"\nPrompt tokens: {full_tokens / count:.0f} -> {retrieved_tokens / count:.0f} per field "
+          f"({1 - retrieved_tokens / full_tokens:.0%} smaller)")
+    print(f"Answer evidence retrieved: {covered}/{count}")
+    if model:
+        print(f"Answer agreement with full context: {agreed}/{count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# bench_startup.py
+#
+# Time from creating a LinkedInBot to loaded search results, against
+# mock_linkedin: first with an empty profile and no cached driver path (full
+# login), then again with the same profile and the cached path (session
+# restored, login skipped).
+# Usage: python bench_startup.py
+
+import os
+import tempfile
+import time
+
+from answer_cache import AnswerCache
+from fake_gemini import FakeGeminiModel
+from job_tracker import JobTracker
+from linkedin_bot import LinkedInBot
+from llm_client import LLMClient
+from metrics import Metrics
+from mock_linkedin import MockLinkedIn
+from schema_cache import SchemaCache
+
+
+def start_to_search(site, state_dir, llm):
+    started = time.perf_counter()
+    bot = LinkedInBot(
+        headless=True,
+        base_url=site.base_url,
+        profile_dir=os.path.join(state_dir, "profile"),
+        tracker=JobTracker(os.path.join(state_dir, "applied_jobs.json")),
+        answer_cache=AnswerCache(os.path.join(state_dir, "answer_cache.json")),
+        schema_cache=SchemaCache(os.path.join(state_dir, "schema_cache.json")),
+        llm_client=llm,
+        driver_cache_path=os.path.join(state_dir, "chromedriver_path.json"),
+        metrics=Metrics(os.path.join(state_dir, "metrics.jsonl"), prometheus_path=None, summary_path=None),
+    )
+    bot.waits.stats_path = os.path.join(state_dir, "wait_stats.json")
+    driver_ready = time.perf_counter()
+    try:
+        bot.login("mock@example.com", "mock-password")
+        logged_in = time.perf_counter()
+        bot.search_jobs("Data Engineer", "India")
+        searched = time.perf_counter()
+    finally:
+        bot.close()
+        bot.tracker.close()
+    return {
+        "driver_s": round(driver_ready - started, 2),
+        "login_s": round(logged_in - driver_ready, 2),
+        "search_s": round(searched - logged_in, 2),
+        "total_s": round(searched - started, 2),
+    }
+
+
+if __name__ == "__main__":
+    state_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    llm = LLMClient(FakeGeminiModel(latency=0.0), requests_per_minute=6000)
+    try:
+        with MockLinkedIn(job_count=25, latency=0.05) as site:
+            print("cold:", start_to_search(site, state_dir, llm))
+            print("warm:", start_to_search(site, state_dir, llm))
+    finally:
+        llm.shutdown()
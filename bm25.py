@@ -0,0 +1,80 @@
+import math
+import re
+from collections import Counter, defaultdict
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or the to with you your we our this that "
+    "will can do did what which who how".split()
+)
+
+
+def tokenize(text):
+    """Lowercased word tokens minus stopwords. Keeps tokens like c++ and c#."""
+    return [t for t in TOKEN_PATTERN.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    def __init__(self, k1=1.5, b=0.75):
+        """
+        Incremental Okapi BM25 index over token lists, kept as an inverted index so
+        a query only touches the postings of its own terms.
+
+        Args:
+            k1 (float): Term-frequency saturation.
+            b (float): Document length normalisation.
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(list)  # term -> [(doc_id, term frequency)]
+        self.doc_lengths = []
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, tokens):
+        """Indexes one document and returns its id."""
+        doc_id = len(self.doc_lengths)
+        for term, count in Counter(tokens).items():
+            self.postings[term].append((doc_id, count))
+        self.doc_lengths.append(len(tokens))
+        self.total_length += len(tokens)
+        return doc_id
+
+    def idf(self, term):
+        n = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self) - n + 0.5) / (n + 0.5))
+
+    def scores(self, query, doc_ids=None, fixed_idf=None):
+        """
+        Args:
+            query: Token list, or a {term: weight} dict for weighted queries.
+            doc_ids (set): Only score these documents (default: all).
+            fixed_idf (float): Use this IDF for every term instead of the corpus one, for
+                corpora where the query's own terms are in nearly every document.
+
+        Returns:
+            dict: doc_id -> score, for documents sharing at least one query term.
+        """
+        if not len(self):
+            return {}
+        weights = query if isinstance(query, dict) else Counter(query)
+        avg_length = self.total_length / len(self) or 1.0
+        scores = defaultdict(float)
+        for term, weight in weights.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term) if fixed_idf is None else fixed_idf
+            for doc_id, tf in postings:
+                if doc_ids is not None and doc_id not in doc_ids:
+                    continue
+                norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length
+                scores[doc_id] += weight * idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+        return dict(scores)
+
+    def top_k(self, query, k, doc_ids=None):
+        """The `k` best (doc_id, score) pairs, best first."""
+        ranked = sorted(self.scores(query, doc_ids).items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:k]
@@ -0,0 +1,60 @@
+# Parses every rendered job card in one round trip. Each field has a list of
+# selectors tried in order, so a LinkedIn markup change degrades one field
+# instead of dropping the card.
+CARD_SNAPSHOT_SCRIPT = r"""
+const text = el => (el ? (el.innerText || el.textContent || '') : '').replace(/\s+/g, ' ').trim();
+const first = (card, selectors) => {
+    for (const selector of selectors) {
+        const found = card.querySelector(selector);
+        if (found && text(found)) return text(found);
+    }
+    return '';
+};
+
+const TITLE = ['a.job-card-container__link span strong', 'a.job-card-container__link strong',
+               '.job-card-list__title', 'a.job-card-container__link', '.artdeco-entity-lockup__title'];
+const COMPANY = ['div.artdeco-entity-lockup__subtitle span', '.artdeco-entity-lockup__subtitle',
+                 '.job-card-container__primary-description', '.job-card-container__company-name'];
+const LOCATION = ['ul.job-card-container__metadata-wrapper li', '.job-card-container__metadata-item',
+                  '.artdeco-entity-lockup__caption'];
+
+const cards = [];
+let skipped = 0;
+document.querySelectorAll('.job-card-container').forEach(card => {
+    const anchor = card.querySelector('a[href*="/jobs/view/"]') || card.querySelector('a[href]');
+    const link = anchor ? anchor.href : '';
+    const match = link.match(/\/jobs\/view\/(\d+)/);
+    const holder = card.closest('[data-occludable-job-id]');
+    const jobId = (match && match[1]) || card.getAttribute('data-job-id')
+                  || (holder && holder.getAttribute('data-occludable-job-id')) || null;
+    if (!link || !jobId) { skipped += 1; return; }
+
+    const time = card.querySelector('time');
+    const body = text(card);
+    const applicants = body.match(/(\d[\d,]*)\s+applicants?/i);
+    cards.push({
+        title: first(card, TITLE) || (anchor && anchor.getAttribute('aria-label')) || '',
+        company: first(card, COMPANY),
+        location: first(card, LOCATION),
+        link: link,
+        job_id: jobId,
+        easy_apply: /easy apply/i.test(body),
+        posted: time ? (text(time) || time.getAttribute('datetime') || '') : '',
+        applicants: applicants ? parseInt(applicants[1].replace(/,/g, ''), 10) : null
+    });
+});
+return { cards: cards, skipped: skipped };
+"""
+
+
+def extract_job_cards(driver):
+    """
+    Reads every rendered job card in one execute_script call.
+
+    Returns:
+        tuple: (cards, skipped). Each card has title, company, location, link,
+        job_id, easy_apply, posted and applicants; `skipped` counts cards with
+        no usable link or job id.
+    """
+    result = driver.execute_script(CARD_SNAPSHOT_SCRIPT) or {}
+    return result.get("cards", []), result.get("skipped", 0)
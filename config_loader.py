@@ -14,3 +14,13 @@ def get_resume_context(config):
     if isinstance(context, dict):
         return json.dumps(context, indent=2)
     return context
+
+# Runtime settings for the bot itself; everything else in config.json is resume context
+BOT_SETTINGS_KEY = "bot"
+
+def get_bot_settings(config):
+    return config.get(BOT_SETTINGS_KEY, {})
+
+def get_resume_profile(config):
+    """The config minus bot settings, so they never end up in prompts."""
+    return {k: v for k, v in config.items() if k != BOT_SETTINGS_KEY}
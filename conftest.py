@@ -0,0 +1,2 @@
+# test_gemini_prompt.py is a manual script against the live Gemini API, not a test module
+collect_ignore = ["test_gemini_prompt.py"]
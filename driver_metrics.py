@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from collections import Counter
+
+try:
+    import psutil
+except ImportError:  # optional; /proc is read directly on Linux without it
+    psutil = None
+
+
+class CommandCounter:
+    def __init__(self, driver):
+        """
+        Counts WebDriver commands (HTTP round trips to chromedriver) issued through `driver`.
+
+        Every Selenium call funnels through WebDriver.execute, so wrapping it on the
+        instance catches find_element, get_attribute, execute_script, clicks, etc.
+        """
+        self.driver = driver
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        self._original_execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            with self.lock:
+                self.counts[driver_command] += 1
+            return self._original_execute(driver_command, params)
+
+        driver.execute = counting_execute
+
+    @property
+    def total(self):
+        with self.lock:
+            return sum(self.counts.values())
+
+    def reset(self):
+        with self.lock:
+            self.counts.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+    def detach(self):
+        self.driver.execute = self._original_execute
+
+
+def measure(driver, counter, fn, repeats):
+    """
+    Runs fn(driver) `repeats` times and returns (last result, ms per run, WebDriver
+    commands per run as counted by `counter`).
+    """
+    counter.reset()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn(driver)
+    elapsed_ms = (time.perf_counter() - start) / repeats * 1e3
+    return result, elapsed_ms, counter.total / repeats
+
+
+def _proc_children(pid):
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # The command name may contain spaces; the parent pid follows the closing parenthesis
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    found, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def _proc_rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def browser_rss_mb(driver):
+    """
+    Resident memory of every process under the driver's chromedriver (the browser,
+    its renderers and helpers), in MB. Uses psutil when installed, else /proc.
+    Returns None when neither is available.
+    """
+    root = driver.service.process.pid
+    if psutil is not None:
+        total = 0
+        for process in psutil.Process(root).children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return round(total / 2 ** 20, 1)
+    if not os.path.isdir("/proc"):
+        return None
+    return round(sum(_proc_rss_bytes(pid) for pid in _proc_children(root)) / 2 ** 20, 1)
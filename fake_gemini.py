@@ -0,0 +1,71 @@
+import json
+import random
+import re
+import threading
+import time
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeQuotaError(Exception):
+    """Stands in for google.api_core.exceptions.ResourceExhausted (HTTP 429)."""
+
+
+class FakeGeminiModel:
+    def __init__(self, latency=0.5, jitter=0.1, failure_rate=0.0, requests_per_minute=None, seed=None):
+        """
+        Local stand-in for genai.GenerativeModel, for offline tests and benchmarks.
+
+        Args:
+            latency (float): Mean seconds per generate_content call.
+            jitter (float): Uniform +/- noise added to the latency.
+            failure_rate (float): Probability that a call raises FakeQuotaError.
+            requests_per_minute (float): If set, calls beyond this quota raise FakeQuotaError.
+            seed (int): Seed for reproducible failures.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.requests_per_minute = requests_per_minute
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.call_times = []
+        self.calls = 0
+
+    def _check_quota(self):
+        with self.lock:
+            self.calls += 1
+            now = time.monotonic()
+            if self.requests_per_minute:
+                self.call_times = [t for t in self.call_times if now - t < 60]
+                if len(self.call_times) >= self.requests_per_minute:
+                    raise FakeQuotaError("429 Resource has been exhausted (e.g. check quota).")
+                self.call_times.append(now)
+            if self.random.random() < self.failure_rate:
+                raise FakeQuotaError("429 Resource has been exhausted (e.g. check quota).")
+            return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+
+    def generate_content(self, prompt, generation_config=None):
+        delay = self._check_quota()
+        time.sleep(delay)
+        return FakeResponse(self.answer(prompt))
+
+    def answer(self, prompt):
+        # Batched prompts list fields as: - id "<id>": Label: ... | Input Type: ... | Options: a, b (...)
+        field_ids = re.findall(r'^- id "([^"]+)": (.*)$', prompt, re.MULTILINE)
+        if field_ids:
+            return json.dumps({field_id: self._answer_line(line) for field_id, line in field_ids})
+        options = re.search(r"^- Options: (.*)$", prompt, re.MULTILINE)
+        return self._answer_line(f"Options: {options.group(1)}" if options else prompt)
+
+    @staticmethod
+    def _answer_line(line):
+        options = re.search(r"Options: ([^(|\n]*)", line)
+        if options:
+            return options.group(1).split(",")[0].strip()
+        if re.search(r"decimal|number|numeric|years", line, re.IGNORECASE):
+            return "3"
+        return "Yes"
@@ -0,0 +1,203 @@
+REQUIRED_FIELD_SELECTOR = (
+    "input[required], textarea[required], select[required], "
+    "fieldset[data-test-form-builder-radio-button-form-component='true']"
+)
+
+# Helpers shared by the scripts below and form_filler's: element text, the inline error
+# message a field shows, and setting a value the way React's value tracker notices.
+FIELD_JS = r"""
+const text = el => (el ? (el.innerText || el.textContent || '') : '').trim();
+
+const feedbackFor = el => {
+    const ids = (el.getAttribute('aria-describedby') || '').split(/\s+/).filter(Boolean);
+    for (const id of ids) {
+        const container = document.getElementById(id);
+        const message = container && container.querySelector('.artdeco-inline-feedback__message');
+        if (message && text(message)) return text(message);
+    }
+    const own = el.querySelector && el.querySelector('.artdeco-inline-feedback__message');
+    const container = el.closest('.fb-dash-form-element');
+    return text(own) || text(container && container.querySelector('.artdeco-inline-feedback__message'));
+};
+
+const fire = (el, type) => el.dispatchEvent(new Event(type, { bubbles: true }));
+
+const setValue = (el, value) => {
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+                : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    for (const type of ['input', 'change', 'blur']) fire(el, type);
+};
+"""
+
+# Collects every required field of the modal in a single round trip. Each entry
+# mirrors what check_required_fields used to read one WebDriver call at a time.
+FIELD_SNAPSHOT_SCRIPT = FIELD_JS + r"""
+const root = document.querySelector(arguments[0]) || document;
+const selector = arguments[1];
+
+// Helper text the field points at (e.g. "Enter a whole number between 0 and 99"), read without typing anything
+const describedText = el => (el.getAttribute('aria-describedby') || '').split(/\s+/).filter(Boolean)
+    .map(id => text(document.getElementById(id))).filter(Boolean).join(' ');
+
+// Everything the markup says about valid values. LinkedIn marks numeric inputs with an id ending in "numeric".
+const constraintsOf = el => ({
+    type: (el.getAttribute('type') || el.tagName).toLowerCase(),
+    pattern: el.getAttribute('pattern') || '',
+    min: el.getAttribute('min') || '',
+    max: el.getAttribute('max') || '',
+    step: el.getAttribute('step') || '',
+    minLength: el.getAttribute('minlength') || '',
+    maxLength: el.getAttribute('maxlength') || '',
+    inputMode: el.getAttribute('inputmode') || '',
+    numeric: /numeric/i.test(el.id || ''),
+    help: describedText(el)
+});
+
+return Array.from(root.querySelectorAll(selector)).map(el => {
+    const tag = el.tagName.toLowerCase();
+    if (tag === 'fieldset') {
+        const radios = Array.from(el.querySelectorAll("input[type='radio']"));
+        const checked = radios.find(r => r.checked);
+        return {
+            element: el,
+            tag: tag,
+            type: 'radio',
+            label: text(el.querySelector('legend')) || 'Radio field question not found',
+            value: checked ? checked.value : '',
+            required: true,
+            options: radios.map(r => r.value),
+            filled: Boolean(checked),
+            error: false,
+            validation: feedbackFor(el),
+            constraints: {}
+        };
+    }
+
+    let label = el.getAttribute('aria-label') || el.getAttribute('name') || el.getAttribute('placeholder');
+    if (!label) {
+        let sibling = el.previousElementSibling;
+        while (sibling && sibling.tagName !== 'LABEL') sibling = sibling.previousElementSibling;
+        label = text(sibling);
+    }
+    if (!label && el.id) label = text(document.querySelector('label[for="' + CSS.escape(el.id) + '"]'));
+
+    const value = el.value || '';
+    const error = el.classList.contains('fb-dash-form-element__error-field');
+    return {
+        element: el,
+        tag: tag,
+        type: el.type || 'text',
+        label: (label || 'Unknown field').trim(),
+        value: value,
+        required: el.required,
+        options: tag === 'select' ? Array.from(el.options).map(o => o.text.trim()) : [],
+        filled: tag === 'select' ? el.selectedIndex > 0 : value.trim() !== '',
+        error: error,
+        validation: error ? feedbackFor(el) : '',
+        constraints: error ? {} : constraintsOf(el)
+    };
+});
+"""
+
+
+def snapshot_fields(driver, root_selector=".jobs-easy-apply-modal", selector=REQUIRED_FIELD_SELECTOR):
+    """
+    Reads every required field under `root_selector` in one execute_script call.
+
+    Returns:
+        list: One dict per field with element, tag, type, label, value, required,
+        options, filled, error, validation and constraints keys. `element` is a
+        WebElement; `constraints` holds the validation attributes (see constraint_hint).
+    """
+    return driver.execute_script(FIELD_SNAPSHOT_SCRIPT, root_selector, selector) or []
+
+
+NUMERIC_TYPES = ("number", "range")
+NUMERIC_INPUT_MODES = ("numeric", "decimal")
+TYPE_HINTS = {
+    "email": "Enter a valid email address",
+    "tel": "Enter a valid phone number",
+    "url": "Enter a valid URL",
+    "date": "Enter a date as YYYY-MM-DD",
+}
+
+
+def constraint_hint(constraints):
+    """
+    A validation hint derived from a field's markup alone, worded like LinkedIn's
+    own messages (which answer_rules.coerce_numeric understands). Empty when the
+    markup says nothing beyond "required".
+    """
+    if not constraints:
+        return ""
+    hints = []
+    numeric = (constraints["type"] in NUMERIC_TYPES or constraints["inputMode"] in NUMERIC_INPUT_MODES
+               or constraints["numeric"])
+    if numeric:
+        whole = ((constraints["type"] in NUMERIC_TYPES and constraints["step"] in ("", "1"))
+                 or constraints["inputMode"] == "numeric")
+        kind = "whole" if whole else "decimal"
+        low, high = constraints["min"], constraints["max"]
+        if low and high:
+            hints.append(f"Enter a {kind} number between {low} and {high}")
+        elif low:
+            hints.append(f"Enter a {kind} number of at least {low}")
+        elif high:
+            hints.append(f"Enter a {kind} number no more than {high}")
+        else:
+            # No bounds in the markup; don't invent one (0 years is a valid answer)
+            hints.append(f"Enter a {kind} number")
+    elif constraints["type"] in TYPE_HINTS:
+        hints.append(TYPE_HINTS[constraints["type"]])
+    if constraints["pattern"]:
+        hints.append(f"Must match the pattern {constraints['pattern']}")
+    if constraints["minLength"] and constraints["maxLength"]:
+        hints.append(f"Between {constraints['minLength']} and {constraints['maxLength']} characters")
+    elif constraints["maxLength"]:
+        hints.append(f"At most {constraints['maxLength']} characters")
+    elif constraints["minLength"]:
+        hints.append(f"At least {constraints['minLength']} characters")
+    if constraints["help"]:
+        hints.append(constraints["help"])
+    return ". ".join(hints)
+
+
+# Last resort for fields that rejected an answer without saying why: type a probe
+# character into all of them at once, so the form's own validation shows its messages.
+PROBE_SCRIPT = FIELD_JS + r"""
+return arguments[0].map(el => {
+    const original = el.value;
+    setValue(el, arguments[1]);
+    return original;
+});
+"""
+
+# Reads the messages the probes triggered, then puts every field back as it was.
+PROBE_RESTORE_SCRIPT = FIELD_JS + r"""
+return arguments[0].map((el, i) => {
+    const message = feedbackFor(el) || el.validationMessage || '';
+    setValue(el, arguments[1][i]);
+    return message;
+});
+"""
+
+
+def probe_validation(driver, elements, settle, probe="a"):
+    """
+    Types `probe` into every element in one script, calls `settle()` once (e.g. a
+    wait for the error count to stop changing), then reads each element's message
+    and restores its original value in a second script.
+
+    Returns:
+        list: The validation message shown for each element ("" if none).
+    """
+    if not elements:
+        return []
+    originals = driver.execute_script(PROBE_SCRIPT, elements, probe)
+    try:
+        settle()
+    finally:
+        messages = driver.execute_script(PROBE_RESTORE_SCRIPT, elements, originals)
+    return messages
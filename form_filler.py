@@ -0,0 +1,76 @@
+from field_extractor import FIELD_JS
+
+# Applies every answer of a step in one round trip. Values are set with FIELD_JS's
+# setValue (native prototype setters, so React's value tracker notices the change,
+# then the input/change/blur events the Easy Apply form listens for).
+BULK_FILL_SCRIPT = FIELD_JS + r"""
+const fields = arguments[0];
+
+return fields.map(field => {
+    const el = field.element;
+    const answer = String(field.value);
+    const wanted = answer.trim().toLowerCase();
+    try {
+        if (field.tag === 'select') {
+            const index = Array.from(el.options).findIndex(o => o.text.trim().toLowerCase().includes(wanted));
+            if (!wanted || index < 0) return { status: 'no_match' };
+            setValue(el, el.options[index].value);
+            if (el.selectedIndex !== index) {
+                // Options sharing a value: the setter picked the first one
+                el.selectedIndex = index;
+                fire(el, 'change');
+            }
+            return { status: 'set', expected: index, text: el.options[index].text.trim() };
+        }
+        if (field.tag === 'fieldset') {
+            const radios = Array.from(el.querySelectorAll("input[type='radio']"));
+            const index = radios.findIndex(r => (r.value || '').toLowerCase().includes(wanted));
+            if (!wanted || index < 0) return { status: 'no_match' };
+            radios[index].click();
+            fire(radios[index], 'change');
+            return { status: 'set', expected: index, text: radios[index].value };
+        }
+        el.focus();
+        setValue(el, answer);
+        return { status: 'set', expected: answer, text: answer };
+    } catch (e) {
+        return { status: 'error', error: String(e) };
+    }
+});
+"""
+
+# Reads back what the form actually holds after React has processed the events.
+READBACK_SCRIPT = r"""
+return arguments[0].map(field => {
+    const el = field.element;
+    if (field.tag === 'select') return el.selectedIndex;
+    if (field.tag === 'fieldset') {
+        return Array.from(el.querySelectorAll("input[type='radio']")).findIndex(r => r.checked);
+    }
+    return el.value;
+});
+"""
+
+
+def bulk_fill(driver, fields):
+    """
+    Fills every field in one script and verifies the values with one readback.
+
+    Args:
+        driver: The WebDriver instance.
+        fields (list): Dicts with "element", "tag" and "value" (the answer to apply).
+
+    Returns:
+        list: One result per field with "status" set to "ok", "no_match" (no option
+        matched the answer), "rejected" (the value didn't stick) or "error", plus
+        "text" for the value/option that was applied.
+    """
+    if not fields:
+        return []
+    payload = [{"element": f["element"], "tag": f["tag"], "value": f["value"]} for f in fields]
+    results = driver.execute_script(BULK_FILL_SCRIPT, payload)
+    actual = driver.execute_script(READBACK_SCRIPT, payload)
+    for result, value in zip(results, actual):
+        if result["status"] == "set":
+            result["status"] = "ok" if value == result["expected"] else "rejected"
+    return results
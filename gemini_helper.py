@@ -1,4 +1,6 @@
 import os
+import re
+import json
 import google.generativeai as genai
 from dotenv import load_dotenv
 
@@ -47,6 +49,61 @@ def answer_question(model, context, question):
     )
     return response.text.strip()
 
+def parse_batch_answers(text, field_ids):
+    """
+    Extracts a field id -> answer mapping from a batched model response.
+
+    Args:
+        text (str): Raw model output, optionally wrapped in a ```json fence.
+        field_ids (list): The ids that were asked for.
+
+    Returns:
+        dict: Answers for the ids that parsed to a non-empty value. Missing ids
+        should be retried individually.
+    """
+    cleaned = re.sub(r"^```(?:json)?|```$", "", (text or "").strip(), flags=re.MULTILINE).strip()
+    try:
+        data = json.loads(cleaned)
+    except json.JSONDecodeError:
+        match = re.search(r"\{.*\}", cleaned, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(data, dict):
+        return {}
+
+    answers = {}
+    for field_id in field_ids:
+        value = data.get(str(field_id))
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool) and str(value).strip():
+            answers[field_id] = str(value).strip()
+    return answers
+
+def answer_questions_batch(model, prompt, field_ids):
+    """
+    Answers every field of a step in one request.
+
+    Args:
+        model (genai.GenerativeModel): The generative model instance.
+        prompt (str): A prompt built by gemini_prompter.generate_batch_prompt.
+        field_ids (list): The ids referenced in the prompt.
+
+    Returns:
+        dict: Parsed answers keyed by field id (see parse_batch_answers).
+    """
+    response = model.generate_content(
+        prompt,
+        generation_config=genai.GenerationConfig(
+            max_output_tokens=1000,
+            temperature=0.1,
+            response_mime_type="application/json",
+        )
+    )
+    return parse_batch_answers(response.text, field_ids)
+
 if __name__ == "__main__":
     # Test the Gemini integration
     configure_api(os.getenv("GEMINI_API_KEY"))
@@ -1,52 +1,138 @@
-def generate_gemini_prompt(field_label: str, input_type: str, resume_context: dict, options: list = None, validation_hint: str = "") -> str:
+import json
+import math
+
+from answer_cache import context_hash
+from resume_retrieval import ResumeRetriever
+
+PROMPT_INTRO = "You are helping a candidate complete a LinkedIn Easy Apply form.\n\nCandidate Details:\n"
+SINGLE_FIELD_TRAILER = "\nRespond only with the value to enter. Do not include explanation or punctuation."
+BATCH_TRAILER = ("\n\nRespond only with a JSON object mapping every field id to the value to enter, e.g. {example}."
+                 "\nValues must be plain strings without explanation or punctuation.")
+
+
+def _format_value(key, value):
+    if isinstance(value, list):
+        return f"{key.capitalize()}: {', '.join(str(v) for v in value)}"
+    elif isinstance(value, dict):
+        inner = "; ".join(f"{k.capitalize()}: {v}" for k, v in value.items())
+        return f"{key.capitalize()} - {inner}"
+    elif isinstance(value, str):
+        return f"{key.capitalize()}: {value}"
+    else:
+        return f"{key.capitalize()}: {value}"
+
+
+def build_resume_summary(resume_context: dict) -> str:
     """
-    Builds a Gemini prompt for a field using dynamically parsed resume context.
+    Flattens the structured resume context into one line per entry.
     """
-
-    def format_value(key, value):
-        if isinstance(value, list):
-            return f"{key.capitalize()}: {', '.join(str(v) for v in value)}"
-        elif isinstance(value, dict):
-            inner = "; ".join(f"{k.capitalize()}: {v}" for k, v in value.items())
-            return f"{key.capitalize()} - {inner}"
-        elif isinstance(value, str):
-            return f"{key.capitalize()}: {value}"
+    summary = []
+    for key, value in resume_context.items():
+        if isinstance(value, list) and all(isinstance(i, dict) for i in value):
+            # list of dicts (like experience)
+            for idx, entry in enumerate(value, 1):
+                line = f"{key.capitalize()} #{idx}: " + "; ".join(
+                    f"{k.capitalize()}: {v}" for k, v in entry.items()
+                )
+                summary.append(line)
         else:
-            return f"{key.capitalize()}: {value}"
-
-    # Build summary lines recursively for structured resume context
-    def build_summary(context):
-        summary = []
-        for key, value in context.items():
-            if isinstance(value, list) and all(isinstance(i, dict) for i in value):
-                # list of dicts (like experience)
-                for idx, entry in enumerate(value, 1):
-                    line = f"{key.capitalize()} #{idx}: " + "; ".join(
-                        f"{k.capitalize()}: {v}" for k, v in entry.items()
-                    )
-                    summary.append(line)
-            else:
-                summary.append(format_value(key, value))
-        return summary
-
-    resume_summary = "\n".join(build_summary(resume_context))
-
-    prompt = f"""
-You are helping a candidate complete a LinkedIn Easy Apply form.
-
-Candidate Details:
-{resume_summary}
-
-Field to Fill:
-- Label: {field_label}
-- Input Type: {input_type}
-"""
+            summary.append(_format_value(key, value))
+    return "\n".join(summary)
+
+
+def estimate_tokens(text):
+    """Rough Gemini token count (about four characters per token); good enough for budgeting prompts."""
+    return math.ceil(len(text) / 4)
+
+
+class ResumeProfile:
+    """
+    The resume context compiled once per run: its rendered summary, token
+    estimate, content hash and the fixed head of every prompt. Immutable, so
+    it can be shared between worker threads.
+
+    With `top_k`, prompts carry only the resume snippets retrieved for their
+    fields (see ResumeRetriever) instead of the full summary.
+    """
+    __slots__ = ("context", "summary", "token_count", "content_hash", "single_field_head", "batch_head", "retriever")
+
+    def __init__(self, resume_context, top_k=None):
+        summary = build_resume_summary(resume_context) if isinstance(resume_context, dict) else str(resume_context or "")
+        head = PROMPT_INTRO + summary
+        for name, value in (
+            ("context", resume_context),
+            ("summary", summary),
+            ("token_count", estimate_tokens(summary)),
+            ("content_hash", context_hash(resume_context)),
+            ("single_field_head", head + "\n\nField to Fill:\n"),
+            ("batch_head", head + "\n\nFields to Fill:\n"),
+            ("retriever", ResumeRetriever(resume_context, top_k) if top_k and isinstance(resume_context, dict)
+             else None),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResumeProfile is immutable")
+
+    def head_for(self, queries, batch=False):
+        """Prompt head for fields described by `queries`: retrieved snippets if enabled, else the full summary."""
+        context = self.retriever.context_for(queries) if self.retriever else None
+        if context is None:
+            return self.batch_head if batch else self.single_field_head
+        return PROMPT_INTRO + context + ("\n\nFields to Fill:\n" if batch else "\n\nField to Fill:\n")
+
+    def __repr__(self):
+        return f"ResumeProfile(hash={self.content_hash}, tokens~{self.token_count})"
+
+
+def compile_profile(resume_context, top_k=None):
+    """Returns `resume_context` as a ResumeProfile, compiling it if it isn't one already."""
+    if isinstance(resume_context, ResumeProfile):
+        return resume_context
+    return ResumeProfile(resume_context, top_k)
+
+
+def field_query(label, options=None):
+    """Retrieval query text for a field: its label plus any options."""
+    return " ".join([label] + list(options or []))
+
+
+def generate_gemini_prompt(field_label: str, input_type: str, resume_context, options: list = None, validation_hint: str = "") -> str:
+    """
+    Builds a Gemini prompt for a field. Pass a ResumeProfile to reuse its
+    precompiled summary; a plain resume dict is compiled on every call.
+    """
+    head = compile_profile(resume_context).head_for([field_query(field_label, options)])
+    parts = [head, f"- Label: {field_label}\n- Input Type: {input_type}\n"]
     if validation_hint:
-        prompt += f"- Validation Requirement: {validation_hint}\n"
+        parts.append(f"- Validation Requirement: {validation_hint}\n")
 
     if options:
-        prompt += f"- Options: {', '.join(options)}\n"
-        prompt += "Select the most appropriate option based on the resume."
+        parts.append(f"- Options: {', '.join(options)}\n")
+        parts.append("Select the most appropriate option based on the resume.")
+
+    parts.append(SINGLE_FIELD_TRAILER)
+    return "".join(parts)
+
+
+def generate_batch_prompt(fields: list, resume_context) -> str:
+    """
+    Builds a single Gemini prompt covering every field of a form step.
+
+    Each entry of `fields` is a dict with "id", "label", "input_type" and optionally
+    "options" and "validation_hint". The model is asked for a JSON object mapping
+    each id to the value to enter. Pass a ResumeProfile to reuse its precompiled summary.
+    """
+    field_lines = []
+    for field in fields:
+        line = f'- id "{field["id"]}": Label: {field["label"]} | Input Type: {field["input_type"]}'
+        if field.get("validation_hint"):
+            line += f" | Validation Requirement: {field['validation_hint']}"
+        if field.get("options"):
+            line += f" | Options: {', '.join(field['options'])} (answer with exactly one option)"
+        field_lines.append(line)
 
-    prompt += "\nRespond only with the value to enter. Do not include explanation or punctuation."
-    return prompt.strip()
+    example = json.dumps({field["id"]: "..." for field in fields[:2]})
+    head = compile_profile(resume_context).head_for(
+        [field_query(field["label"], field.get("options")) for field in fields], batch=True)
+    return head + "\n".join(field_lines) + BATCH_TRAILER.format(example=example)
@@ -0,0 +1,104 @@
+from bm25 import BM25Index, tokenize
+
+# How much a match on each part of the resume counts towards a job's score
+QUERY_WEIGHTS = {
+    "job_title": 2.0,
+    "primary_skills": 1.0,
+    "tech_stack": 1.0,
+    "location_preference": 0.3,
+    "secondary_skills": 0.5,
+}
+
+
+def build_resume_query(resume_context):
+    """{term: weight} query from the resume fields in QUERY_WEIGHTS. A term keeps its highest weight."""
+    if not isinstance(resume_context, dict):
+        return {term: 1.0 for term in tokenize(str(resume_context or ""))}
+    sources = {
+        "job_title": [resume_context.get("job_title", "")],
+        "primary_skills": resume_context.get("primary_skills", []),
+        "secondary_skills": resume_context.get("secondary_skills", []),
+        "location_preference": resume_context.get("location_preference", []),
+        "tech_stack": [tech for job in resume_context.get("experience", []) for tech in job.get("tech_stack", [])],
+    }
+    query = {}
+    for source, values in sources.items():
+        if isinstance(values, str):
+            values = [values]
+        for term in tokenize(" ".join(values)):
+            query[term] = max(query.get(term, 0.0), QUERY_WEIGHTS[source])
+    return query
+
+
+def card_tokens(card):
+    # The title is counted twice: it says far more about fit than the company name
+    title = card.get("title", "")
+    return tokenize(" ".join([title, title, card.get("company", ""), card.get("location", ""),
+                              card.get("description", "")]))
+
+
+class JobRanker:
+    def __init__(self, resume_context, min_score=0.0, window=5):
+        """
+        Scores job cards against the resume with BM25 and hands them out best first.
+
+        The cards come from a search for the resume's own title, so its terms are in
+        nearly every card and a corpus IDF would all but zero them. Every term gets
+        the same IDF instead: a card's score is about the summed QUERY_WEIGHTS of the
+        resume terms it mentions (a title match counts twice), with BM25's saturation
+        and length normalisation.
+
+        Args:
+            resume_context (dict): Resume profile; the query is built from it once.
+            min_score (float): Cards scoring below this are skipped. 0 keeps everything.
+            window (int): Cards buffered and ranked together when ranking a stream. Kept
+                small so applying starts within a few cards of the first result.
+        """
+        self.query = build_resume_query(resume_context)
+        self.min_score = min_score
+        self.window = max(1, window)
+        self.skipped = []
+
+    def score(self, cards):
+        """Sets card["relevance"] on each card and returns the cards best first."""
+        # With a fixed IDF the index only supplies term frequencies and card lengths, so a
+        # fresh one per call keeps the cost and memory down to the cards being scored
+        index = BM25Index()
+        doc_ids = {index.add(card_tokens(card)): card for card in cards}
+        scores = index.scores(self.query, fixed_idf=1.0)
+        for doc_id, card in doc_ids.items():
+            card["relevance"] = round(scores.get(doc_id, 0.0), 3)
+        return sorted(cards, key=lambda card: -card["relevance"])
+
+    def rank(self, cards):
+        """Cards at or above min_score, best first. The rest are added to self.skipped."""
+        ranked = []
+        for card in self.score(list(cards)):
+            if card["relevance"] >= self.min_score:
+                ranked.append(card)
+            else:
+                self.skipped.append(card)
+        return ranked
+
+    def iter_ranked(self, cards, max_jobs=None):
+        """
+        Ranks a card stream one window at a time, so applying can start before the
+        whole search has been read, and stops after `max_jobs` cards pass the cutoff.
+        """
+        yielded = 0
+        buffer = []
+        cards = iter(cards)
+        while True:
+            card = next(cards, None)
+            if card is not None:
+                buffer.append(card)
+                if len(buffer) < self.window:
+                    continue
+            for ranked in self.rank(buffer):
+                yield ranked
+                yielded += 1
+                if max_jobs is not None and yielded >= max_jobs:
+                    return
+            buffer = []
+            if card is None:
+                return
@@ -1,33 +1,271 @@
 import json
 import os
+import sqlite3
+import threading
+import time
 from datetime import datetime
 
+# Claims older than this are assumed to belong to a crashed worker
+CLAIM_TTL_SECONDS = 30 * 60
+
+
+class JsonlTrackerBackend:
+    """Append-only JSON-lines log. One record per line, newest wins."""
+
+    suffix = ".jsonl"
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+
+    def load(self):
+        """
+        Reads every record from the log.
+
+        Returns:
+            tuple: (records keyed by job_id, True if the log needs compaction)
+        """
+        records = {}
+        needs_compaction = False
+        if not os.path.exists(self.path):
+            return records, needs_compaction
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash mid-append
+                    needs_compaction = True
+                    continue
+                job_id = record.get("job_id")
+                if job_id in records:
+                    needs_compaction = True
+                records[job_id] = record
+        return records, needs_compaction
+
+    def append(self, record):
+        if self._handle is None:
+            self._handle = open(self.path, "a", encoding="utf-8")
+        self._handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._handle.flush()
+
+    def write_all(self, records):
+        """Atomically rewrites the log with exactly one line per record."""
+        self.close()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def compact(self, records):
+        self.write_all(records)
+
+    def claim(self, job_id, worker):
+        # A plain file has no cross-process locking; JobTracker's lock covers threads
+        return True
+
+    def release(self, job_id):
+        pass
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class SqliteTrackerBackend:
+    """SQLite store with job_id as primary key."""
+
+    suffix = ".db"
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS applied_jobs ("
+            "job_id TEXT PRIMARY KEY, job_title TEXT, company TEXT, applied_at TEXT)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_claims (job_id TEXT PRIMARY KEY, worker TEXT, claimed_at REAL)"
+        )
+        self.conn.commit()
+
+    def load(self):
+        rows = self.conn.execute("SELECT job_id, job_title, company, applied_at FROM applied_jobs")
+        records = {
+            row[0]: {"job_id": row[0], "job_title": row[1], "company": row[2], "applied_at": row[3]}
+            for row in rows
+        }
+        needs_compaction = self.conn.execute("PRAGMA freelist_count").fetchone()[0] > 0
+        return records, needs_compaction
+
+    def append(self, record):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO applied_jobs (job_id, job_title, company, applied_at) VALUES (?, ?, ?, ?)",
+            (record.get("job_id"), record.get("job_title"), record.get("company"), record.get("applied_at")),
+        )
+        self.conn.commit()
+
+    def write_all(self, records):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO applied_jobs (job_id, job_title, company, applied_at) VALUES (?, ?, ?, ?)",
+            [(r.get("job_id"), r.get("job_title"), r.get("company"), r.get("applied_at")) for r in records],
+        )
+        self.conn.commit()
+
+    def compact(self, records):
+        self.conn.execute("VACUUM")
+
+    def claim(self, job_id, worker):
+        """Atomically reserves job_id across every process sharing the database."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM job_claims WHERE claimed_at < ?", (time.time() - CLAIM_TTL_SECONDS,))
+            if self.conn.execute("SELECT 1 FROM applied_jobs WHERE job_id = ?", (job_id,)).fetchone():
+                claimed = False
+            else:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO job_claims (job_id, worker, claimed_at) VALUES (?, ?, ?)",
+                    (job_id, worker, time.time()),
+                )
+                claimed = cursor.rowcount == 1
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return claimed
+
+    def release(self, job_id):
+        self.conn.execute("DELETE FROM job_claims WHERE job_id = ?", (job_id,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+BACKENDS = {
+    "jsonl": JsonlTrackerBackend,
+    "sqlite": SqliteTrackerBackend,
+}
+
+
 class JobTracker:
-    def __init__(self, path="applied_jobs.json"):
+    def __init__(self, path="applied_jobs.json", backend="jsonl"):
+        """
+        Tracks applied jobs with an in-memory index on job_id.
+
+        Args:
+            path (str): Legacy JSON file. The backend store lives next to it with the
+                backend's suffix, and the legacy file is imported into it on first run,
+                as is the other backend's store after switching backends.
+            backend (str): "jsonl" (append-only log) or "sqlite". Both are safe to share
+                between threads; use "sqlite" when several processes share the tracker.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown tracker backend '{backend}'. Choose from: {', '.join(BACKENDS)}")
         self.path = path
-        self.jobs = self._load_applied_jobs()
+        backend_cls = BACKENDS[backend]
+        self.store_path = os.path.splitext(path)[0] + backend_cls.suffix
+        self.backend = backend_cls(self.store_path)
+        self._lock = threading.Lock()
+        self._claims = set()
+        self._index = self._load_applied_jobs()
+
+    @property
+    def jobs(self):
+        return list(self._index.values())
 
     def _load_applied_jobs(self):
-        if not os.path.exists(self.path):
-            return []
+        index, needs_compaction = self.backend.load()
+        migrated = self._migrate_legacy_file(index)
+        migrated = self._migrate_other_backends(index) or migrated
+        if needs_compaction and not migrated:
+            self.backend.compact(index.values())
+        return index
+
+    def _migrate_legacy_file(self, index):
+        """Imports the old indent=2 JSON array once, then renames it out of the way."""
+        if not os.path.exists(self.path) or self.path == self.store_path:
+            return False
         with open(self.path, "r", encoding="utf-8") as f:
             try:
-                return json.load(f)
+                legacy_jobs = json.load(f)
             except json.JSONDecodeError:
-                return []
+                legacy_jobs = []
+        for job in legacy_jobs:
+            index.setdefault(job.get("job_id"), job)
+        self.backend.write_all(index.values())
+        os.replace(self.path, self.path + ".migrated")
+        return True
+
+    def _migrate_other_backends(self, index):
+        """
+        Imports the store another backend left next to ours (e.g. after switching
+        tracker_backend from jsonl to sqlite), then renames it out of the way so there
+        is one canonical history.
+        """
+        migrated = False
+        for backend_cls in BACKENDS.values():
+            other_path = os.path.splitext(self.path)[0] + backend_cls.suffix
+            if other_path == self.store_path or not os.path.exists(other_path):
+                continue
+            other = backend_cls(other_path)
+            try:
+                records, _ = other.load()
+            finally:
+                other.close()
+            for job_id, record in records.items():
+                index.setdefault(job_id, record)
+            self.backend.write_all(index.values())
+            os.replace(other_path, other_path + ".migrated")
+            migrated = True
+        return migrated
 
     def has_applied(self, job_id):
-        return any(job.get("job_id") == job_id for job in self.jobs)
+        return job_id in self._index
+
+    def claim(self, job_id, worker=""):
+        """
+        Reserves a job for one worker so parallel workers never apply to it twice.
+
+        Returns:
+            bool: False if the job was already applied to or is claimed by another worker.
+        """
+        with self._lock:
+            if job_id in self._index or job_id in self._claims:
+                return False
+            if not self.backend.claim(job_id, worker):
+                return False
+            self._claims.add(job_id)
+            return True
+
+    def release(self, job_id):
+        """Gives up a claim without marking the job as applied."""
+        with self._lock:
+            if job_id in self._claims:
+                self._claims.discard(job_id)
+                self.backend.release(job_id)
 
     def mark_as_applied(self, job_id, job_title, company):
-        self.jobs.append({
+        record = {
             "job_id": job_id,
             "job_title": job_title,
             "company": company,
             "applied_at": datetime.utcnow().isoformat()
-        })
-        self._save()
+        }
+        with self._lock:
+            self._index[job_id] = record
+            self.backend.append(record)
+            if job_id in self._claims:
+                self._claims.discard(job_id)
+                self.backend.release(job_id)
 
-    def _save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.jobs, f, indent=2, ensure_ascii=False)
+    def close(self):
+        with self._lock:
+            self.backend.close()
@@ -5,56 +5,272 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from gemini_helper import configure_api, create_model, answer_question
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
+from gemini_helper import configure_api, create_model, answer_question, answer_questions_batch
 from dotenv import load_dotenv
-import os, re, time, logging
-from gemini_prompter import generate_gemini_prompt
+import os, time, itertools
+from urllib.parse import quote, urlencode
+from collections import Counter, defaultdict
+from gemini_prompter import compile_profile, generate_gemini_prompt, generate_batch_prompt
 from job_tracker import JobTracker
-
+from answer_cache import AnswerCache
+from schema_cache import SchemaCache
+from llm_client import LLMClient
+from answer_rules import AnswerRules
+from field_extractor import REQUIRED_FIELD_SELECTOR, constraint_hint, probe_validation, snapshot_fields
+from card_extractor import extract_job_cards
+from job_ranker import JobRanker
+from session_store import DRIVER_CACHE_PATH, chromedriver_path, restore_cookies, save_cookies
+from metrics import Metrics, traced
+from driver_metrics import CommandCounter
+from log_setup import DEFAULT_LOGGER_NAME, setup_logging
+from search_planner import filter_params
+from form_filler import bulk_fill
+from waits import (MODAL_ACTIONS_JS, WaitEngine, css_count_stable, detail_pane_shows, document_ready, modal_state,
+                   modal_step_changed, network_idle)
+
+
+
+LINKEDIN_URL = "https://www.linkedin.com"
+RESULTS_PER_PAGE = 25
+MAX_RESULT_PAGES = 40
+
+# Scrolls the results list (or the window) by most of a screen. Returns false at the bottom.
+SCROLL_RESULTS_SCRIPT = """
+const list = document.querySelector('.jobs-search-results-list, .scaffold-layout__list');
+const target = list && list.scrollHeight > list.clientHeight ? list : document.scrollingElement;
+const before = target.scrollTop;
+target.scrollTop = before + Math.max(target.clientHeight * 0.8, 300);
+return target.scrollTop > before;
+"""
+
+# apply_mode "prefetch": jobs loaded ahead in background tabs, and how long to wait for their early answers
+PREFETCH_DEPTH = 2
+PREFETCH_ANSWER_TIMEOUT = 60
+
+# Advances a prefetched tab without waiting: "modal" once the Easy Apply modal has rendered,
+# "opening" after the button was clicked, "clicked" when it is clicked now, else "loading".
+WARM_UP_SCRIPT = r"""
+if (document.querySelector('.jobs-easy-apply-modal button')) return 'modal';
+if (window.__botApplyClicked) return 'opening';
+if (document.readyState !== 'complete') return 'loading';
+const button = Array.from(document.querySelectorAll("button[id='jobs-apply-button-id']"))
+    .find(b => b.offsetParent !== null);
+if (!button) return 'loading';
+window.__botApplyClicked = true;
+button.click();
+return 'clicked';
+"""
+
+# Entered when Gemini can't answer a field; never remembered as a step's answer
+FALLBACK_ANSWER = "Sample Text"
+
+# Lean mode: the bot only reads text and clicks controls, so skip every asset a person would look at
+LEAN_CHROME_ARGS = [
+    "--window-size=1280,900",
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+]
+LEAN_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*media.licdn.com*",
+    "*px.ads.linkedin.com*", "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+]
+
+# Clicks a job's card in the loaded results list. Returns false off the results page or if the card isn't rendered.
+OPEN_CARD_SCRIPT = """
+if (!window.__botResultsPage) return false;
+const jobId = arguments[0];
+const card = document.querySelector('.job-card-container[data-job-id="' + jobId + '"]')
+    || document.querySelector('[data-occludable-job-id="' + jobId + '"] .job-card-container');
+if (!card) return false;
+card.scrollIntoView({block: 'center'});
+(card.querySelector('a.job-card-container__link, a[href*="/jobs/view/"]') || card).click();
+return true;
+"""
+
+# Clicks Dismiss (and Discard, for an unfinished application) on open dialogs. Returns how many are still open.
+DISMISS_MODAL_SCRIPT = """
+const open = () => Array.from(document.querySelectorAll('.artdeco-modal, [role="dialog"]'))
+    .filter(d => d.getClientRects().length);
+open().forEach(d => {
+    const dismiss = d.querySelector('button[aria-label="Dismiss"], .artdeco-modal__dismiss');
+    if (dismiss) dismiss.click();
+});
+const discard = document.querySelector('button[data-control-name="discard_application_confirm_btn"]');
+if (discard) discard.click();
+return open().length;
+"""
+
+# Easy Apply modal: a step seen this many times without advancing is stuck; the step ceiling
+# only guards against a form that keeps changing without ever offering Submit
+MAX_STEP_VISITS = 2
+MAX_MODAL_STEPS = 20
+SUBMIT_ACTIONS = ("submit", "submit_alt")
+MODAL_ACTION_LABELS = {
+    "continue": "Continue to next step",
+    "review": "Review your application",
+    "submit": "Submit application",
+    "submit_alt": "Submit",
+}
+
+# Clicks one of the modal's actions (see waits.MODAL_ACTIONS_JS), unticking "Follow company" first
+# when asked. Returns whether the checkbox was unticked.
+MODAL_ACTION_SCRIPT = MODAL_ACTIONS_JS + """
+const modal = document.querySelector(arguments[0]);
+const follow = document.getElementById('follow-company-checkbox');
+const unfollow = arguments[2] && follow && follow.checked;
+if (unfollow) follow.click();
+findAction(modal, arguments[1]).click();
+return !!unfollow;
+"""
 
 
 class LinkedInBot:
-    def __init__(self, headless=False, timeout=10, resume_context=None):
-        self.resume_context = resume_context or {}
-        self.driver = self._setup_driver(headless)
+    def __init__(self, headless=False, timeout=10, resume_context=None, tracker_backend="jsonl", wait_timeouts=None,
+                 base_url=LINKEDIN_URL, profile_dir=None, tracker=None, answer_cache=None, llm_client=None, logger=None,
+                 job_ranker=None, apply_mode="side_panel", lean=False, cookies_path=None, metrics=None,
+                 schema_cache=None, driver_cache_path=DRIVER_CACHE_PATH):
+        """
+        Args:
+            resume_context (dict | ResumeProfile): Resume fields; a dict is compiled into a ResumeProfile.
+            base_url (str): Site root; point it at mock_linkedin for offline runs.
+            job_ranker (JobRanker): Orders and filters cards in iter_ranked_job_cards(). Defaults to
+                ranking against resume_context with no cutoff.
+            apply_mode (str): "side_panel" opens jobs in the search page's detail pane and falls back
+                to a full page load if the pane doesn't show the job; "page" always loads the job
+                page, in its own tab so the results page never has to be reloaded;
+                "prefetch" loads upcoming jobs in background tabs and answers their questions
+                ahead of time (see _apply_pipelined).
+            lean (bool): Start Chrome without images, fonts, media and background services, in a
+                small window. See LEAN_CHROME_ARGS and LEAN_BLOCKED_URLS.
+            profile_dir (str): Chrome --user-data-dir. A persistent profile keeps the LinkedIn session
+                between runs, so login() can skip the sign-in form; parallel workers need one each.
+            cookies_path (str): Also save the session cookies here after login and restore them at
+                startup, for when the profile directory can't be kept.
+            driver_cache_path (str): Where the resolved chromedriver path is cached between runs.
+            tracker, answer_cache, schema_cache, llm_client, logger, metrics: Shared instances (e.g. from WorkerPool).
+                Anything passed in is left open by close(); anything created here is closed.
+        """
+        self._startup_began = time.monotonic()
+        self.metrics = metrics or Metrics()
+        # Compiled once: summary, hash and prompt heads are reused for every field of every job
+        self.resume_profile = compile_profile(resume_context or {})
+        self.resume_context = self.resume_profile.context
+        self.base_url = base_url.rstrip("/")
+        self.driver = self._setup_driver(headless, profile_dir, lean, driver_cache_path)
+        self.lean = lean
+        self.commands = CommandCounter(self.driver)
+        self.step_driver_calls = []  # WebDriver round trips per Easy Apply modal step
+        self.cookies_path = cookies_path
+        self.keeps_session = bool(profile_dir or cookies_path)
         self.wait = WebDriverWait(self.driver, timeout)
-        self.logger = self._setup_logger()
-        self.tracker = JobTracker()
+        self.waits = WaitEngine(self.driver, timeouts=wait_timeouts)
+        self.logger = logger or self._setup_logger()
+        self.logger.info(f"🧾 Resume profile {self.resume_profile.content_hash}: ~{self.resume_profile.token_count} tokens")
+        self._owned = {name for name, shared in (("tracker", tracker), ("answer_cache", answer_cache), ("llm", llm_client),
+                                                 ("metrics", metrics), ("schema_cache", schema_cache)) if shared is None}
+        self.tracker = tracker or JobTracker(backend=tracker_backend)
+        self.answer_cache = answer_cache or AnswerCache()
+        self.schema_cache = schema_cache or SchemaCache()
+        self.resume_hash = self.resume_profile.content_hash
+        self.answer_rules = AnswerRules(self.resume_context)
+        self.answer_sources = Counter()
+        self.llm = llm_client or self._setup_llm_client()
+        self.job_ranker = job_ranker or JobRanker(self.resume_context)
+        if cookies_path and restore_cookies(self.driver, cookies_path):
+            self.logger.info("🍪 Restored saved session cookies.")
+        self.apply_mode = apply_mode
+        self.open_timings = defaultdict(list)  # how each job was opened -> seconds
+        self._warming = {}  # job id -> Future of answers requested ahead of time
+        self._job_tab = None  # (job tab, results tab) while open_job() has a job open in its own tab
+
+    def _setup_llm_client(self):
         load_dotenv()
         GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
         configure_api(GEMINI_API_KEY)
-        self.gemini_model = create_model("gemini-1.5-flash", "You are a helpful assistant that fills job application fields correctly.")
-
-
-    def _setup_logger(self):
-        logger = logging.getLogger(__name__)
-        logger.handlers.clear()  # Clear existing handlers to avoid duplicate logs
-
-        log_file = "bot.log"  # Overwrites on every run
-        handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')  # 'w' mode replaces logs each run
-        formatter = logging.Formatter('[%(asctime)s] %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
+        system_instruction = "You are a helpful assistant that fills job application fields correctly."
+        self.gemini_model = create_model("gemini-1.5-flash", system_instruction)
+        fallback_model_name = os.getenv("GEMINI_FALLBACK_MODEL", "gemini-1.5-flash-8b")
+        return LLMClient(
+            self.gemini_model,
+            fallback_model=create_model(fallback_model_name, system_instruction) if fallback_model_name else None,
+            requests_per_minute=float(os.getenv("GEMINI_RPM", "15")),
+            metrics=self.metrics,
+        )
 
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        return logger
+    @staticmethod
+    def _setup_logger():
+        # Queued, appending, rotating bot.log; main.py may have configured it already from config.json
+        return setup_logging(DEFAULT_LOGGER_NAME)
 
-    def _setup_driver(self, headless: bool = False):
+    @staticmethod
+    def _setup_driver(headless: bool = False, profile_dir: str = None, lean: bool = False,
+                      driver_cache_path: str = DRIVER_CACHE_PATH):
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--start-maximized")
+        if profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+        if lean:
+            for argument in LEAN_CHROME_ARGS:
+                chrome_options.add_argument(argument)
+            chrome_options.add_experimental_option("prefs", LEAN_CHROME_PREFS)
+        else:
+            chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument("--disable-notifications")
         chrome_options.add_argument("--disable-infobars")
         chrome_options.add_argument("--disable-extensions")
-        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-
+        # CDP Network events in the performance log back the network-idle waits
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        try:
+            driver = webdriver.Chrome(service=Service(chromedriver_path(driver_cache_path)), options=chrome_options)
+        except SessionNotCreatedException:
+            # Chrome updated since the driver path was cached
+            driver = webdriver.Chrome(service=Service(chromedriver_path(driver_cache_path, refresh=True)),
+                                      options=chrome_options)
+        if lean:
+            LinkedInBot._block_assets(driver)
+        return driver
+
+    @staticmethod
+    def _block_assets(driver):
+        # Fonts, media and trackers have no content setting; block them at the network layer.
+        # This only applies to the current tab: every new tab needs it again.
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+
+    def _session_valid(self):
+        # LinkedIn sends signed-out visitors from the feed to its login or authwall pages
+        self.driver.get(f"{self.base_url}/feed/")
+        self.waits.until("login_page", document_ready)
+        return "/feed" in self.driver.current_url
+
+    @traced("login")
     def login(self, email: str, password: str):
+        if self.keeps_session and self._session_valid():
+            self.logger.info("✅ Saved session is still valid. Skipping login.")
+            return
+
         self.logger.info("Navigating to LinkedIn login page...")
-        self.driver.get("https://www.linkedin.com/login")
-        time.sleep(2)
+        self.driver.get(f"{self.base_url}/login")
+        self.waits.until("login_page", document_ready)
 
         try:
             if "feed" in self.driver.current_url or "jobs" in self.driver.current_url:
@@ -67,97 +283,162 @@ class LinkedInBot:
             username_input.send_keys(email)
             self.driver.find_element(By.ID, "password").send_keys(password)
 
-            # ⛔ Uncheck 'Keep me signed in' checkbox if it's selected
+            # ⛔ Uncheck 'Keep me signed in' checkbox if it's selected, unless the session is meant to persist
             try:
                 remember_checkbox = self.driver.find_element(By.ID, "rememberMeOptIn-checkbox")
-                if remember_checkbox.is_selected():
+                if remember_checkbox.is_selected() and not self.keeps_session:
                     self.driver.execute_script("arguments[0].click();", remember_checkbox)
                     self.logger.info("☑️ Unchecked 'Keep me signed in' option.")
             except Exception as e:
                 self.logger.warning(f"⚠️ Could not handle 'Keep me signed in' checkbox: {e}")
 
             self.driver.find_element(By.XPATH, "//button[@type='submit']").click()
-            time.sleep(3)
+            logged_in = lambda d: "feed" in d.current_url or "jobs" in d.current_url
 
-            if "feed" in self.driver.current_url or "jobs" in self.driver.current_url:
+            if self.waits.until("login_submit", logged_in):
                 self.logger.info("✅ Login successful.")
             else:
                 self.logger.warning("⚠️ Login may have failed. Please verify.")
-                time.sleep(10)
+                # Leave time to solve a checkpoint/captcha by hand
+                if not self.waits.until("login_challenge", logged_in):
+                    return
+            if self.cookies_path:
+                save_cookies(self.driver, self.cookies_path)
         except TimeoutException:
             self.logger.warning("⚠️ Login fields not found. Possibly already logged in.")
 
-    def search_jobs(self, job_title: str, location: str):
-        self.logger.info(f"Searching for jobs: {job_title} in {location}")
-
-        base_url = "https://www.linkedin.com/jobs/search/"
-        job_param = job_title.replace(" ", "%20")
-        location_param = location.replace(" ", "%20")
+    @traced("search")
+    def search_jobs(self, job_title: str, location: str, filters: dict = None, geo_id: str = None):
+        """
+        Loads the Easy Apply search results for one query.
 
-        filtered_url = (
-            f"{base_url}?keywords={job_param}"
-            f"&location={location_param}"
-            f"&f_AL=true"            # Easy Apply
-            f"&geoId=102713980"      # India geoId (adjust as needed)
-        )
-        # filtered_url="https://www.linkedin.com/jobs/search/?currentJobId=4211502445&f_AL=true&geoId=102713980&keywords=Data%20Engineer%20at%20Cozzera&origin=JOB_SEARCH_PAGE_SEARCH_BUTTON&refresh=true"
-        
+        Args:
+            filters (dict): Planner filters, e.g. {"date_posted": "week", "experience": ["entry"]}.
+            geo_id (str): LinkedIn geoId for the location, when its text alone resolves badly.
+        """
+        if self._startup_began is not None:
+            self.logger.info(f"🚀 Startup to first search: {time.monotonic() - self._startup_began:.1f}s")
+            self._startup_began = None
+        self.logger.info(f"Searching for jobs: {job_title} in {location} {filters or ''}")
+
+        params = {
+            "keywords": job_title,
+            "location": location,
+            "f_AL": "true",  # Easy Apply
+            **filter_params(filters),
+        }
+        if geo_id:
+            params["geoId"] = geo_id
+        filtered_url = f"{self.base_url}/jobs/search/?{urlencode(params, quote_via=quote)}"
+
+        self.search_url = filtered_url
         self.driver.get(filtered_url)
-        time.sleep(5)
+        self.waits.until("search_results", network_idle())
+        self.driver.execute_script("window.__botResultsPage = arguments[0];", filtered_url)
         self.logger.info("✅ Search page with filters loaded.")
 
-    def collect_job_cards(self, max_jobs=10):
+    def collect_job_cards(self, max_jobs=10, max_pages=MAX_RESULT_PAGES):
         self.logger.info("Collecting job cards...")
-        job_cards = []
+        job_cards = list(itertools.islice(self.iter_job_cards(max_pages=max_pages), max_jobs))
+        self.logger.info(f"Collected {len(job_cards)} job cards.")
+        return job_cards
 
-        try:
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
+    def iter_job_cards(self, max_jobs=None, max_pages=MAX_RESULT_PAGES):
+        """
+        Lazily walks the result pages of the last search_jobs() call, scrolling the
+        virtualised list so every card renders, and yields each new card as soon
+        as it is parsed. Jobs already in the tracker are skipped before they are
+        yielded.
 
-            listings = []
-            for attempt in range(3):
-                listings = self.driver.find_elements(By.CLASS_NAME, "job-card-container")
-                if listings:
+        The caller may navigate away between cards (e.g. to apply); the generator
+        reloads the result page it was on and carries on where it left off.
+        """
+        seen = set()
+        yielded = 0
+        for page in range(max_pages):
+            page_url = self.search_url if page == 0 else f"{self.search_url}&start={page * RESULTS_PER_PAGE}"
+            page_cards = 0
+            while True:
+                if not self._on_results_page(page_url):
+                    with self.metrics.span("results_page", page=page + 1):
+                        self.driver.get(page_url)
+                        self.waits.until("search_results", network_idle())
+                        self.driver.execute_script("window.__botResultsPage = arguments[0];", page_url)
+
+                new_cards = []
+                for card in self._read_visible_job_cards():
+                    key = card["job_id"] or card["link"]
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    new_cards.append(card)
+
+                for card in new_cards:
+                    page_cards += 1
+                    if self.tracker.has_applied(card["job_id"]):
+                        self.logger.info(f"⏭️ Already applied to: {card['title']} at {card['company']} (skipping)")
+                        continue
+                    self.logger.info(f"[{len(seen)}] {card['title']} at {card['company']} — {card['location']}")
+                    yield card
+                    yielded += 1
+                    if max_jobs is not None and yielded >= max_jobs:
+                        return
+
+                if not self._on_results_page(page_url):
+                    continue  # the consumer navigated away; reload and rescan
+                scrolled = self.driver.execute_script(SCROLL_RESULTS_SCRIPT)
+                self.waits.until("job_cards_loaded", css_count_stable(".job-card-container", min_count=0, stable_for=0.3))
+                if not scrolled and not new_cards:
                     break
-                self.logger.info(f"Retrying job load... ({attempt + 1})")
-                time.sleep(2)
 
-            self.logger.info(f"Found {len(listings)} job cards")
-            if not listings:
-                self.logger.error("No job listings found after retries.")
-                return []
+            self.logger.info(f"📄 Results page {page + 1}: {page_cards} cards")
+            if page_cards == 0:
+                break
 
-            for idx, job in enumerate(listings[:max_jobs]):
-                try:
-                    title = job.find_element(By.CSS_SELECTOR, "a.job-card-container__link span strong").text.strip()
-                    company = job.find_element(By.CSS_SELECTOR, "div.artdeco-entity-lockup__subtitle span").text.strip()
-                    location = job.find_element(By.CSS_SELECTOR, "ul.job-card-container__metadata-wrapper li").text.strip()
-                    link = job.find_element(By.TAG_NAME, "a").get_attribute("href")
-                    match = re.search(r"/jobs/view/(\d+)", link)
-                    job_id = match.group(1) if match else None
-
-                    job_cards.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "link": link,
-                        "job_id": job_id 
-                    })
-
-                    self.logger.info(f"[{idx+1}] {title} at {company} — {location}")
-                except Exception as e:
-                    self.logger.warning(f"Skipping job #{idx+1} due to error: {e}")
+    def iter_ranked_job_cards(self, max_jobs=None, max_pages=MAX_RESULT_PAGES, cards=None):
+        """
+        Like iter_job_cards(), but each window of cards is handed out best first by
+        resume relevance, and cards under the ranker's cutoff are dropped before
+        they cost a page load.
 
-        except Exception as e:
-            self.logger.error(f"Error during job collection: {e}")
+        Args:
+            cards: Card stream to rank instead of the last search's results, e.g.
+                SearchPlanner.iter_job_cards().
+        """
+        ranker = self.job_ranker
+        reported = len(ranker.skipped)
+        if cards is None:
+            cards = self.iter_job_cards(max_pages=max_pages)
+        try:
+            for card in ranker.iter_ranked(cards, max_jobs=max_jobs):
+                reported = self._log_skipped_cards(reported)
+                self.logger.info(f"🎯 Relevance {card['relevance']}: {card['title']} at {card['company']}")
+                yield card
+        finally:
+            self._log_skipped_cards(reported)
+
+    def _log_skipped_cards(self, reported):
+        for card in self.job_ranker.skipped[reported:]:
+            self.logger.info(f"⏭️ Low relevance ({card['relevance']} < {self.job_ranker.min_score}): "
+                             f"{card['title']} at {card['company']} (skipping)")
+        return len(self.job_ranker.skipped)
+
+    def _on_results_page(self, page_url):
+        # A window marker survives LinkedIn's in-page URL rewrites but not a navigation
+        return self.driver.execute_script("return window.__botResultsPage === arguments[0];", page_url)
+
+    @traced("card_scan")
+    def _read_visible_job_cards(self):
+        # One round trip for every rendered card instead of 4 find_element calls each
+        cards, skipped = extract_job_cards(self.driver)
+        if skipped:
+            self.logger.warning(f"Skipping {skipped} job card(s) without a job link.")
+        return cards
 
-        self.logger.info(f"Collected {len(job_cards)} job cards.")
-        return job_cards
-    
     def get_dropdown_options(self, field_element):
         try:
             field_element.click()
-            time.sleep(1)
+            self.waits.until("dropdown_open", EC.presence_of_element_located((By.XPATH, "//div[@role='listbox']//li")))
             option_elements = self.driver.find_elements(By.XPATH, "//div[@role='listbox']//li")
             options = [opt.text.strip() for opt in option_elements if opt.text.strip()]
             return options
@@ -227,97 +508,200 @@ class LinkedInBot:
         return "Field information not found"
 
 
-    def autofill_required_fields(self, missing_fields):
+    def _field_option_texts(self, field_info):
+        """Converts any WebElement options into plain text for the prompt."""
+        option_texts = []
+        for opt in field_info.get("options", []):
+            if isinstance(opt, str):
+                option_texts.append(opt.strip())
+                continue
+            try:
+                # If it's a WebElement, grab its value or text
+                val = opt.get_attribute("value")
+                option_texts.append(val.strip() if val else opt.text.strip())
+            except Exception:
+                # Fallback for any non-WebElement
+                option_texts.append(str(opt).strip())
+        return option_texts
+
+    def _answer_cache_key(self, field_info, option_texts):
+        return AnswerCache.make_key(
+            field_info["label"],
+            field_info["type"],
+            option_texts,
+            field_info.get("validation", ""),
+            self.resume_hash,
+        )
+
+    def _submit_single_field(self, field_info, option_texts):
+        full_prompt = generate_gemini_prompt(
+            field_label=field_info["label"],
+            input_type=field_info["type"],
+            resume_context=self.resume_profile,
+            options=option_texts or None,
+            validation_hint=field_info.get("validation", "")
+        )
+        return self.llm.submit(answer_question, context="", question=full_prompt)
+
+    @traced("resolve")
+    def resolve_field_answers(self, missing_fields):
         """
-        Autofills missing required fields using Gemini responses based on field prompts.
+        Returns one answer per missing field: rule-based answers from the resume
+        context first, then cached answers, then every remaining field in a single
+        batched Gemini call, and per-field calls only for fields the batch
+        response didn't answer.
         """
-        for field_info in missing_fields:
-            element = field_info["element"]
-            label = field_info["label"]
-            tag = field_info["tag"]
-            field_type = field_info["type"]
-            validation_hint = field_info.get("validation", "")
+        answers = [None] * len(missing_fields)
+        pending = []
+        for idx, field_info in enumerate(missing_fields):
+            option_texts = self._field_option_texts(field_info)
+
+            # ⚡ Deterministic answers straight from config.json
+            ruled = self.answer_rules.resolve(
+                field_info["label"], field_info["type"], option_texts or None, field_info.get("validation", "")
+            )
+            if ruled is not None:
+                self.logger.info(f"⚡ Rule answer for '{field_info['label']}': '{ruled}'")
+                self.answer_sources["rules"] += 1
+                answers[idx] = ruled
+                continue
+
+            # 💾 Reuse a previous answer for the same question when we have one
+            cache_key = self._answer_cache_key(field_info, option_texts)
+            cached = self.answer_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"💾 Cached answer for '{field_info['label']}': '{cached}'")
+                self.answer_sources["cache"] += 1
+                answers[idx] = cached
+            else:
+                pending.append((idx, field_info, option_texts, cache_key))
+
+        batch_answers = {}
+        if len(pending) > 1:
+            batch_fields = [{
+                "id": str(idx),
+                "label": field_info["label"],
+                "input_type": field_info["type"],
+                "options": option_texts,
+                "validation_hint": field_info.get("validation", ""),
+            } for idx, field_info, option_texts, _ in pending]
+            try:
+                batch_prompt = generate_batch_prompt(batch_fields, self.resume_profile)
+                batch_answers = self.llm.call(answer_questions_batch, batch_prompt, [f["id"] for f in batch_fields])
+                self.logger.info(f"📦 Batched Gemini call answered {len(batch_answers)}/{len(pending)} fields")
+            except Exception as e:
+                self.logger.error(f"❌ Batched Gemini call failed, falling back to per-field calls: {e}")
+
+        # 🔄 Per-field fallback for anything the batch didn't answer, run concurrently
+        futures = {
+            idx: self._submit_single_field(field_info, option_texts)
+            for idx, field_info, option_texts, _ in pending
+            if str(idx) not in batch_answers
+        }
+        for idx, field_info, option_texts, cache_key in pending:
+            ai_response = batch_answers.get(str(idx))
+            if ai_response is not None:
+                self.answer_sources["llm_batch"] += 1
+            else:
+                try:
+                    ai_response = futures[idx].result().strip()
+                    self.answer_sources["llm_single"] += 1
+                except Exception as e:
+                    self.logger.error(f"❌ Gemini API error for '{field_info['label']}': {e}")
+                    self.answer_sources["fallback"] += 1
+                    answers[idx] = FALLBACK_ANSWER
+                    continue
+            self.answer_cache.put(cache_key, ai_response, label=field_info["label"])
+            answers[idx] = ai_response
+        return answers
 
+    @traced("fill")
+    def autofill_required_fields(self, missing_fields):
+        """
+        Autofills missing required fields using Gemini responses based on field prompts.
 
-            # —–––– Convert any WebElement options into plain text for the prompt
-            raw_opts = field_info.get("options", [])
-            option_texts = []
-            for opt in raw_opts:
-                try:
-                    # If it's a WebElement, grab its value or text
-                    val = opt.get_attribute("value")
-                    option_texts.append(val.strip() if val else opt.text.strip())
-                except Exception:
-                    # Fallback for any non-WebElement
-                    option_texts.append(str(opt).strip())
+        All answers are applied in one injected script; fields that reject
+        programmatic input fall back to per-element typing. Returns the answers,
+        one per field.
+        """
+        answers = self.resolve_field_answers(missing_fields)
+        try:
+            results = bulk_fill(self.driver, [
+                {"element": f["element"], "tag": f["tag"], "value": answer}
+                for f, answer in zip(missing_fields, answers)
+            ])
+        except Exception as e:
+            self.logger.error(f"❌ Bulk fill failed, typing fields one by one: {e}")
+            results = [{"status": "error"}] * len(missing_fields)
 
-            # 🔄 Generate prompt from structured context, passing clean option_texts
+        for field_info, ai_response, result in zip(missing_fields, answers, results):
+            label = field_info["label"]
+            if result["status"] == "ok":
+                self.logger.info(f"✍️ Autofilled '{label}' with '{result.get('text', ai_response)}'")
+            elif result["status"] == "no_match":
+                self.logger.warning(f"⚠️ No matching option found for '{label}' (answer: '{ai_response}')")
+            else:
+                self.logger.info(f"↩️ '{label}' rejected programmatic input ({result['status']}); typing it instead")
+                self._fill_field_by_element(field_info, ai_response)
+        return answers
+
+    def _fill_field_by_element(self, field_info, ai_response):
+        """Per-element fill path, one WebDriver call at a time."""
+        element = field_info["element"]
+        label = field_info["label"]
+        tag = field_info["tag"]
+        field_type = field_info["type"]
+        # 🧩 Dropdowns
+        if tag == "select" and field_type == "select-one":
             try:
-                full_prompt = generate_gemini_prompt(
-                    field_label=label,
-                    input_type=field_type,
-                    resume_context=self.resume_context,
-                    options=option_texts or None,
-                    validation_hint=validation_hint
+                select_elem = WebDriverWait(self.driver, 10).until(
+                    EC.element_to_be_clickable(element)
+                )
+                option_elements = select_elem.find_elements(By.TAG_NAME, "option")
 
+                selected_option = next(
+                    (opt for opt in option_elements
+                    if ai_response.lower() in opt.text.strip().lower()),
+                    None
                 )
-                ai_response = answer_question(self.gemini_model, context="", question=full_prompt).strip()
+                if selected_option:
+                    selected_option.click()
+                    self.logger.info(f"✍️ Autofilled dropdown '{label}' with '{ai_response}'")
+                else:
+                    self.logger.warning(f"⚠️ No matching dropdown option found for '{label}'")
             except Exception as e:
-                self.logger.error(f"❌ Gemini API error: {e}")
-                ai_response = "Sample Text"
+                self.logger.error(f"❌ Dropdown autofill failed for '{label}': {e}")
 
-            # 🧩 Dropdowns
-            if tag == "select" and field_type == "select-one":
-                try:
-                    select_elem = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable(element)
-                    )
-                    option_elements = select_elem.find_elements(By.TAG_NAME, "option")
-
-                    selected_option = next(
-                        (opt for opt in option_elements
-                        if ai_response.lower() in opt.text.strip().lower()),
-                        None
-                    )
-                    if selected_option:
-                        selected_option.click()
-                        self.logger.info(f"✍️ Autofilled dropdown '{label}' with '{ai_response}'")
-                    else:
-                        self.logger.warning(f"⚠️ No matching dropdown option found for '{label}'")
-                except Exception as e:
-                    self.logger.error(f"❌ Dropdown autofill failed for '{label}': {e}")
+        # 🔘 Radio Buttons
+        elif tag == "fieldset" and field_type == "radio":
+            try:
+                radios = element.find_elements(By.CSS_SELECTOR, "input[type='radio']")
+                selected_radio = next(
+                    (r for r in radios
+                    if ai_response.lower() in r.get_attribute("value").lower()),
+                    None
+                )
+                if selected_radio:
+                    self.driver.execute_script("""
+                        arguments[0].click();
+                        arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
+                    """, selected_radio)
+                    self.logger.info(f"✍️ Autofilled radio button '{label}' with '{ai_response}'")
+                else:
+                    self.logger.warning(f"⚠️ No matching radio option found for '{label}'")
+            except Exception as e:
+                self.logger.error(f"❌ Radio autofill failed for '{label}': {e}")
 
-            # 🔘 Radio Buttons
-            elif tag == "fieldset" and field_type == "radio":
-                try:
-                    radios = element.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                    selected_radio = next(
-                        (r for r in radios
-                        if ai_response.lower() in r.get_attribute("value").lower()),
-                        None
-                    )
-                    if selected_radio:
-                        self.driver.execute_script("""
-                            arguments[0].click();
-                            arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-                        """, selected_radio)
-                        self.logger.info(f"✍️ Autofilled radio button '{label}' with '{ai_response}'")
-                    else:
-                        self.logger.warning(f"⚠️ No matching radio option found for '{label}'")
-                except Exception as e:
-                    self.logger.error(f"❌ Radio autofill failed for '{label}': {e}")
+        # ✏️ Standard Input Fields
+        else:
+            try:
+                element.click()
+                element.clear()
+                element.send_keys(ai_response)
+                self.logger.info(f"✍️ Autofilled '{label}' with '{ai_response}'")
+            except Exception as fill_error:
+                self.logger.error(f"❌ Could not fill field '{label}': {fill_error}")
 
-            # ✏️ Standard Input Fields
-            else:
-                try:
-                    element.click()
-                    element.clear()
-                    element.send_keys(ai_response)
-                    self.logger.info(f"✍️ Autofilled '{label}' with '{ai_response}'")
-                    time.sleep(1)
-                except Exception as fill_error:
-                    self.logger.error(f"❌ Could not fill field '{label}': {fill_error}")
-                
     def get_label_from_parent(self, field):
         try:
             # Go up to parent container and find any label or span with question
@@ -331,96 +715,78 @@ class LinkedInBot:
         except Exception:
             return None
 
-    def check_required_fields(self):
+    @traced("field_scan")
+    def check_required_fields(self, probe=False, snapshot=None):
+        """
+        Lists the step's required fields that are empty or flagged invalid, each with a
+        validation hint from its error message or, failing that, its markup.
+
+        Args:
+            probe (bool): Also probe inputs that still have no hint (see probe_validation).
+                Only worth it once an answer has been rejected without explanation.
+            snapshot (list): The step as just read by snapshot_fields, to save reading it again.
+
+        Returns:
+            tuple: (missing field dicts, their prompt texts).
+        """
         try:
             self.logger.info("🔍 Checking required fields in modal...")
 
-            # Wait for modal to appear.
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "jobs-easy-apply-modal")))
-            time.sleep(1)
+            if snapshot is None:
+                # Wait for modal to appear.
+                self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "jobs-easy-apply-modal")))
+
+                # One round trip for label, type, value, options and state of every required field
+                snapshot = snapshot_fields(self.driver)
+
+            # Validation rules come from the error message or the markup (type, pattern, min/max,
+            # described-by text); inputs neither explains are probed on request, all at once
+            unknown = []
+            for field in snapshot:
+                if field["filled"] and not field["error"]:
+                    continue
+                field["validation"] = field["validation"] or constraint_hint(field["constraints"])
+                if not field["validation"] and field["tag"] == "input":
+                    unknown.append(field)
+            if probe and unknown:
+                try:
+                    messages = probe_validation(self.driver, [field["element"] for field in unknown], lambda: (
+                        # One wait for all probes: until the set of error fields stops changing
+                        self.waits.until("field_validation", css_count_stable(
+                            ".jobs-easy-apply-modal .fb-dash-form-element__error-field", min_count=0, stable_for=0.3
+                        ))
+                    ))
+                    for field, message in zip(unknown, messages):
+                        field["validation"] = message
+                    self.logger.info(f"🧪 Probed {len(unknown)} fields without validation markup")
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Validation probe failed: {e}")
 
-            # Include fieldsets for radio groups along with input, textarea and select.
-            required_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[required], textarea[required], select[required], fieldset[data-test-form-builder-radio-button-form-component='true']")
             missing_fields = []
-            prompts = []
+            for index, field in enumerate(snapshot):
+                tag, field_type, label = field["tag"], field["type"], field["label"]
+                self.logger.info(f"➡️ Field: {label} | Tag: {tag} | Type: {field_type} | Filled: {field['filled']}")
+                if field["filled"] and not field["error"]:
+                    continue
 
-            for field in required_fields:
-                tag = field.tag_name.lower()
-                # If the field is a radio group (fieldset), process separately.
+                validation_message = field["validation"]
                 if tag == "fieldset":
-                    try:
-                        # Extract question from legend.
-                        question = field.find_element(By.TAG_NAME, "legend").text.strip()
-                    except Exception:
-                        question = "Radio field question not found"
-
-                    # Check if any radio button is selected within this fieldset.
-                    radios = field.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                    is_filled = any(radio.is_selected() for radio in radios)
-
-                    self.logger.info(f"➡️ Field: {question} | Tag: {tag} | Type: radio | Filled: {is_filled}")
-
-                    if not is_filled:
-                        prompt_text = f"Please select an appropriate response for '{question}'. Options: " + ", ".join([radio.get_attribute("value") for radio in radios])
-                        missing_fields.append({
-                            "element": field,
-                            "label": question,
-                            "type": "radio",
-                            "tag": tag,
-                            "options": radios,  # store radio options for later use
-                            "prompt": prompt_text
-                        })
-                        self.logger.info(f"🧠 Prompt to generate: {prompt_text}")
+                    prompt_text = f"Please select an appropriate response for '{label}'. Options: " + ", ".join(field["options"])
+                elif validation_message:
+                    prompt_text = f"Please provide a valid answer for '{label}'. The input must satisfy: {validation_message}"
                 else:
-                    # Process standard input, textarea, and select fields.
-                    field_type = field.get_attribute("type") or "text"
-                    label = (
-                        field.get_attribute("aria-label")
-                        or field.get_attribute("name")
-                        or field.get_attribute("placeholder")
-                        or field.find_element(By.XPATH, './preceding-sibling::label').text.strip()  # Check nearby labels
-                        or "Unknown field"
-                    )
-                    value = field.get_attribute("value") or ""
-                    is_select = (tag == "select")
-                    is_filled = bool(value.strip()) if not is_select else field.get_attribute("selectedIndex") not in ["", "0", None]
-
-                    # For input fields, if empty, trigger validation by typing a test character.
-                    validation_message = ""
-                    if not is_filled and tag == "input":
-                        try:
-                            field.clear()
-                            field.send_keys("a")  # Type a test character.
-                            time.sleep(1)
-                        except Exception:
-                            pass
-
-                        if "fb-dash-form-element__error-field" in field.get_attribute("class"):
-                            error_id = field.get_attribute("aria-describedby")
-                            if error_id:
-                                try:
-                                    error_elem = self.driver.find_element(By.CSS_SELECTOR, f"#{error_id} .artdeco-inline-feedback__message")
-                                    validation_message = error_elem.text.strip()
-                                except Exception:
-                                    validation_message = ""
-                            is_filled = False  # Even if a value is present, error indicates invalid data.
-
-                    self.logger.info(f"➡️ Field: {label} | Tag: {tag} | Type: {field_type} | Filled: {is_filled}")
-
-                    if not is_filled:
-                        if validation_message:
-                            prompt_text = f"Please provide a valid answer for '{label}'. The input must satisfy: {validation_message}"
-                        else:
-                            prompt_text = f"Please provide an appropriate answer for '{label}' (expected input type: {field_type})."
-                        missing_fields.append({
-                            "element": field,
-                            "label": label,
-                            "type": field_type,
-                            "tag": tag,
-                            "prompt": prompt_text,
-                            "validation": validation_message
-                        })
-                        self.logger.info(f"🧠 Prompt to generate: {prompt_text}")
+                    prompt_text = f"Please provide an appropriate answer for '{label}' (expected input type: {field_type})."
+                missing_fields.append({
+                    "index": index,  # position among the step's required fields
+                    "element": field["element"],
+                    "label": label,
+                    "type": field_type,
+                    "tag": tag,
+                    "options": field["options"],
+                    "prompt": prompt_text,
+                    "validation": validation_message
+                })
+                self.logger.info(f"🧠 Prompt to generate: {prompt_text}")
 
             if not missing_fields:
                 self.logger.info("✅ All required fields are already filled.")
@@ -435,97 +801,183 @@ class LinkedInBot:
             return [], []
 
 
+    def _fill_from_schema_cache(self, rejected=False):
+        """
+        Fills the current step from the schema cache when its field structure has been
+        submitted before: one snapshot, one bulk fill and one re-read, with no Gemini
+        calls and no validation probing. An entry the form no longer accepts is dropped,
+        as is the step's entry when `rejected` (the form refused the step's answers).
+
+        Returns:
+            tuple: (fingerprint, number of required fields, the step's current snapshot or None
+            if it has to be read again, whether the step is now filled).
+        """
+        snapshot = snapshot_fields(self.driver)
+        fingerprint = SchemaCache.fingerprint(snapshot, self.resume_hash)
+        if rejected:
+            self.schema_cache.invalidate(fingerprint)
+        answers = self.schema_cache.get(fingerprint) if snapshot and not rejected else None
+        if answers is None:
+            return fingerprint, len(snapshot), snapshot, False
+
+        to_fill = [(field, answer) for field, answer in zip(snapshot, answers) if not field["filled"]]
+        if any(answer is None for _, answer in to_fill):
+            # A field that was prefilled last time is empty now; answer the step normally
+            return fingerprint, len(snapshot), snapshot, False
+        try:
+            bulk_fill(self.driver, [{"element": f["element"], "tag": f["tag"], "value": a} for f, a in to_fill])
+            after = snapshot_fields(self.driver)
+        except Exception as e:
+            self.logger.error(f"❌ Filling step from schema cache failed: {e}")
+            after = []
+        if len(after) != len(snapshot) or not all(f["filled"] and not f["error"] for f in after):
+            self.logger.warning("♻️ Form rejected the remembered answers for this step; dropping them.")
+            self.schema_cache.invalidate(fingerprint)
+            return fingerprint, len(snapshot), after or None, False
+
+        self.logger.info(f"🗂️ Known form step: filled {len(to_fill)} fields from the schema cache")
+        self.answer_sources["schema_cache"] += len(to_fill)
+        return fingerprint, len(snapshot), after, True
+
+    def _remember_steps(self, learned):
+        """Stores the answers of a submitted application's steps in the schema cache."""
+        for fingerprint, answers in learned:
+            self.schema_cache.put(fingerprint, answers)
+        if learned:
+            self.logger.info(f"🗂️ Remembered {len(learned)} form steps for reuse")
+
+    def _fill_modal_step(self, step, span, learned, rejected=False):
+        """
+        Fills the current step's required fields: from the schema cache when the step is
+        known, otherwise with rule, cached and Gemini answers. Answers that got through
+        are appended to `learned` for the schema cache. When `rejected`, the step came
+        back with errors and is refilled without the schema cache; its fields' error
+        messages become the validation hints.
+
+        Returns:
+            bool: False if required fields are still empty or invalid afterwards.
+        """
+        fingerprint, field_count, snapshot, span["schema_cache"] = self._fill_from_schema_cache(rejected)
+        if span["schema_cache"]:
+            return True
+
+        self.logger.info(f"🔄 Step {step}: Checking required fields...")
+        missing_fields, prompts = self.check_required_fields(snapshot=snapshot)
+        if not missing_fields:
+            return True
+
+        self.logger.warning("❌ Required fields are empty; attempting to autofill them.")
+        # A refilled step keeps the answers it took the first time round
+        earlier = [answers for known, answers in learned if known == fingerprint and len(answers) == field_count]
+        step_answers = list(earlier[-1]) if earlier else [None] * field_count
+        attempted = {}
+        for retry in (False, True):
+            answers = self.autofill_required_fields(missing_fields)
+            for field_info, answer in zip(missing_fields, answers):
+                attempted[field_info["index"]] = field_info
+                if field_info["index"] < field_count:
+                    step_answers[field_info["index"]] = answer
+
+            # Re-check after autofill; a rejected answer without a message is the one case worth probing
+            missing_fields, prompts = self.check_required_fields(probe=not retry)
+            if not missing_fields:
+                break
+            # Don't keep serving answers the form just rejected
+            for field_info in missing_fields:
+                refused = attempted.get(field_info["index"], field_info)
+                self.answer_cache.invalidate(
+                    self._answer_cache_key(refused, self._field_option_texts(refused))
+                )
+            if not retry:
+                self.logger.warning(f"🔁 {len(missing_fields)} answers rejected; retrying with the form's messages.")
+        if missing_fields:
+            for p in prompts:
+                self.logger.info(f"❓ Gemini Prompt: {p}")
+            self.logger.warning("❌ Still missing required field values. Skipping job.")
+            return False
+        if FALLBACK_ANSWER not in step_answers:
+            learned.append((fingerprint, step_answers))
+        return True
+
+    def _take_modal_action(self, action, state):
+        """
+        Clicks the step's button (unticking "Follow company" first on submit) and waits for the
+        step to change or show errors. Returns True if an application was submitted.
+        """
+        submitting = action in SUBMIT_ACTIONS
+        unfollowed = self.driver.execute_script(
+            MODAL_ACTION_SCRIPT, ".jobs-easy-apply-modal", action, submitting and state["follow_checked"])
+        if unfollowed:
+            self.logger.info("☑️ Unchecked 'Follow company' checkbox.")
+        self.logger.info(f"✅ Clicked '{MODAL_ACTION_LABELS[action]}'")
+        # A click the form rejects leaves the step in place with inline errors; stop waiting then
+        outcome = self.waits.until("submit_confirmed" if submitting else "modal_step_change",
+                                   modal_step_changed(state["signature"], stop_on_errors=True))
+        return submitting and outcome != "errors"
+
+    @traced("modal")
     def handle_easy_apply_modal(self):
+        """
+        Walks the Easy Apply modal as a state machine. Each step is read in one query
+        (modal_state): its signature, available actions, empty required fields and
+        errors. The fields are filled if needed, the first available action is taken,
+        and the loop moves on once the signature changes. A step that comes back with
+        errors is refilled with their messages as hints; one that keeps coming back
+        unchanged ends the attempt. Driver calls per step go to the modal_step span.
+        """
         try:
             self.logger.info("📝 Handling Easy Apply modal...")
 
             # Wait for the Easy Apply modal to appear.
             self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "jobs-easy-apply-modal")))
-            time.sleep(2)  # Allow time for modal contents to render
-
-            # Multi-step modal handling
-            max_steps = 4
-            for step in range(max_steps):
-                self.logger.info(f"🔄 Step {step + 1}: Checking required fields...")
-                missing_fields, prompts = self.check_required_fields()
-
-                if missing_fields:
-                    self.logger.warning("❌ Required fields are empty; attempting to autofill them.")
-                    self.autofill_required_fields(missing_fields)
-
-                    # Re-check after autofill
-                    missing_fields, prompts = self.check_required_fields()
-                    if missing_fields:
-                        for p in prompts:
-                            self.logger.info(f"❓ Gemini Prompt: {p}")
-                        self.logger.warning("❌ Still missing required field values. Skipping job.")
+            # Wait for the step's fields and buttons to finish rendering
+            self.waits.until("modal_ready", css_count_stable(".jobs-easy-apply-modal button", stable_for=0.3))
+
+            learned = []  # (fingerprint, answers) of steps answered this time; kept once the application goes through
+            visits = Counter()  # step signature -> times handled
+            previous_action = None
+            for step in range(1, MAX_MODAL_STEPS + 1):
+                calls_before = self.commands.total
+                state = modal_state(self.driver, REQUIRED_FIELD_SELECTOR)
+                if state is None:
+                    self.logger.warning("⚠️ Easy Apply modal closed before the application was submitted.")
+                    return False
+
+                visits[state["signature"]] += 1
+                for error in state["errors"]:
+                    self.logger.warning(f"❗ Validation error: {error}")
+                if state["errors"] and previous_action == "review":
+                    # ✅ Errors after review mean the form refused answers we can no longer see
+                    self.logger.warning("❌ Submission blocked due to validation errors.")
+                    return False
+                if visits[state["signature"]] > MAX_STEP_VISITS:
+                    self.logger.warning(f"⚠️ Modal is stuck on the same step after {MAX_STEP_VISITS} attempts.")
+                    break
+                if state["errors"] and visits[state["signature"]] > 1:
+                    # The step refused our answers; refill it once, using its error messages as hints
+                    self.logger.info("🔁 Step rejected our answers; refilling it with the form's messages.")
+
+                with self.metrics.span("modal_step", step=step) as span:
+                    rejected = bool(state["errors"]) and visits[state["signature"]] > 1
+                    if ((state["empty_required"] or state["errors"])
+                            and not self._fill_modal_step(step, span, learned, rejected)):
                         return False
-
-                # Try "Continue to next step"
-                try:
-                    continue_btn = self.driver.find_element(By.XPATH, "//button[@aria-label='Continue to next step']")
-                    if continue_btn.is_displayed() and continue_btn.is_enabled():
-                        continue_btn.click()
-                        self.logger.info("✅ Clicked 'Continue to next step'")
-                        time.sleep(2)
-                        continue
-                except NoSuchElementException:
-                    self.logger.debug("➡️ No 'Continue to next step' button on this screen.")
-
-                # Try "Review your application"
-                try:
-                    review_btn = self.driver.find_element(By.XPATH, "//button[@aria-label='Review your application']")
-                    if review_btn.is_displayed() and review_btn.is_enabled():
-                        review_btn.click()
-                        self.logger.info("✅ Clicked 'Review your application'")
-                        time.sleep(2)
-
-                        # ✅ After review, check for validation errors before attempting submission
-                        error_elements = self.driver.find_elements(By.CLASS_NAME, "artdeco-inline-feedback")
-                        if error_elements:
-                            for error in error_elements:
-                                self.logger.warning(f"❗ Validation error on review: {error.text}")
-                            self.logger.warning("❌ Submission blocked due to validation errors.")
-                            return False
-
-                        continue
-                except NoSuchElementException:
-                    self.logger.debug("➡️ No 'Review your application' button on this screen.")
-
-                # Try unchecking follow company checkbox
-                try:
-                    follow_checkbox = self.driver.find_element(By.ID, "follow-company-checkbox")
-                    if follow_checkbox.is_selected():
-                        self.driver.execute_script("arguments[0].click();", follow_checkbox)
-                        self.logger.info("☑️ Unchecked 'Follow company' checkbox.")
-                        time.sleep(2)
-                except Exception:
-                    self.logger.debug("🔍 'Follow company' checkbox not found or already unchecked.")
-
-                # Try "Submit application"
-                try:
-                    submit_btn = self.driver.find_element(By.XPATH, "//button[@aria-label='Submit application']")
-                    if submit_btn.is_displayed() and submit_btn.is_enabled():
-                        submit_btn.click()
-                        self.logger.info("✅ Clicked 'Submit application'")
-                        time.sleep(2)
-                        return True
-                except NoSuchElementException:
-                    self.logger.warning("⚠️ No 'Submit application' button found.")
-
-                # Try generic "Next" or "Submit" button if labeled differently
-                try:
-                    alt_submit_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Submit')]")
-                    if alt_submit_btn.is_displayed() and alt_submit_btn.is_enabled():
-                        alt_submit_btn.click()
-                        self.logger.info("✅ Clicked alternate 'Submit' button")
-                        time.sleep(2)
-                        return True
-                except NoSuchElementException:
-                    self.logger.debug("🔍 No alternate submit button found.")
+                    action = span["action"] = state["actions"][0] if state["actions"] else None
+                    submitted = action is not None and self._take_modal_action(action, state)
+                    span["driver_calls"] = self.commands.total - calls_before
+                self.step_driver_calls.append(span["driver_calls"])
+                self.logger.info(f"🔢 Step {step} ({action or 'no action'}): {span['driver_calls']} driver calls")
+
+                if submitted:
+                    self._remember_steps(learned)
+                    return True
+                if action is None:
+                    self.logger.warning("⚠️ No Continue, Review or Submit button on this step.")
+                    break
+                previous_action = action
 
             # ❌ Final fallback — capture screenshot and HTML for debugging
-            self.logger.warning("⚠️ Could not complete submission process after all steps.")
+            self.logger.warning("⚠️ Could not complete submission process.")
             try:
                 self.driver.save_screenshot("modal_debug.png")
                 with open("modal_debug.html", "w", encoding="utf-8") as f:
@@ -543,49 +995,285 @@ class LinkedInBot:
 
         return False
 
-
-
-    def apply_to_jobs(self, job_cards: list):
+    def apply_to_jobs(self, job_cards):
+        """
+        Applies to each job in `job_cards`, a list or a generator such as iter_job_cards().
+        Returns the number of jobs attempted.
+        """
         self.logger.info("Starting Easy Apply process...")
+        started = time.monotonic()
 
-        for idx, job in enumerate(job_cards):
-            try:
+        if self.apply_mode == "prefetch":
+            attempted = self._apply_pipelined(job_cards)
+        else:
+            attempted = 0
+            for idx, job in enumerate(job_cards):
                 if self.tracker.has_applied(job['job_id']):
                     self.logger.info(f"⏭️ Already applied to: {job['title']} at {job['company']} (skipping)")
                     continue
-            
-                self.logger.info(f"Opening job #{idx+1}: {job['title']} at {job['company']}")
-                self.driver.get(job['link'])
-                time.sleep(4)
+                self.apply_to_job(job, idx)
+                attempted += 1
 
-                # Find all Easy Apply buttons (yes, there can be multiple with same ID!)
-                all_buttons = self.driver.find_elements(By.XPATH, "//button[@id='jobs-apply-button-id']")
+        if attempted:
+            elapsed = time.monotonic() - started
+            self.logger.info(f"⏱️ {attempted} jobs in {elapsed:.1f}s ({elapsed / attempted:.1f}s per job)")
+        self.logger.info(f"📊 Fields resolved per path this run: {dict(self.answer_sources)}")
+        return attempted
 
-                # Filter only the visible one
-                visible_buttons = [btn for btn in all_buttons if btn.is_displayed()]
-                if not visible_buttons:
-                    self.logger.warning(f"⚠️ No visible Easy Apply button found for: {job['title']}")
+    def _apply_pipelined(self, job_cards):
+        """
+        apply_mode "prefetch": the results page stays in its own tab and the next
+        PREFETCH_DEPTH jobs load in background tabs. Before applying to a job, each
+        upcoming tab is moved on one step without waiting (see _warm_up): once a modal
+        has opened, its first-step answers are requested from Gemini, so that call runs
+        while the browser works through the current form.
+        """
+        results_tab = self.driver.current_window_handle
+        cards = iter(job_cards)
+        queued = []  # (job, tab handle or None), oldest first
+
+        def fill_queue():
+            # The card generator reads the results page, so it must run in the results tab
+            self.driver.switch_to.window(results_tab)
+            while len(queued) < PREFETCH_DEPTH + 1:
+                job = next(cards, None)
+                if job is None:
+                    return
+                if self.tracker.has_applied(job['job_id']):
+                    self.logger.info(f"⏭️ Already applied to: {job['title']} at {job['company']} (skipping)")
                     continue
-                
-                
+                queued.append((job, self._open_in_background_tab(job['link'])))
+
+        attempted = 0
+        fill_queue()
+        while queued:
+            job, tab = queued.pop(0)
+            for upcoming in queued:
+                self._warm_up(*upcoming)
+            if tab is None:
+                self.driver.switch_to.window(results_tab)
+                self.apply_to_job(job, attempted)
+            else:
+                self.driver.switch_to.window(tab)
+                self.apply_to_job(job, attempted, prefetched=True)
+                self.driver.close()
+            attempted += 1
+            fill_queue()
+        self.driver.switch_to.window(results_tab)
+        return attempted
+
+    def _open_in_background_tab(self, url):
+        # window.open doesn't move the driver's focus, and the page loads while we work elsewhere
+        handles = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", "about:blank" if self.lean else url)
+        opened = [handle for handle in self.driver.window_handles if handle not in handles]
+        if not opened:
+            return None
+        if self.lean:
+            # A new tab is a new CDP target: set up blocking there before its page starts loading
+            current = self.driver.current_window_handle
+            self.driver.switch_to.window(opened[0])
+            self._block_assets(self.driver)
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+            self.driver.switch_to.window(current)
+        return opened[0]
+
+    def _warm_up(self, job, tab):
+        """
+        Moves a prefetched job one step towards having its first-step answers requested:
+        clicks Easy Apply once the page has loaded, then, on a later call once the modal
+        has rendered, starts answering its fields in the background. Never waits; a tab
+        that isn't ready is left for the next call (or for apply_to_job).
+        """
+        if tab is None or job['job_id'] in self._warming:
+            return
+        try:
+            self.driver.switch_to.window(tab)
+            if self.driver.execute_script(WARM_UP_SCRIPT) != "modal":
+                return
+            self._warming[job['job_id']] = None  # warmed; nothing to wait for unless answers are requested
+            snapshot = snapshot_fields(self.driver)
+            if SchemaCache.fingerprint(snapshot, self.resume_hash) in self.schema_cache:
+                return  # a known step; handle_easy_apply_modal fills it from the schema cache
+            fields = [{
+                "label": field["label"],
+                "type": field["type"],
+                "options": field["options"],
+                "validation": field["validation"] or constraint_hint(field["constraints"]),
+            } for field in snapshot if not field["filled"]]
+            future = self._prefetch_answers(fields)
+            if future is not None:
+                self._warming[job['job_id']] = future
+                self.logger.info(f"🔮 Answering {job['title']} at {job['company']} ahead of time")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not warm up {job['title']}: {e}")
+
+    def _prefetch_answers(self, fields):
+        # Only fields that neither the rules nor the cache can answer go to Gemini
+        batch_fields, cache_keys = [], {}
+        for idx, field_info in enumerate(fields):
+            option_texts = self._field_option_texts(field_info)
+            if self.answer_rules.resolve(field_info["label"], field_info["type"], option_texts or None,
+                                         field_info["validation"]) is not None:
+                continue
+            cache_key = self._answer_cache_key(field_info, option_texts)
+            if cache_key in self.answer_cache:
+                continue
+            cache_keys[str(idx)] = (cache_key, field_info["label"])
+            batch_fields.append({
+                "id": str(idx),
+                "label": field_info["label"],
+                "input_type": field_info["type"],
+                "options": option_texts,
+                "validation_hint": field_info["validation"],
+            })
+        if not batch_fields:
+            return None
+        prompt = generate_batch_prompt(batch_fields, self.resume_profile)
+        return self.llm.submit(self._answer_batch_into_cache, prompt, cache_keys)
+
+    def _answer_batch_into_cache(self, model, prompt, cache_keys):
+        answers = answer_questions_batch(model, prompt, list(cache_keys))
+        for field_id, answer in answers.items():
+            cache_key, label = cache_keys[field_id]
+            self.answer_cache.put(cache_key, answer, label=label)
+        return answers
+
+    def _visible_apply_button(self):
+        # Find all Easy Apply buttons (yes, there can be multiple with same ID!) and keep the visible one
+        all_buttons = self.driver.find_elements(By.XPATH, "//button[@id='jobs-apply-button-id']")
+        visible_buttons = [btn for btn in all_buttons if btn.is_displayed()]
+        return visible_buttons[0] if visible_buttons else None
+
+    def apply_to_job(self, job: dict, idx: int = 0, prefetched: bool = False):
+        """
+        Opens one job and runs the Easy Apply modal. Returns True if the application was submitted.
 
-                easy_apply_btn = visible_buttons[0]
-                
-                try:
-                    easy_apply_btn.click()
-                    # NEW: Handle modal
-                    if not self.handle_easy_apply_modal():
-                        self.logger.warning(f"⚠️ Skipped job (modal handling failed): {job['title']}")
-                    self.tracker.mark_as_applied(job['job_id'], job['title'], job['company'])
-                except Exception as click_error:
-                    self.logger.warning("Standard click failed, trying JavaScript click. Error: " + str(click_error))
-                    self.driver.execute_script("arguments[0].click();", easy_apply_btn)
+        Args:
+            prefetched (bool): The job is already loaded in the current tab, possibly with its
+                modal open (apply_mode "prefetch").
+        """
+        with self.metrics.span("job", job_id=job['job_id']) as span:
+            submitted = False
+            try:
+                self.logger.info(f"Opening job #{idx+1}: {job['title']} at {job['company']}")
+                opened_in = "prefetch" if prefetched else self.open_job(job)
+                warming = self._warming.pop(job['job_id'], None)
+                if warming is not None:
+                    try:
+                        warming.result(timeout=PREFETCH_ANSWER_TIMEOUT)
+                    except Exception as e:
+                        self.logger.warning(f"⚠️ Answers requested ahead of time failed: {e}")
+
+                # A prefetched tab may have had Easy Apply clicked already (see _warm_up)
+                opening = prefetched and self.driver.execute_script("return !!window.__botApplyClicked;")
+                if not opening and not self.driver.find_elements(By.CLASS_NAME, "jobs-easy-apply-modal"):
+                    if prefetched:
+                        self.waits.until("job_page", EC.presence_of_element_located((By.ID, "jobs-apply-button-id")))
+                    easy_apply_btn = self._visible_apply_button()
+                    if easy_apply_btn is None:
+                        self.logger.warning(f"⚠️ No visible Easy Apply button found for: {job['title']}")
+                        return False
+                    try:
+                        easy_apply_btn.click()
+                    except Exception as click_error:
+                        self.logger.warning("Standard click failed, trying JavaScript click. Error: " + str(click_error))
+                        self.driver.execute_script("arguments[0].click();", easy_apply_btn)
+
+                submitted = self.handle_easy_apply_modal()
+                if not submitted:
+                    self.logger.warning(f"⚠️ Skipped job (modal handling failed): {job['title']}")
+                self.tracker.mark_as_applied(job['job_id'], job['title'], job['company'])
+                if opened_in == "side_panel":
+                    self._close_modal()
 
             except TimeoutException:
                 self.logger.warning(f"⚠️ Timeout waiting for Easy Apply button on: {job['title']}")
             except Exception as e:
                 self.logger.error(f"❌ Error applying to job #{idx+1}: {e}")
+            finally:
+                self.close_job_tab()
+                self.answer_cache.save()
+                self.schema_cache.save()
+            span["submitted"] = submitted
+        return submitted
+
+    def open_job(self, job):
+        """
+        Brings up the job's Easy Apply button: in the results side panel when the search page is
+        loaded and apply_mode allows it, otherwise with a full page load in a tab of its own, so
+        the results page stays loaded for iter_job_cards(). Call close_job_tab() when done.
+
+        Returns:
+            str: "side_panel" or "page", whichever was used.
+        """
+        with self.metrics.span("navigation") as span:
+            calls_before = self.commands.total
+            started = time.monotonic()
+            opened_in = "page"
+            if self.apply_mode == "side_panel" and self.driver.execute_script(OPEN_CARD_SCRIPT, job['job_id']):
+                if self.waits.until("job_panel", detail_pane_shows(job['job_id'])):
+                    opened_in = "side_panel"
+                else:
+                    self.logger.info("↪️ Side panel didn't show the job; falling back to full page navigation.")
+            if opened_in == "page":
+                results_tab = self.driver.current_window_handle
+                tab = self._open_in_background_tab(job['link'])
+                if tab is None:
+                    self.driver.get(job['link'])  # no new tab; iter_job_cards reloads the results page
+                else:
+                    self.driver.switch_to.window(tab)
+                    self._job_tab = (tab, results_tab)
+                self.waits.until("job_page", EC.presence_of_element_located((By.ID, "jobs-apply-button-id")))
+            self.open_timings[opened_in].append(time.monotonic() - started)
+            span["mode"] = opened_in
+            span["driver_calls"] = self.commands.total - calls_before
+            return opened_in
+
+    def close_job_tab(self):
+        """Closes the tab open_job() opened, if any, and returns to the results tab."""
+        if self._job_tab is None:
+            return
+        tab, results_tab = self._job_tab
+        self._job_tab = None
+        try:
+            self.driver.switch_to.window(tab)
+            self.driver.close()
+            self.driver.switch_to.window(results_tab)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not close the job tab: {e}")
+
+    def _close_modal(self):
+        # The results page stays loaded for the next card; if a dialog won't close, have it reloaded instead
+        if self.waits.until("modal_closed", lambda d: d.execute_script(DISMISS_MODAL_SCRIPT) == 0) is None:
+            self.driver.execute_script("window.__botResultsPage = null;")
+
+    def open_timing_summary(self):
+        return {
+            mode: {"count": len(times), "mean_s": round(sum(times) / len(times), 3), "max_s": round(max(times), 3)}
+            for mode, times in self.open_timings.items()
+        }
 
     def close(self):
+        self.logger.info(f"⏱️ Wait timings: {self.waits.summary()}")
+        if "metrics" in self._owned:
+            self.logger.info(f"📈 Span summary: {self.metrics.summary()['phases']}")
+            self.metrics.close()
+        self.logger.info(f"🧭 Job open timings: {self.open_timing_summary()}")
+        if self.step_driver_calls:
+            self.logger.info(f"🔢 Driver calls per modal step: {sum(self.step_driver_calls) / len(self.step_driver_calls):.1f} "
+                             f"over {len(self.step_driver_calls)} steps")
+        self.waits.save()
+        if "answer_cache" in self._owned:
+            self.logger.info(f"💾 Answer cache stats: {self.answer_cache.stats()}")
+            self.answer_cache.save()
+        if "schema_cache" in self._owned:
+            self.logger.info(f"🗂️ Schema cache stats: {self.schema_cache.stats()}")
+            self.schema_cache.save()
+        if "llm" in self._owned:
+            self.logger.info(f"🧠 LLM client stats: {self.llm.stats()}")
+            self.llm.shutdown()
         self.logger.info("Closing browser session.")
+        if "tracker" in self._owned:
+            self.tracker.close()
         self.driver.quit()
@@ -0,0 +1,195 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+# Errors that will fail the same way on every retry (e.g. a blocked response
+# raising ValueError on .text); everything else is treated as transient.
+NON_RETRYABLE_ERRORS = (ValueError, TypeError)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, rate_per_minute, capacity=None):
+        """
+        Thread-safe token bucket.
+
+        Args:
+            rate_per_minute (float): Sustained request rate, i.e. the API quota.
+            capacity (int): Burst size. Defaults to one second's worth, minimum 1.
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or max(1, int(self.rate))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        """
+        Opens after `failure_threshold` consecutive failures and lets a single
+        trial request through once `reset_timeout` seconds have passed.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self):
+        with self.lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+
+
+class LLMClient:
+    def __init__(self, model, fallback_model=None, max_workers=4, requests_per_minute=15,
+                 max_retries=4, base_delay=1.0, max_delay=30.0, failure_threshold=5, reset_timeout=30.0,
+                 metrics=None):
+        """
+        Rate-limited, retrying, concurrent front for gemini_helper calls.
+
+        Args:
+            model: Primary generative model.
+            fallback_model: Used when the primary's circuit is open or its retries are exhausted.
+            max_workers (int): Size of the thread pool used by submit().
+            requests_per_minute (float): Token-bucket rate shared by all workers.
+            max_retries (int): Retries per model after the first attempt.
+            base_delay (float): First backoff delay; doubles each retry, with full jitter.
+            max_delay (float): Backoff ceiling.
+            metrics (Metrics): If set, every model attempt is recorded as an "llm_call" span.
+        """
+        self.models = [("primary", model, CircuitBreaker(failure_threshold, reset_timeout))]
+        if fallback_model is not None:
+            self.models.append(("fallback", fallback_model, CircuitBreaker(failure_threshold, reset_timeout)))
+        self.bucket = TokenBucket(requests_per_minute)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats_lock = threading.Lock()
+        self.counters = {"calls": 0, "succeeded": 0, "failed": 0, "retries": 0, "fallbacks": 0,
+                         "throttled_seconds": 0.0}
+        self.started_at = time.monotonic()
+        self.metrics = metrics
+
+    def _count(self, name, amount=1):
+        with self.stats_lock:
+            self.counters[name] += amount
+
+    def _backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Runs fn(model, *args, **kwargs) against the primary model, then the fallback.
+
+        Raises:
+            CircuitOpenError: If every model's circuit is open.
+            Exception: The last error once all retries on all models are exhausted.
+        """
+        self._count("calls")
+        last_error = None
+        for name, model, breaker in self.models:
+            if name == "fallback":
+                self._count("fallbacks")
+            for attempt in range(self.max_retries + 1):
+                if not breaker.allow():
+                    last_error = last_error or CircuitOpenError(f"{name} model circuit is open")
+                    break
+                self._count("throttled_seconds", self.bucket.acquire())
+                try:
+                    with self._span(name, fn, attempt):
+                        result = fn(model, *args, **kwargs)
+                except NON_RETRYABLE_ERRORS as e:
+                    # The model answered; the answer itself is unusable. Don't trip the breaker.
+                    breaker.record_success()
+                    last_error = e
+                    break
+                except Exception as e:
+                    breaker.record_failure()
+                    last_error = e
+                    if attempt < self.max_retries:
+                        self._count("retries")
+                        time.sleep(self._backoff(attempt))
+                    continue
+                breaker.record_success()
+                self._count("succeeded")
+                return result
+        self._count("failed")
+        raise last_error
+
+    def _span(self, model_name, fn, attempt):
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.span("llm_call", model=model_name, fn=getattr(fn, "__name__", str(fn)), attempt=attempt)
+
+    def submit(self, fn, *args, **kwargs):
+        """Same as call(), on the bounded worker pool. Returns a Future."""
+        if self.metrics is None:
+            return self.executor.submit(self.call, fn, *args, **kwargs)
+        # Carry the caller's span attributes (e.g. job_id) over to the worker thread
+        return self.executor.submit(self._call_in_context, self.metrics.context(), fn, *args, **kwargs)
+
+    def _call_in_context(self, context, fn, *args, **kwargs):
+        with self.metrics.inherit(context):
+            return self.call(fn, *args, **kwargs)
+
+    def stats(self):
+        with self.stats_lock:
+            stats = dict(self.counters)
+        elapsed_min = max(time.monotonic() - self.started_at, 1e-9) / 60
+        stats["throttled_seconds"] = round(stats["throttled_seconds"], 2)
+        stats["succeeded_per_minute"] = round(stats["succeeded"] / elapsed_min, 1)
+        stats["circuits"] = {name: breaker.state for name, _, breaker in self.models}
+        return stats
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,93 @@
+import atexit
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+
+DEFAULT_LOGGER_NAME = "linkedin_bot"
+TEXT_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
+
+_listeners = {}  # logger name -> running QueueListener
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, thread and message (plus the traceback, if any)."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _gzip_namer(name):
+    return name + ".gz"
+
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def setup_logging(name=DEFAULT_LOGGER_NAME, log_file="bot.log", max_bytes=5 * 2 ** 20, backup_count=10,
+                  when=None, json_format=False, level=logging.INFO):
+    """
+    Routes the logger through a QueueHandler, so a log call only enqueues the
+    record; a QueueListener thread formats and writes it. The file is appended
+    to across runs and rotated, with rotated files gzip-compressed.
+
+    Calling it again for the same logger returns it unchanged, so the first
+    caller (e.g. main.py with config settings) decides the configuration.
+
+    Args:
+        log_file (str): Active log file.
+        max_bytes (int): Rotate once the file exceeds this size (ignored when `when` is set).
+        backup_count (int): Compressed archives kept.
+        when (str): Time-based rotation instead, e.g. "midnight" or "H" (see TimedRotatingFileHandler).
+        json_format (bool): Write JSON lines instead of text.
+    """
+    logger = logging.getLogger(name)
+    if name in _listeners:
+        return logger
+
+    if when:
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_file, when=when, backupCount=backup_count, encoding="utf-8")
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    file_handler.namer = _gzip_namer
+    file_handler.rotator = _gzip_rotator
+    file_handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    atexit.register(stop_logging, name)
+
+    logger.handlers.clear()  # Clear existing handlers to avoid duplicate logs
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def stop_logging(name=DEFAULT_LOGGER_NAME):
+    """Flushes queued records to disk and stops the listener thread."""
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -1,7 +1,12 @@
 from linkedin_bot import LinkedInBot
 import os
 from dotenv import load_dotenv
-from config_loader import load_config
+from config_loader import load_config, get_bot_settings, get_resume_profile
+from gemini_prompter import ResumeProfile
+from worker_pool import WorkerPool
+from job_ranker import JobRanker
+from log_setup import setup_logging
+from search_planner import SearchPlanner
 
 
 # Load LinkedIn credentials
@@ -10,21 +15,43 @@ EMAIL = os.getenv("LINKEDIN_EMAIL")
 PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 
 config = load_config()
-resume_context = config 
+settings = get_bot_settings(config)
+# Compiled once for every bot; with resume_top_k, prompts carry only the resume snippets relevant to each field
+resume_profile = ResumeProfile(get_resume_profile(config), top_k=settings.get("resume_top_k"))
+resume_context = resume_profile.context
+# Before any bot is created, so it picks up these settings (rotation, JSON lines)
+setup_logging(**settings.get("logging", {}))
+max_jobs = settings.get("max_jobs", 10)
+# Best-first ordering of the collected cards; anything under the cutoff is never opened
+job_ranker = JobRanker(resume_context, min_score=settings.get("min_job_score", 0.0))
+apply_mode = settings.get("apply_mode", "side_panel")
+# Titles x locations x filters from config, best first; stops once max_jobs have been attempted
+planner = SearchPlanner.from_config(config)
+lean = settings.get("lean_browser", False)
 
+if settings.get("workers", 1) > 1:
+    # Several browsers applying in parallel from one shared queue
+    pool = WorkerPool(
+        resume_profile,
+        workers=settings["workers"],
+        pacing_seconds=settings.get("worker_pacing_seconds", 0),
+        tracker_backend=settings.get("tracker_backend", "jsonl"),
+        job_ranker=job_ranker,
+        bot_kwargs={"apply_mode": apply_mode, "lean": lean},
+    )
+    print(pool.run(EMAIL, PASSWORD, max_jobs=max_jobs, planner=planner))
+else:
+    # Step 2: Pass resume_text into the bot
+    bot = LinkedInBot(headless=False, timeout=15, resume_context=resume_profile,
+                      tracker_backend=settings.get("tracker_backend", "jsonl"), job_ranker=job_ranker,
+                      apply_mode=apply_mode, lean=lean, profile_dir=settings.get("profile_dir"))
 
-# Step 2: Pass resume_text into the bot
-bot = LinkedInBot(headless=False, timeout=15, resume_context=resume_context)
+    # Step 3: Run the bot
+    try:
+        bot.login(EMAIL, PASSWORD)
 
-# Step 3: Run the bot
-try:
-    bot.login(EMAIL, PASSWORD)
-    bot.search_jobs(config["job_title"], config["location"])
-    jobs = bot.collect_job_cards(max_jobs=10)
-
-    if jobs:
-        bot.apply_to_jobs(jobs)
-    else:
-        print("No jobs found to apply.")
-finally:
-    bot.close()
+        # Start applying on the first card while later result pages and queries are still to be read
+        if not bot.apply_to_jobs(bot.iter_ranked_job_cards(max_jobs=max_jobs, cards=planner.iter_job_cards(bot))):
+            print("No jobs found to apply.")
+    finally:
+        bot.close()
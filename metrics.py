@@ -0,0 +1,188 @@
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted, non-empty list (fraction in 0..1)."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Metrics:
+    def __init__(self, path="metrics.jsonl", prometheus_path="metrics.prom", summary_path="metrics_summary.json",
+                 run_id=None, max_bytes=10 * 2 ** 20):
+        """
+        Span recorder. Every finished span is appended to `path` as one JSON line;
+        close() writes the per-phase summary as Prometheus text and as JSON.
+
+        Spans nest per thread: a child records its parent's name and inherits its
+        attributes (e.g. job_id), so LLM calls and modal steps can be attributed to
+        the job they ran for.
+
+        Args:
+            path (str): JSON lines file spans are appended to (None to keep them in memory only).
+            prometheus_path (str): Summary in Prometheus text exposition format, written by close().
+            summary_path (str): Summary as JSON, written by close().
+            run_id (str): Tags every span of this run; random by default.
+            max_bytes (int): Once `path` grows past this, it is moved to `path`.1 (replacing the
+                previous one) and a new file is started, so the log never takes more than twice this.
+        """
+        self.path = path
+        self.prometheus_path = prometheus_path
+        self.summary_path = summary_path
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.max_bytes = max_bytes
+        self.durations = defaultdict(list)
+        self.driver_calls = defaultdict(list)  # span name -> WebDriver calls, for spans that count them
+        self.job_totals = defaultdict(lambda: defaultdict(float))  # job_id -> phase -> seconds
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            self._open()
+
+    def _open(self):
+        if self.max_bytes and os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+            os.replace(self.path, self.path + ".1")
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def context(self):
+        """Attributes of the innermost open span on this thread, to hand to another thread."""
+        stack = self._stack()
+        return dict(stack[-1]["attrs"]) if stack else {}
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """
+        Times the block as span `name`. Yields the span's attribute dict, so values
+        only known inside the block can still be attached.
+        """
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        inherited = dict(parent["attrs"]) if parent else getattr(self._local, "inherited", {})
+        record = {"name": name, "attrs": {**inherited, **attrs}}
+        stack.append(record)
+        started_at = time.time()
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield record["attrs"]
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            stack.pop()
+            self._record({
+                "run_id": self.run_id,
+                "span": name,
+                "parent": parent["name"] if parent else None,
+                "start": round(started_at, 3),
+                "duration_s": round(duration, 4),
+                "status": status,
+                **record["attrs"],
+            })
+
+    @contextmanager
+    def inherit(self, attrs):
+        """Makes top-level spans on this thread carry `attrs` (see context())."""
+        previous = getattr(self._local, "inherited", {})
+        self._local.inherited = attrs or {}
+        try:
+            yield
+        finally:
+            self._local.inherited = previous
+
+    def _record(self, entry):
+        with self._lock:
+            self.durations[entry["span"]].append(entry["duration_s"])
+            if isinstance(entry.get("driver_calls"), int):
+                self.driver_calls[entry["span"]].append(entry["driver_calls"])
+            if entry.get("job_id"):
+                self.job_totals[entry["job_id"]][entry["span"]] += entry["duration_s"]
+            if self._file:
+                self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+                self._file.flush()
+                if self.max_bytes and self._file.tell() >= self.max_bytes:
+                    self._file.close()
+                    self._open()
+
+    def summary(self):
+        """
+        p50/p95 per span name (plus WebDriver calls per span for spans that count them),
+        and per-job seconds by span name.
+        """
+        with self._lock:
+            phases = {}
+            for name, durations in self.durations.items():
+                ordered = sorted(durations)
+                phases[name] = {
+                    "count": len(ordered),
+                    "total_s": round(sum(ordered), 3),
+                    "p50_s": round(percentile(ordered, 0.50), 3),
+                    "p95_s": round(percentile(ordered, 0.95), 3),
+                    "max_s": round(ordered[-1], 3),
+                }
+                calls = self.driver_calls.get(name)
+                if calls:
+                    phases[name]["driver_calls_per_call"] = round(sum(calls) / len(calls), 1)
+            jobs = {job_id: {name: round(seconds, 3) for name, seconds in totals.items()}
+                    for job_id, totals in self.job_totals.items()}
+        return {"run_id": self.run_id, "phases": phases, "jobs": jobs}
+
+    def prometheus_text(self):
+        summary = self.summary()
+        lines = [
+            "# HELP bot_span_seconds Duration of bot phases.",
+            "# TYPE bot_span_seconds summary",
+        ]
+        for name, stats in sorted(summary["phases"].items()):
+            labels = f'phase="{name}",run_id="{summary["run_id"]}"'
+            lines.append(f'bot_span_seconds{{{labels},quantile="0.5"}} {stats["p50_s"]}')
+            lines.append(f'bot_span_seconds{{{labels},quantile="0.95"}} {stats["p95_s"]}')
+            lines.append(f"bot_span_seconds_sum{{{labels}}} {stats['total_s']}")
+            lines.append(f"bot_span_seconds_count{{{labels}}} {stats['count']}")
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        for path, content in ((self.prometheus_path, self.prometheus_text()),
+                              (self.summary_path, json.dumps(self.summary(), indent=2))):
+            if not path:
+                continue
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+
+def traced(name):
+    """
+    Method decorator: runs the method inside a `name` span on `self.metrics`. If `self`
+    has a CommandCounter as `self.commands`, the span also records its WebDriver calls.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            commands = getattr(self, "commands", None)
+            with self.metrics.span(name) as span:
+                calls_before = commands.total if commands is not None else 0
+                try:
+                    return method(self, *args, **kwargs)
+                finally:
+                    if commands is not None:
+                        span["driver_calls"] = commands.total - calls_before
+        return wrapper
+    return decorator
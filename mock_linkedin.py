@@ -0,0 +1,420 @@
+# mock_linkedin.py
+#
+# A small local stand-in for the parts of LinkedIn the bot touches: login,
+# job search results and multi-step Easy Apply modals. Markup mirrors the
+# selectors LinkedInBot uses so the bot can run end to end offline.
+# Usage: python mock_linkedin.py [port]
+
+import html
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PAGE_SIZE = 25
+
+TITLES = ["Data Engineer", "Senior Data Engineer", "ETL Developer", "Big Data Engineer", "Analytics Engineer",
+          "Python Developer", "Cloud Data Engineer", "Data Platform Engineer", "Java Developer", "UX Designer"]
+COMPANIES = ["Acme Analytics", "Globex", "Initech", "Umbrella Data", "Stark Cloud", "Wayne Systems", "Hooli"]
+CITIES = ["Bangalore, Karnataka, India", "Pune, Maharashtra, India", "Gurgaon, Haryana, India",
+          "Noida, Uttar Pradesh, India", "Mumbai, Maharashtra, India", "Chennai, Tamil Nadu, India"]
+
+NUMERIC_HINT = "Enter a decimal number larger than 0.0"
+
+# Easy Apply question sets. Jobs cycle through them, like ATS templates reused across postings.
+FORM_SCHEMAS = [
+    [
+        {"title": "Contact info", "fields": [
+            {"kind": "text", "label": "Mobile phone number", "value": "9999999999"},
+            {"kind": "select", "label": "Email address", "options": ["candidate@example.com"], "selected": 1},
+        ]},
+        {"title": "Additional Questions", "fields": [
+            {"kind": "text", "label": "How many years of work experience do you have with Python?", "numeric": True},
+            {"kind": "text", "label": "What's your current CTC?", "numeric": True},
+            {"kind": "select", "label": "What is your level of proficiency in English?",
+             "options": ["None", "Conversational", "Professional", "Native or bilingual"]},
+            {"kind": "radio", "label": "Are you willing to relocate?", "options": ["Yes", "No"]},
+        ]},
+    ],
+    [
+        {"title": "Contact info", "fields": [
+            {"kind": "text", "label": "Mobile phone number", "value": "9999999999"},
+        ]},
+        {"title": "Additional Questions", "fields": [
+            {"kind": "text", "label": "How many years of work experience do you have with SQL?", "numeric": True},
+            {"kind": "text", "label": "Notice period (in days)", "numeric": True},
+            {"kind": "radio", "label": "Do you have a valid work permit for India?", "options": ["Yes", "No"]},
+        ]},
+        {"title": "Work preferences", "fields": [
+            {"kind": "select", "label": "Preferred location", "options": ["Mumbai", "Pune", "Bangalore"]},
+            {"kind": "textarea", "label": "Summarise your most relevant project"},
+        ]},
+    ],
+    [
+        {"title": "Additional Questions", "fields": [
+            {"kind": "text", "label": "How many years of work experience do you have with AWS Glue?", "numeric": True},
+            {"kind": "text", "label": "What's your expected CTC?", "numeric": True},
+            {"kind": "radio", "label": "Are you comfortable working in a hybrid setting?", "options": ["Yes", "No"]},
+        ]},
+    ],
+]
+
+
+def build_catalog(job_count, seed=7):
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(job_count):
+        jobs.append({
+            "job_id": str(4100000000 + i),
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(CITIES),
+            "posted": f"{rng.randint(1, 28)} days ago",
+            "applicants": f"{rng.randint(1, 200)} applicants",
+            "description": "We are hiring. Skills: " + ", ".join(rng.sample(
+                ["Python", "SQL", "AWS", "Glue", "Redshift", "Spark", "Kafka", "Airflow", "Java", "Figma"], 4)),
+            "schema": i % len(FORM_SCHEMAS),
+        })
+    return jobs
+
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body>{body}</body></html>"""
+
+LOGIN_BODY = """
+<form method="post" action="/login">
+  <input id="username" name="username" type="text">
+  <input id="password" name="password" type="password">
+  <input id="rememberMeOptIn-checkbox" type="checkbox" checked>
+  <button type="submit">Sign in</button>
+</form>"""
+
+CARD = """
+<div class="job-card-container job-card-list" data-job-id="{job_id}">
+    <a class="job-card-container__link job-card-list__title" href="/jobs/view/{job_id}/?trk=mock">
+      <span><strong>{title}</strong></span>
+    </a>
+    <div class="artdeco-entity-lockup__subtitle"><span>{company}</span></div>
+    <ul class="job-card-container__metadata-wrapper"><li>{location}</li></ul>
+    <ul class="job-card-list__footer-wrapper">
+      <li class="job-card-container__footer-item">Easy Apply</li>
+      <li><time>{posted}</time></li>
+      <li class="job-card-container__applicant-count">{applicants}</li>
+    </ul>
+</div>"""
+
+# Like LinkedIn, only list items near the viewport get their card markup rendered
+LAZY_LIST_SCRIPT = """
+<script>
+const observer = new IntersectionObserver(entries => entries.forEach(entry => {
+  if (entry.isIntersecting && !entry.target.firstElementChild) {
+    entry.target.innerHTML = entry.target.dataset.card;
+  }
+}), { root: document.querySelector('.jobs-search-results-list'), rootMargin: '200px' });
+document.querySelectorAll('li[data-occludable-job-id]').forEach(li => observer.observe(li));
+</script>"""
+
+# Clicking a card loads the job into the detail pane without leaving the results page
+PANEL_SCRIPT = """
+<script>
+document.querySelector('.jobs-search-results-list').addEventListener('click', event => {
+  const card = event.target.closest('.job-card-container');
+  if (!card) return;
+  event.preventDefault();
+  fetch('/jobs/view/' + card.dataset.jobId + '/?fragment=1').then(r => r.text()).then(markup => {
+    const pane = document.querySelector('.jobs-search__job-details');
+    pane.innerHTML = markup;
+    pane.querySelectorAll('script').forEach(old => {
+      const script = document.createElement('script');
+      script.textContent = old.textContent;
+      old.replaceWith(script);
+    });
+  });
+});
+</script>"""
+
+JOB_BODY = """
+<div class="jobs-details" data-job-id="{job_id}">
+  <h1 class="job-details-jobs-unified-top-card__job-title">{title}</h1>
+  <div class="job-details-jobs-unified-top-card__company-name">{company}</div>
+  <div class="jobs-description__content">{description}</div>
+  <button id="jobs-apply-button-id" class="jobs-apply-button" type="button">Easy Apply</button>
+</div>
+<div id="modal-root"></div>
+<script>
+(() => {{  // scoped, so the search page's side panel can load one job after another
+const JOB_ID = {job_id_json};
+const STEPS = {steps_json};
+const NUMERIC_HINT = {hint_json};
+const DISMISS = '<button class="artdeco-modal__dismiss" aria-label="Dismiss" type="button">×</button>';
+let stepIndex = 0;
+const answers = {{}};
+
+// Numeric questions get LinkedIn's "-numeric" id suffix, the only markup that tells them apart
+function fieldId(s, f, field) {{ return 'fe-' + s + '-' + f + (field.numeric ? '-numeric' : ''); }}
+
+function renderField(field, id) {{
+  const esc = t => String(t).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/"/g, '&quot;');
+  if (field.kind === 'radio') {{
+    return '<fieldset data-test-form-builder-radio-button-form-component="true" id="' + id + '">' +
+      '<legend>' + esc(field.label) + '</legend>' +
+      field.options.map((o, i) => '<input type="radio" required name="' + id + '" id="' + id + '-' + i +
+        '" value="' + esc(o) + '"><label for="' + id + '-' + i + '">' + esc(o) + '</label>').join('') +
+      '<div class="feedback" id="' + id + '-error"></div></fieldset>';
+  }}
+  let control;
+  if (field.kind === 'select') {{
+    control = '<select id="' + id + '" required aria-describedby="' + id + '-error"><option>Select an option</option>' +
+      field.options.map(o => '<option>' + esc(o) + '</option>').join('') + '</select>';
+  }} else if (field.kind === 'textarea') {{
+    control = '<textarea id="' + id + '" required aria-describedby="' + id + '-error"></textarea>';
+  }} else {{
+    control = '<input id="' + id + '" type="text" required aria-describedby="' + id + '-error"' +
+      (field.value ? ' value="' + esc(field.value) + '"' : '') + '>';
+  }}
+  return '<div id="formElement-' + id + '" class="fb-dash-form-element"><label for="' + id + '">' +
+    esc(field.label) + '</label>' + control + '<div id="' + id + '-error"></div></div>';
+}}
+
+function setError(id, message) {{
+  const el = document.getElementById(id);
+  const box = document.getElementById(id + '-error');
+  if (message) {{
+    if (el.tagName !== 'FIELDSET') el.classList.add('fb-dash-form-element__error-field');
+    box.innerHTML = '<div class="artdeco-inline-feedback artdeco-inline-feedback--error">' +
+      '<span class="artdeco-inline-feedback__message">' + message + '</span></div>';
+  }} else {{
+    el.classList.remove('fb-dash-form-element__error-field');
+    box.innerHTML = '';
+  }}
+}}
+
+function validate(field, id, submitting) {{
+  const el = document.getElementById(id);
+  let value;
+  if (field.kind === 'radio') {{
+    const checked = el.querySelector('input:checked');
+    value = checked ? checked.value : '';
+  }} else if (field.kind === 'select') {{
+    value = el.selectedIndex > 0 ? el.options[el.selectedIndex].text : '';
+  }} else {{
+    value = el.value.trim();
+  }}
+  let message = '';
+  if (field.numeric && value && !(parseFloat(value) > 0 && /^\\d+(\\.\\d+)?$/.test(value))) message = NUMERIC_HINT;
+  else if (!value && submitting) message = 'Please enter a valid answer';
+  setError(id, message);
+  if (!message) answers[field.label] = value;
+  return !message;
+}}
+
+function render() {{
+  const root = document.getElementById('modal-root');
+  const last = stepIndex === STEPS.length - 1;
+  if (stepIndex >= STEPS.length) {{
+    root.innerHTML = '<div class="jobs-easy-apply-modal artdeco-modal" role="dialog">' +
+      '<h3>Review your application</h3><progress value="100" max="100"></progress>' +
+      '<input type="checkbox" id="follow-company-checkbox" checked><label for="follow-company-checkbox">Follow</label>' +
+      '<footer><button aria-label="Submit application" type="button">Submit application</button></footer>' + DISMISS + '</div>';
+    root.querySelector('footer button').onclick = submit;
+    root.querySelector('.artdeco-modal__dismiss').onclick = dismiss;
+    return;
+  }}
+  const step = STEPS[stepIndex];
+  const progress = Math.round(100 * stepIndex / (STEPS.length + 1));
+  const button = last ? '<button aria-label="Review your application" type="button">Review</button>'
+                      : '<button aria-label="Continue to next step" type="button">Next</button>';
+  root.innerHTML = '<div class="jobs-easy-apply-modal artdeco-modal" role="dialog"><h3>' + step.title + '</h3>' +
+    '<progress value="' + progress + '" max="100"></progress><form>' +
+    step.fields.map((f, i) => renderField(f, fieldId(stepIndex, i, f))).join('') +
+    '</form><footer>' + button + '</footer>' + DISMISS + '</div>';
+  step.fields.forEach((f, i) => {{
+    const id = fieldId(stepIndex, i, f);
+    const el = document.getElementById(id);
+    if (f.kind === 'select' && f.selected) el.selectedIndex = f.selected;
+    el.addEventListener('input', () => validate(f, id, false));
+    el.addEventListener('change', () => validate(f, id, false));
+  }});
+  root.querySelector('.artdeco-modal__dismiss').onclick = dismiss;
+  root.querySelector('footer button').onclick = () => {{
+    const ok = step.fields.map((f, i) => validate(f, fieldId(stepIndex, i, f), true)).every(Boolean);
+    if (ok) {{ stepIndex += 1; setTimeout(render, {step_delay_ms}); }}
+  }};
+}}
+
+function submit() {{
+  fetch('/api/apply/' + JOB_ID, {{method: 'POST', body: JSON.stringify(answers)}}).then(() => {{
+    document.getElementById('modal-root').innerHTML =
+      '<div class="artdeco-modal" role="dialog"><h2>Your application was sent</h2>' + DISMISS + '</div>';
+    document.querySelector('#modal-root .artdeco-modal__dismiss').onclick = dismiss;
+  }});
+}}
+
+function dismiss() {{ document.getElementById('modal-root').innerHTML = ''; }}
+
+document.getElementById('jobs-apply-button-id').onclick = () => {{ stepIndex = 0; render(); }};
+}})();
+</script>"""
+
+
+class MockLinkedIn:
+    def __init__(self, job_count=60, port=0, latency=0.0, step_delay_ms=150, lazy_cards=True, seed=7):
+        """
+        Args:
+            job_count (int): Jobs in the search results, served PAGE_SIZE per page.
+            lazy_cards (bool): Render card markup only when the list item scrolls into view.
+            port (int): 0 picks a free port; see base_url.
+            latency (float): Seconds added to every HTTP response.
+            step_delay_ms (int): Delay before the next modal step renders, like LinkedIn's transitions.
+        """
+        self.jobs = build_catalog(job_count, seed)
+        self.jobs_by_id = {job["job_id"]: job for job in self.jobs}
+        self.latency = latency
+        self.step_delay_ms = step_delay_ms
+        self.lazy_cards = lazy_cards
+        self.submissions = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def search_page(self, query):
+        start = int(query.get("start", ["0"])[0] or 0)
+        cards = self.jobs[start:start + PAGE_SIZE]
+        pages = (len(self.jobs) + PAGE_SIZE - 1) // PAGE_SIZE
+        current = start // PAGE_SIZE + 1
+        pagination = "".join(
+            f'<li data-test-pagination-page-btn="{p}" class="artdeco-pagination__indicator'
+            f'{" active selected" if p == current else ""}"><button aria-label="Page {p}" type="button">{p}</button></li>'
+            for p in range(1, pages + 1)
+        )
+        items = []
+        for job in cards:
+            card = CARD.format(**{k: html.escape(str(v)) for k, v in job.items()})
+            if self.lazy_cards:
+                items.append(f'<li class="scaffold-layout__list-item" style="height: 120px" '
+                             f'data-occludable-job-id="{job["job_id"]}" data-card="{html.escape(card)}"></li>')
+            else:
+                items.append(f'<li class="scaffold-layout__list-item" data-occludable-job-id="{job["job_id"]}">{card}</li>')
+        body = (
+            '<div class="scaffold-layout__list jobs-search-results-list" style="height: 600px; overflow-y: auto">'
+            '<ul class="scaffold-layout__list-container">' + "".join(items) + '</ul>'
+            f'<ul class="artdeco-pagination__pages">{pagination}</ul></div>'
+            '<div class="jobs-search__job-details"></div>'
+            + PANEL_SCRIPT
+            + (LAZY_LIST_SCRIPT if self.lazy_cards else "")
+        )
+        return PAGE.format(title="Jobs", body=body)
+
+    def job_page(self, job, fragment=False):
+        """The job's page, or just its detail markup for the search page's side panel."""
+        body = JOB_BODY.format(
+            job_id=html.escape(job["job_id"]),
+            title=html.escape(job["title"]),
+            company=html.escape(job["company"]),
+            description=html.escape(job["description"]),
+            job_id_json=json.dumps(job["job_id"]),
+            steps_json=json.dumps(FORM_SCHEMAS[job["schema"]]),
+            hint_json=json.dumps(NUMERIC_HINT),
+            step_delay_ms=self.step_delay_ms,
+        )
+        if fragment:
+            return body
+        return PAGE.format(title=html.escape(job["title"]), body=body)
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body="", content_type="text/html; charset=utf-8", headers=None):
+                if mock.latency:
+                    time.sleep(mock.latency)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with mock.lock:
+                    mock.requests += 1
+                url = urlparse(self.path)
+                parts = [p for p in url.path.split("/") if p]
+                signed_in = "li_at=" in (self.headers.get("Cookie") or "")
+                if url.path == "/login":
+                    if signed_in:
+                        self._send(303, headers={"Location": "/feed/"})
+                    else:
+                        self._send(200, PAGE.format(title="Login", body=LOGIN_BODY))
+                elif parts[:1] == ["feed"]:
+                    if signed_in:
+                        self._send(200, PAGE.format(title="Feed", body="<main class='feed'>Feed</main>"))
+                    else:
+                        self._send(303, headers={"Location": "/login"})
+                elif parts[:2] == ["jobs", "search"]:
+                    self._send(200, mock.search_page(parse_qs(url.query)))
+                elif parts[:2] == ["jobs", "view"] and len(parts) > 2 and parts[2] in mock.jobs_by_id:
+                    fragment = "fragment" in parse_qs(url.query)
+                    self._send(200, mock.job_page(mock.jobs_by_id[parts[2]], fragment=fragment))
+                elif url.path == "/api/stats":
+                    with mock.lock:
+                        stats = {"requests": mock.requests, "submissions": dict(mock.submissions)}
+                    self._send(200, json.dumps(stats), "application/json")
+                else:
+                    self._send(404, PAGE.format(title="Not found", body="Not found"))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                url = urlparse(self.path)
+                parts = [p for p in url.path.split("/") if p]
+                if url.path == "/login":
+                    self._send(303, headers={"Location": "/feed/", "Set-Cookie": "li_at=mock-session; Path=/; Max-Age=2592000"})
+                elif parts[:2] == ["api", "apply"] and len(parts) > 2:
+                    with mock.lock:
+                        mock.submissions[parts[2]] = mock.submissions.get(parts[2], 0) + 1
+                    self._send(200, "{}", "application/json")
+                else:
+                    self._send(404)
+
+        return Handler
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    with MockLinkedIn(port=port) as site:
+        print(f"Mock LinkedIn running at {site.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,78 @@
+from bm25 import BM25Index, tokenize
+
+# Always sent, whatever the question: short facts most answers lean on
+PINNED_KEYS = ("job_title", "location")
+# Tokens are cut to this many characters, a crude stemmer so "relocate" finds "relocation"
+STEM_LENGTH = 6
+
+
+def _stems(text):
+    return [token[:STEM_LENGTH] for token in tokenize(text)]
+
+
+def _join(value):
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def resume_snippets(resume_context):
+    """
+    Splits the resume context into (key, text) snippets small enough to retrieve
+    one at a time: one per scalar or list field, one per experience/education
+    entry, and one per project when an entry maps names to bullet lists.
+    """
+    snippets = []
+    for key, value in resume_context.items():
+        label = key.replace("_", " ").capitalize()
+        if isinstance(value, list) and value and all(isinstance(i, dict) for i in value):
+            for idx, entry in enumerate(value, 1):
+                if all(isinstance(v, list) for v in entry.values()):
+                    for name, bullets in entry.items():
+                        snippets.append((key, f"{label} - {name}: " + "; ".join(str(b) for b in bullets)))
+                else:
+                    snippets.append((key, f"{label} #{idx}: " + "; ".join(
+                        f"{k.capitalize()}: {_join(v)}" for k, v in entry.items())))
+        elif isinstance(value, dict):
+            for name, inner in value.items():
+                snippets.append((key, f"{label} - {name.capitalize()}: {_join(inner)}"))
+        else:
+            snippets.append((key, f"{label}: {_join(value)}"))
+    return snippets
+
+
+class ResumeRetriever:
+    def __init__(self, resume_context, top_k=4, pinned_keys=PINNED_KEYS):
+        """
+        BM25 index over resume snippets, so a prompt carries only the parts of the
+        resume relevant to its field instead of the whole summary.
+
+        Args:
+            top_k (int): Snippets retrieved per field, on top of the pinned ones.
+            pinned_keys (tuple): Resume keys always included.
+        """
+        self.top_k = top_k
+        self.snippets = resume_snippets(resume_context)
+        self.pinned = [i for i, (key, _) in enumerate(self.snippets) if key in pinned_keys]
+        self.index = BM25Index()
+        for key, text in self.snippets:
+            # The key is indexed too: "Expected CTC" has to find expected_salary by name alone
+            self.index.add(_stems(key.replace("_", " ")) + _stems(text))
+
+    def retrieve(self, query):
+        """Snippet ids for one field's query text, best first; empty when nothing matches."""
+        return [doc_id for doc_id, _ in self.index.top_k(_stems(query), self.top_k)]
+
+    def context_for(self, queries):
+        """
+        Resume text for a prompt covering `queries` (one per field): pinned snippets
+        plus each query's top matches, in resume order. None if some query matched
+        nothing, in which case the caller should fall back to the full summary.
+        """
+        selected = set(self.pinned)
+        for query in queries:
+            hits = self.retrieve(query)
+            if not hits:
+                return None
+            selected.update(hits)
+        return "\n".join(self.snippets[i][1] for i in sorted(selected))
@@ -0,0 +1,31 @@
+import hashlib
+import json
+
+from answer_cache import AnswerCache, normalize_label
+
+
+class SchemaCache(AnswerCache):
+    def __init__(self, path="schema_cache.json", max_entries=500, ttl_seconds=30 * 24 * 3600,
+                 config_path="config.json"):
+        """
+        On-disk cache of whole Easy Apply steps: a fingerprint of the step's field
+        structure maps to the answers that went through a successful submission.
+        Companies and ATS templates reuse question sets across postings, so a
+        known step can be filled without asking Gemini or probing validation.
+
+        Entries are lists with one answer per field of the step, in page order;
+        None marks a field the form had already filled in. Same LRU/TTL and
+        config-change rules as AnswerCache.
+        """
+        super().__init__(path, max_entries=max_entries, ttl_seconds=ttl_seconds, config_path=config_path)
+
+    @staticmethod
+    def fingerprint(fields, resume_hash=""):
+        """Hash of the step's labels, types and option sets (as read by snapshot_fields), in page order."""
+        structure = [
+            [normalize_label(f["label"]), f["tag"], (f["type"] or "").lower(),
+             sorted(normalize_label(o) for o in f["options"])]
+            for f in fields
+        ]
+        payload = json.dumps([structure, resume_hash], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
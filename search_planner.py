@@ -0,0 +1,133 @@
+import itertools
+import json
+import os
+import time
+
+# LinkedIn search filter values
+DATE_POSTED = {"day": "r86400", "week": "r604800", "month": "r2592000"}
+EXPERIENCE_LEVELS = {"internship": "1", "entry": "2", "associate": "3", "mid_senior": "4", "director": "5",
+                     "executive": "6"}
+
+
+def filter_params(filters):
+    """Maps planner filters ({"date_posted": "week", "experience": ["entry"]}) to search URL parameters."""
+    params = {}
+    filters = filters or {}
+    if filters.get("date_posted"):
+        params["f_TPR"] = DATE_POSTED[filters["date_posted"]]
+    if filters.get("experience"):
+        params["f_E"] = ",".join(EXPERIENCE_LEVELS[level] for level in filters["experience"])
+    return params
+
+
+def query_key(query):
+    return json.dumps([query["title"].lower(), query["location"].lower(), query["filters"]], sort_keys=True)
+
+
+class SearchPlanner:
+    def __init__(self, titles, locations, filters=None, geo_ids=None, cache_path="search_cache.json",
+                 exhausted_ttl=12 * 3600):
+        """
+        Expands titles x locations x filters into search queries and runs them in
+        priority order until enough jobs have been handed out.
+
+        Lists are in priority order: a query's priority is the sum of its title,
+        location and filter positions, so the first title in the first location
+        runs first and later combinations interleave fairly.
+
+        Args:
+            titles (list): Job titles to search for.
+            locations (list): Locations to search in.
+            filters (list): Filter sets to try per title/location, e.g. [{"date_posted": "week"}, {}].
+            geo_ids (dict): Location -> LinkedIn geoId, for locations whose text LinkedIn resolves badly.
+            cache_path (str): JSON file of queries that recently returned no new jobs.
+            exhausted_ttl (float): Seconds an exhausted query is skipped for.
+        """
+        self.titles = list(titles)
+        self.locations = list(locations)
+        self.filters = list(filters or [{}])
+        self.geo_ids = geo_ids or {}
+        self.cache_path = cache_path
+        self.exhausted_ttl = exhausted_ttl
+        self.exhausted = self._load_cache()
+        self.seen = set()
+        self.query_stats = []
+
+    @classmethod
+    def from_config(cls, config, **kwargs):
+        """
+        Builds a planner from the "search" block of the bot settings, falling back to
+        config's job_title and its location_preference cities plus location.
+        """
+        search = config.get("bot", {}).get("search", {})
+        locations = search.get("locations") or list(dict.fromkeys(
+            config.get("location_preference", []) + [config.get("location", "")]))
+        return cls(
+            titles=search.get("titles") or [config["job_title"]],
+            locations=[location for location in locations if location],
+            filters=search.get("filters"),
+            geo_ids=search.get("geo_ids"),
+            **kwargs,
+        )
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            try:
+                exhausted = json.load(f)
+            except json.JSONDecodeError:
+                return {}
+        now = time.time()
+        return {key: at for key, at in exhausted.items() if now - at < self.exhausted_ttl}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.exhausted, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def plan(self):
+        """All queries, highest priority first, with exhausted ones left out."""
+        combos = itertools.product(enumerate(self.titles), enumerate(self.locations), enumerate(self.filters))
+        ranked = sorted(combos, key=lambda combo: (combo[0][0] + combo[1][0] + combo[2][0], combo[0][0], combo[1][0]))
+        queries = []
+        for (_, title), (_, location), (_, filters) in ranked:
+            query = {"title": title, "location": location, "filters": filters,
+                     "geo_id": self.geo_ids.get(location)}
+            if query_key(query) not in self.exhausted:
+                queries.append(query)
+        return queries
+
+    def record(self, query, new_jobs):
+        """Marks a query exhausted when a full run of it found nothing new, and forgets it otherwise."""
+        key = query_key(query)
+        if new_jobs:
+            self.exhausted.pop(key, None)
+        else:
+            self.exhausted[key] = time.time()
+        self._save_cache()
+
+    def iter_job_cards(self, bot, max_pages=None):
+        """
+        Runs each planned query on `bot` and yields cards not seen in an earlier
+        query. Stops when the consumer stops pulling, e.g. once it has enough.
+        """
+        for query in self.plan():
+            bot.search_jobs(query["title"], query["location"], filters=query["filters"], geo_id=query["geo_id"])
+            new_jobs = 0
+            cards = bot.iter_job_cards() if max_pages is None else bot.iter_job_cards(max_pages=max_pages)
+            for card in cards:
+                key = card["job_id"] or card["link"]
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+                new_jobs += 1
+                yield card
+            # Only a query that was read to the end can be called exhausted
+            self.record(query, new_jobs)
+            self.query_stats.append({**query, "new_jobs": new_jobs})
+            bot.logger.info(f"🔎 Query done: {query['title']} in {query['location']} "
+                            f"{query['filters'] or ''} -> {new_jobs} new jobs")
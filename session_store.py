@@ -0,0 +1,74 @@
+import json
+import os
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+DRIVER_CACHE_PATH = ".chromedriver_path.json"
+DRIVER_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+def chromedriver_path(cache_path=DRIVER_CACHE_PATH, max_age_seconds=DRIVER_CACHE_MAX_AGE, refresh=False):
+    """
+    Path to a chromedriver binary, resolved through webdriver_manager at most once
+    per `max_age_seconds`. CHROMEDRIVER_PATH in the environment wins outright.
+
+    Args:
+        refresh (bool): Ignore the cached path, e.g. after Chrome updated and the
+            cached driver no longer starts a session.
+    """
+    override = os.getenv("CHROMEDRIVER_PATH")
+    if override:
+        return override
+    if not refresh and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if os.path.isfile(cached["path"]) and time.time() - cached["resolved_at"] < max_age_seconds:
+                return cached["path"]
+        except (OSError, ValueError, KeyError):
+            pass
+    path = ChromeDriverManager().install()
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"path": path, "resolved_at": time.time()}, f)
+    return path
+
+
+def save_cookies(driver, path):
+    """Writes the browser's cookies for the current site to `path` (they are credentials; keep the file private)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(driver.get_cookies(), f)
+    os.replace(tmp_path, path)
+
+
+def restore_cookies(driver, path):
+    """
+    Loads cookies saved by save_cookies() through CDP, so no page has to be open
+    on the cookies' domain first. Expired cookies are dropped.
+
+    Returns:
+        int: Number of cookies restored.
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            saved = json.load(f)
+        except json.JSONDecodeError:
+            return 0
+    now = time.time()
+    cookies = []
+    for cookie in saved:
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        converted = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+                     if key in cookie}
+        if cookie.get("expiry"):
+            converted["expires"] = cookie["expiry"]
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            converted["sameSite"] = cookie["sameSite"]
+        cookies.append(converted)
+    if cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+    return len(cookies)
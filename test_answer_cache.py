@@ -0,0 +1,54 @@
+import json
+
+from answer_cache import AnswerCache
+
+
+def cache(tmp_path, config_path=None, **kwargs):
+    return AnswerCache(str(tmp_path / "answer_cache.json"), config_path=config_path, **kwargs)
+
+
+def test_make_key_ignores_case_spacing_and_option_order():
+    key = AnswerCache.make_key("Are you willing to relocate?", "radio", ["Yes", "No"])
+    assert AnswerCache.make_key("  are you  WILLING to relocate ", "Radio", ["no", "yes"]) == key
+    assert AnswerCache.make_key("Are you willing to relocate?", "radio", ["Yes", "No"], resume_hash="x") != key
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    answers = cache(tmp_path, max_entries=2)
+    answers.put("a", "1")
+    answers.put("b", "2")
+    assert answers.get("a") == "1"  # "b" is now the least recently used
+    answers.put("c", "3")
+    assert answers.get("b") is None
+    assert answers.get("a") == "1" and answers.get("c") == "3"
+    assert answers.stats() == {"entries": 2, "hits": 3, "misses": 1, "evictions": 1, "hit_rate": 0.75}
+
+
+def test_expired_entries_are_misses(tmp_path):
+    answers = cache(tmp_path, ttl_seconds=60)
+    answers.put("a", "1")
+    answers._entries["a"]["stored_at"] -= 61
+    assert answers.get("a") is None
+    assert answers.stats()["entries"] == 0
+
+
+def test_entries_survive_a_restart(tmp_path):
+    answers = cache(tmp_path)
+    answers.put("a", "1", label="Notice period")
+    answers.save()
+    assert cache(tmp_path).get("a") == "1"
+
+
+def test_resume_changes_drop_the_cache_but_bot_settings_do_not(tmp_path):
+    config_path = tmp_path / "config.json"
+    config = {"job_title": "Data Engineer", "location": "India", "bot": {"max_jobs": 10}}
+    config_path.write_text(json.dumps(config))
+    answers = cache(tmp_path, str(config_path))
+    answers.put("a", "1")
+    answers.save()
+
+    config_path.write_text(json.dumps({**config, "bot": {"max_jobs": 50}}))
+    assert cache(tmp_path, str(config_path)).get("a") == "1"
+
+    config_path.write_text(json.dumps({**config, "job_title": "ETL Developer"}))
+    assert cache(tmp_path, str(config_path)).get("a") is None
@@ -0,0 +1,127 @@
+import pytest
+
+from answer_rules import AnswerRules, coerce_numeric, match_option, parse_days, parse_years
+
+RESUME = {
+    "experience": [
+        {"company": "Acme", "duration": "2 years 6 months", "tech_stack": ["Python", "AWS", "AWS Glue"]},
+        {"company": "Initech", "duration": "18 months", "tech_stack": ["Python", "SQL"]},
+    ],
+    "primary_skills": ["Python", "Spark"],
+    "notice_period": "30 days",
+    "current_salary": " (negotiable)",  # an unset ${CURRENT_SALARY} placeholder
+    "expected_salary": "18 LPA",
+    "relocation": "Yes",
+    "location_preference": ["Pune", "Bangalore"],
+}
+
+
+@pytest.fixture
+def rules():
+    return AnswerRules(RESUME)
+
+
+@pytest.mark.parametrize("duration, years", [
+    ("4 years", 4.0),
+    ("18 months", 1.5),
+    ("2 years 6 months", 2.5),
+    ("1 yr", 1.0),
+    ("since 2020", None),
+    (None, None),
+])
+def test_parse_years(duration, years):
+    assert parse_years(duration) == years
+
+
+@pytest.mark.parametrize("duration, days", [
+    ("30 days", 30.0),
+    ("1 month", 30.0),
+    ("2 weeks", 14.0),
+    ("Immediate joiner", 0.0),
+    ("negotiable", None),
+])
+def test_parse_days(duration, days):
+    assert parse_days(duration) == days
+
+
+@pytest.mark.parametrize("answer, hint, expected", [
+    ("About 4 years", "", "4"),
+    ("1,200,000", "", "1200000"),
+    ("2.5", "Enter a decimal number larger than 0.0", "2.5"),
+    ("0", "Enter a decimal number larger than 0.0", None),
+    ("-1", "Enter a decimal number larger than 0.0", None),
+    ("99", "Enter a whole number between 0 and 99", "99"),
+    ("0", "Enter a whole number between 0 and 99", "0"),
+    ("100", "Enter a whole number between 0 and 99", None),
+    ("4.6", "Enter a whole number between 0 and 99", "5"),
+    ("no idea", "Enter a whole number between 0 and 99", None),
+])
+def test_coerce_numeric_bounds(answer, hint, expected):
+    assert coerce_numeric(answer, hint) == expected
+
+
+def test_match_option():
+    assert match_option("Yes", ["Yes", "No"]) == "Yes"
+    assert match_option("yes.", ["Yes", "No"]) == "Yes"
+    assert match_option("Bangalore, Karnataka", ["Mumbai", "Bangalore"]) == "Bangalore"
+    assert match_option("Chennai", ["Mumbai", "Bangalore"]) is None
+    assert match_option("anything", None) == "anything"
+
+
+def test_key_rules(rules):
+    assert rules.resolve("What is your notice period?", "text") == "30 days"
+    assert rules.resolve("Expected CTC (in LPA)", "text") == "18 LPA"
+    assert rules.resolve("Are you willing to relocate?", "radio", ["Yes", "No"]) == "Yes"
+
+
+def test_unset_placeholder_goes_to_llm(rules):
+    assert rules.resolve("Current CTC", "text") is None
+
+
+def test_location_preference_picks_first_offered(rules):
+    assert rules.resolve("Preferred location", "select-one", ["Bangalore", "Pune"]) == "Pune"
+    assert rules.resolve("Preferred location", "select-one", ["Bangalore"]) == "Bangalore"
+    assert rules.resolve("Preferred location", "select-one", ["Chennai"]) is None
+    assert rules.resolve("Preferred location", "text") == "Pune, Bangalore"
+
+
+def test_years_of_experience(rules):
+    # Per skill, summed over entries; the longest skill name wins
+    assert rules.resolve("How many years of experience do you have with Python?", "text") == "4"
+    assert rules.resolve("How many years of experience do you have with AWS Glue?", "text") == "2.5"
+    # Primary skills default to total experience
+    assert rules.resolve("Years of experience in Spark", "text") == "4"
+    # Total experience only when no other skill is asked about
+    assert rules.resolve("Total years of experience", "text") == "4"
+    assert rules.resolve("How many years of experience do you have with Kafka?", "text") is None
+
+
+def test_numeric_answer_respects_hint(rules):
+    hint = "Enter a whole number between 0 and 3"
+    assert rules.resolve("Years of experience with Python", "text", validation_hint=hint) is None
+    hint = "Enter a decimal number larger than 0.0"
+    assert rules.resolve("Years of experience with AWS Glue", "text", validation_hint=hint) == "2.5"
+
+
+def test_unmatched_label(rules):
+    assert rules.resolve("Why do you want to work here?", "text") is None
+
+
+def test_relocation_only_answers_willingness(rules):
+    assert rules.resolve("Can you relocate to Pune?", "text") == "Yes"
+    assert rules.resolve("Will you require relocation assistance?", "radio", ["Yes", "No"]) is None
+
+
+def test_qualified_experience_goes_to_llm(rules):
+    assert rules.resolve("How many years of experience do you have managing teams?", "text") is None
+    assert rules.resolve("How many years of Python experience do you have?", "text") == "4"
+    assert rules.resolve("How many years of work experience do you have?", "text") == "4"
+
+
+def test_durations_are_converted_to_the_requested_unit():
+    rules = AnswerRules({**RESUME, "notice_period": "1 month"})
+    assert rules.resolve("Notice period (in days)", "text") == "30"
+    hint = "Enter a whole number between 0 and 90"
+    assert rules.resolve("Notice period (in days)", "text", validation_hint=hint) == "30"
+    assert rules.resolve("Notice period in weeks", "text") == "4.3"
+    assert rules.resolve("What is your notice period?", "text") == "1 month"
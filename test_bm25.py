@@ -0,0 +1,41 @@
+from bm25 import BM25Index, tokenize
+
+
+def index_of(*docs):
+    index = BM25Index()
+    for doc in docs:
+        index.add(tokenize(doc))
+    return index
+
+
+def test_tokenize_keeps_language_names_and_drops_stopwords():
+    assert tokenize("Experience with C++ and C# on the AWS cloud") == ["experience", "c++", "c#", "aws", "cloud"]
+    assert tokenize(None) == []
+
+
+def test_scores_only_matching_documents():
+    index = index_of("python spark etl", "java spring", "python django")
+    scores = index.scores(["python"])
+    assert set(scores) == {0, 2}
+    assert index.scores(["rust"]) == {}
+    assert BM25Index().scores(["python"]) == {}
+
+
+def test_rarer_terms_weigh_more():
+    index = index_of("python spark", "python java", "python go")
+    assert index.idf("spark") > index.idf("python")
+    assert index.top_k(["python", "spark"], 1) == [(0, index.scores(["python", "spark"])[0])]
+
+
+def test_doc_ids_and_fixed_idf():
+    index = index_of("data engineer", "data engineer", "data analyst")
+    assert set(index.scores(["data"], doc_ids={1, 2})) == {1, 2}
+    # The corpus IDF of a term in every document is near zero; a fixed one isn't
+    assert index.scores(["data"], fixed_idf=1.0)[0] > index.scores(["data"])[0]
+
+
+def test_weighted_query_and_ties():
+    index = index_of("python", "python")
+    assert index.top_k({"python": 2.0}, 5) == [(0, index.scores({"python": 2.0})[0]),
+                                               (1, index.scores({"python": 2.0})[1])]
+    assert index.scores({"python": 2.0})[0] == 2 * index.scores(["python"])[0]
@@ -0,0 +1,52 @@
+import pytest
+
+from answer_rules import coerce_numeric
+from field_extractor import constraint_hint
+
+
+def constraints(**overrides):
+    markup = {"type": "text", "pattern": "", "min": "", "max": "", "step": "", "minLength": "", "maxLength": "",
+              "inputMode": "", "numeric": False, "help": ""}
+    markup.update(overrides)
+    return markup
+
+
+def test_no_markup_no_hint():
+    assert constraint_hint({}) == ""
+    assert constraint_hint(constraints()) == ""
+
+
+@pytest.mark.parametrize("markup, hint", [
+    (constraints(type="number", min="0", max="99"), "Enter a whole number between 0 and 99"),
+    (constraints(type="number", step="0.5", min="0", max="10"), "Enter a decimal number between 0 and 10"),
+    (constraints(type="number", min="1"), "Enter a whole number of at least 1"),
+    (constraints(inputMode="numeric", max="60"), "Enter a whole number no more than 60"),
+    (constraints(inputMode="decimal"), "Enter a decimal number"),
+    # LinkedIn's numeric questions are plain text inputs whose id ends in "numeric"
+    (constraints(numeric=True), "Enter a decimal number"),
+])
+def test_numeric_hints(markup, hint):
+    assert constraint_hint(markup) == hint
+
+
+def test_unbounded_numbers_accept_zero():
+    hint = constraint_hint(constraints(numeric=True))
+    assert coerce_numeric("0", hint) == "0"
+
+
+@pytest.mark.parametrize("markup, answer, expected", [
+    (constraints(type="number", min="1"), "0", None),
+    (constraints(type="number", min="1"), "3", "3"),
+    (constraints(inputMode="numeric", max="60"), "90", None),
+    (constraints(type="number", min="0", max="99"), "4.4", "4"),
+])
+def test_hints_are_enforced_by_coerce_numeric(markup, answer, expected):
+    assert coerce_numeric(answer, constraint_hint(markup)) == expected
+
+
+def test_other_constraints_are_joined():
+    markup = constraints(type="tel", pattern="[0-9]{10}", maxLength="10", help="Include the area code")
+    assert constraint_hint(markup) == (
+        "Enter a valid phone number. Must match the pattern [0-9]{10}. At most 10 characters. Include the area code"
+    )
+    assert constraint_hint(constraints(minLength="2", maxLength="40")) == "Between 2 and 40 characters"
@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("google.generativeai")
+pytest.importorskip("dotenv")
+
+from gemini_helper import parse_batch_answers  # noqa: E402
+
+
+def test_plain_json():
+    assert parse_batch_answers('{"0": "Yes", "1": "4"}', ["0", "1"]) == {"0": "Yes", "1": "4"}
+
+
+def test_fenced_json():
+    text = '```json\n{"0": "Yes", "1": "Pune"}\n```'
+    assert parse_batch_answers(text, ["0", "1"]) == {"0": "Yes", "1": "Pune"}
+
+
+def test_json_inside_prose():
+    text = 'Here are the answers:\n{"0": "Yes"}\nLet me know if you need more.'
+    assert parse_batch_answers(text, ["0"]) == {"0": "Yes"}
+
+
+@pytest.mark.parametrize("text", ["", None, "I cannot answer that.", "{not json}", '["Yes", "No"]'])
+def test_unparseable_response_answers_nothing(text):
+    assert parse_batch_answers(text, ["0", "1"]) == {}
+
+
+def test_missing_and_invalid_values_are_left_for_retry():
+    text = '{"0": "  ", "1": true, "2": null, "3": ["a"], "4": 4.5, "5": 3, "6": " Pune "}'
+    ids = ["0", "1", "2", "3", "4", "5", "6", "7"]
+    assert parse_batch_answers(text, ids) == {"4": "4.5", "5": "3", "6": "Pune"}
+
+
+def test_ids_not_asked_for_are_ignored():
+    assert parse_batch_answers('{"0": "Yes", "9": "No"}', ["0"]) == {"0": "Yes"}
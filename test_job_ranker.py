@@ -0,0 +1,35 @@
+from job_ranker import JobRanker
+
+RESUME = {
+    "job_title": "Data Engineer",
+    "primary_skills": ["Python", "SQL"],
+    "experience": [{"tech_stack": ["AWS Glue", "Redshift"]}],
+    "location_preference": ["Pune"],
+}
+
+
+def card(title, company="Acme", location="Pune"):
+    return {"title": title, "company": company, "location": location}
+
+
+def test_relevant_cards_rank_first_and_the_rest_are_skipped():
+    ranker = JobRanker(RESUME, min_score=1.0, window=3)
+    cards = [card("Java Developer"), card("Data Engineer (Python/SQL)"), card("Data Engineer"),
+             card("Frontend Developer"), card("Redshift Data Engineer")]
+    ranked = list(ranker.iter_ranked(cards))
+    assert [c["title"] for c in ranked] == ["Data Engineer (Python/SQL)", "Data Engineer", "Redshift Data Engineer"]
+    assert [c["title"] for c in ranker.skipped] == ["Java Developer", "Frontend Developer"]
+
+
+def test_scores_do_not_depend_on_earlier_cards():
+    ranker = JobRanker(RESUME)
+    first = ranker.score([card("Data Engineer (Python/SQL)"), card("Java Developer")])
+    for _ in range(50):
+        ranker.score([card("Data Engineer"), card("Data Engineer, Snowflake")])
+    again = ranker.score([card("Data Engineer (Python/SQL)"), card("Java Developer")])
+    assert [c["relevance"] for c in again] == [c["relevance"] for c in first]
+
+
+def test_max_jobs_stops_the_stream():
+    ranker = JobRanker(RESUME, window=2)
+    assert len(list(ranker.iter_ranked([card("Data Engineer")] * 5, max_jobs=3))) == 3
@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+
+import pytest
+
+from job_tracker import JobTracker
+
+
+def legacy_file(directory, jobs):
+    path = os.path.join(directory, "applied_jobs.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, indent=2)
+    return path
+
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+def test_legacy_file_is_migrated_once(tmp_path, backend):
+    path = legacy_file(tmp_path, [
+        {"job_id": "1", "job_title": "Data Engineer", "company": "Acme", "applied_at": "2024-01-01T00:00:00"},
+        {"job_id": "2", "job_title": "ETL Developer", "company": "Initech", "applied_at": "2024-01-02T00:00:00"},
+    ])
+    tracker = JobTracker(path, backend=backend)
+    assert tracker.has_applied("1") and tracker.has_applied("2")
+    tracker.close()
+    assert not os.path.exists(path)
+    assert os.path.exists(path + ".migrated")
+
+    tracker = JobTracker(path, backend=backend)
+    assert sorted(job["job_id"] for job in tracker.jobs) == ["1", "2"]
+    tracker.close()
+
+
+def test_switching_backends_keeps_history(tmp_path):
+    path = str(tmp_path / "applied_jobs.json")
+    tracker = JobTracker(path, backend="jsonl")
+    tracker.mark_as_applied("1", "Data Engineer", "Acme")
+    tracker.close()
+
+    tracker = JobTracker(path, backend="sqlite")
+    tracker.mark_as_applied("2", "ETL Developer", "Initech")
+    assert tracker.has_applied("1") and tracker.has_applied("2")
+    tracker.close()
+    assert os.path.exists(str(tmp_path / "applied_jobs.jsonl.migrated"))
+
+
+def test_jsonl_log_is_compacted(tmp_path):
+    path = str(tmp_path / "applied_jobs.json")
+    tracker = JobTracker(path)
+    tracker.mark_as_applied("1", "Data Engineer", "Acme")
+    tracker.mark_as_applied("1", "Senior Data Engineer", "Acme")
+    tracker.mark_as_applied("2", "ETL Developer", "Initech")
+    tracker.close()
+    store = str(tmp_path / "applied_jobs.jsonl")
+    with open(store, "a", encoding="utf-8") as f:
+        f.write('{"job_id": "3", "job_ti')  # torn write
+
+    tracker = JobTracker(path)
+    assert {job["job_id"]: job["job_title"] for job in tracker.jobs} == {
+        "1": "Senior Data Engineer", "2": "ETL Developer",
+    }
+    tracker.close()
+    with open(store, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert [record["job_id"] for record in lines] == ["1", "2"]
+
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+def test_claims(tmp_path, backend):
+    tracker = JobTracker(str(tmp_path / "applied_jobs.json"), backend=backend)
+    assert tracker.claim("1", "worker-0")
+    assert not tracker.claim("1", "worker-1")
+    tracker.release("1")
+    assert tracker.claim("1", "worker-1")
+    tracker.mark_as_applied("1", "Data Engineer", "Acme")
+    assert not tracker.claim("1", "worker-0")
+    tracker.close()
+
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+def test_concurrent_claims_have_one_winner(tmp_path, backend):
+    tracker = JobTracker(str(tmp_path / "applied_jobs.json"), backend=backend)
+    start = threading.Barrier(8)
+    results = []
+
+    def worker(name):
+        start.wait()
+        results.append(tracker.claim("1", name))
+
+    threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    tracker.close()
+    assert sorted(results) == [False] * 7 + [True]
+
+
+def test_sqlite_claims_span_processes(tmp_path):
+    # Two trackers on one database stand in for two worker processes
+    path = str(tmp_path / "applied_jobs.json")
+    first = JobTracker(path, backend="sqlite")
+    second = JobTracker(path, backend="sqlite")
+    assert first.claim("1", "worker-0")
+    assert not second.claim("1", "worker-1")
+    first.mark_as_applied("1", "Data Engineer", "Acme")
+    first.close()
+    second.close()
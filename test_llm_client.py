@@ -0,0 +1,115 @@
+import time
+
+import pytest
+
+from fake_gemini import FakeGeminiModel, FakeQuotaError
+from llm_client import CircuitBreaker, CircuitOpenError, LLMClient, TokenBucket
+
+
+def ask(model, prompt):
+    return model.generate_content(prompt).text
+
+
+def fake(**kwargs):
+    return FakeGeminiModel(latency=0.0, jitter=0.0, seed=1, **kwargs)
+
+
+def client(model, **kwargs):
+    options = {"requests_per_minute": 60000, "base_delay": 0.0, "max_delay": 0.0}
+    options.update(kwargs)
+    return LLMClient(model, **options)
+
+
+def test_token_bucket_throttles_beyond_burst():
+    bucket = TokenBucket(600, capacity=1)  # one token per 0.1 s
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() > 0.05
+
+
+def test_backoff_is_capped():
+    llm = LLMClient(fake(), base_delay=1.0, max_delay=4.0)
+    assert all(0 <= llm._backoff(attempt) <= min(4.0, 2 ** attempt) for attempt in range(6) for _ in range(20))
+    llm.shutdown()
+
+
+def test_breaker_opens_then_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert breaker.allow() and not breaker.allow()
+    # A failed trial reopens it straight away
+    breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.failures == 0
+
+
+def test_transient_failures_are_retried():
+    model = fake(failure_rate=0.3)
+    llm = client(model, max_retries=10, failure_threshold=100)
+    answers = [llm.call(ask, "Are you willing to relocate?") for _ in range(10)]
+    stats = llm.stats()
+    llm.shutdown()
+    assert answers == ["Yes"] * 10
+    assert stats["retries"] > 0
+    assert model.calls == 10 + stats["retries"]
+
+
+def test_quota_exhaustion_falls_back():
+    primary, fallback = fake(requests_per_minute=2), fake()
+    llm = client(primary, fallback_model=fallback, max_retries=1)
+    answers = [llm.call(ask, "Are you willing to relocate?") for _ in range(3)]
+    stats = llm.stats()
+    llm.shutdown()
+    assert answers == ["Yes"] * 3
+    assert primary.calls == 4  # two answered, then the third call and its retry hit the quota
+    assert fallback.calls == 1
+    assert stats["fallbacks"] == 1 and stats["failed"] == 0
+
+
+def test_open_circuit_skips_the_model_until_reset():
+    model = fake(failure_rate=1.0)
+    llm = client(model, max_retries=5, failure_threshold=2, reset_timeout=0.05)
+    with pytest.raises(FakeQuotaError):
+        llm.call(ask, "Are you willing to relocate?")
+    assert model.calls == 2  # the breaker opened before the retries ran out
+    with pytest.raises(CircuitOpenError):
+        llm.call(ask, "Are you willing to relocate?")
+    assert model.calls == 2
+
+    model.failure_rate = 0.0
+    time.sleep(0.06)
+    assert llm.call(ask, "Are you willing to relocate?") == "Yes"
+    assert llm.stats()["circuits"] == {"primary": "closed"}
+    llm.shutdown()
+
+
+def test_unusable_answers_are_not_retried():
+    model = fake()
+    llm = client(model, max_retries=3, failure_threshold=1)
+
+    def blocked(model, prompt):
+        model.generate_content(prompt)
+        raise ValueError("response was blocked")
+
+    with pytest.raises(ValueError):
+        llm.call(blocked, "Are you willing to relocate?")
+    assert model.calls == 1
+    assert llm.stats()["circuits"] == {"primary": "closed"}
+    llm.shutdown()
+
+
+def test_submit_runs_calls_concurrently():
+    model = FakeGeminiModel(latency=0.1, jitter=0.0)
+    llm = client(model, max_workers=4)
+    started = time.monotonic()
+    futures = [llm.submit(ask, "Are you willing to relocate?") for _ in range(4)]
+    assert [future.result(timeout=5) for future in futures] == ["Yes"] * 4
+    assert time.monotonic() - started < 0.3
+    llm.shutdown()
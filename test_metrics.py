@@ -0,0 +1,71 @@
+import json
+
+from metrics import Metrics, percentile, traced
+
+
+class Counter:
+    def __init__(self):
+        self.total = 0
+
+
+class Worker:
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.commands = Counter()
+
+    @traced("step")
+    def step(self, calls):
+        with self.metrics.span("inner"):
+            self.commands.total += calls
+
+
+def test_percentile():
+    ordered = list(range(1, 21))
+    assert percentile(ordered, 0.5) == 11
+    assert percentile(ordered, 0.95) == 20
+    assert percentile([7], 0.95) == 7
+
+
+def test_spans_nest_and_inherit_attributes():
+    metrics = Metrics(None, prometheus_path=None, summary_path=None)
+    with metrics.span("job", job_id="42"):
+        with metrics.span("modal") as attrs:
+            attrs["step"] = 1
+    summary = metrics.summary()
+    assert set(summary["phases"]) == {"job", "modal"}
+    assert set(summary["jobs"]["42"]) == {"job", "modal"}
+
+
+def test_traced_spans_count_driver_calls():
+    metrics = Metrics(None, prometheus_path=None, summary_path=None)
+    worker = Worker(metrics)
+    worker.step(3)
+    worker.step(5)
+    phases = metrics.summary()["phases"]
+    assert phases["step"]["count"] == 2
+    assert phases["step"]["driver_calls_per_call"] == 4.0
+    assert "driver_calls_per_call" not in phases["inner"]
+
+
+def test_log_rotates_past_max_bytes(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    metrics = Metrics(str(path), prometheus_path=None, summary_path=None, max_bytes=2000)
+    for i in range(50):
+        with metrics.span("step", index=i):
+            pass
+    metrics.close()
+    rotated = tmp_path / "metrics.jsonl.1"
+    assert rotated.exists() and rotated.stat().st_size >= 2000
+    assert path.stat().st_size < 2000
+    lines = [json.loads(line) for name in (rotated, path) for line in name.read_text().splitlines()]
+    assert [line["index"] for line in lines][-1] == 49
+
+
+def test_close_writes_summaries(tmp_path):
+    metrics = Metrics(None, prometheus_path=str(tmp_path / "metrics.prom"),
+                      summary_path=str(tmp_path / "summary.json"), run_id="run1")
+    with metrics.span("search"):
+        pass
+    metrics.close()
+    assert 'bot_span_seconds_count{phase="search",run_id="run1"} 1' in (tmp_path / "metrics.prom").read_text()
+    assert json.loads((tmp_path / "summary.json").read_text())["phases"]["search"]["count"] == 1
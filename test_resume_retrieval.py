@@ -0,0 +1,51 @@
+from resume_retrieval import ResumeRetriever, resume_snippets
+
+RESUME = {
+    "job_title": "Data Engineer",
+    "location": "Bangalore",
+    "notice_period": "30 days",
+    "expected_salary": "18 LPA",
+    "relocation": "Yes",
+    "primary_skills": ["Python", "SQL", "Spark"],
+    "experience": [
+        {"company": "Acme", "duration": "4 years", "tech_stack": ["AWS Glue", "Redshift"]},
+    ],
+    "project_details": [
+        {"Sales lakehouse": ["Built ETL pipelines in Redshift", "Cut load times by 40%"]},
+    ],
+    "certification": {"aws": "AWS Certified Data Engineer"},
+}
+
+
+def test_snippets_split_lists_entries_and_projects():
+    snippets = resume_snippets(RESUME)
+    assert ("job_title", "Job title: Data Engineer") in snippets
+    assert ("primary_skills", "Primary skills: Python, SQL, Spark") in snippets
+    assert ("experience", "Experience #1: Company: Acme; Duration: 4 years; Tech_stack: AWS Glue, Redshift") in snippets
+    assert ("project_details",
+            "Project details - Sales lakehouse: Built ETL pipelines in Redshift; Cut load times by 40%") in snippets
+    assert ("certification", "Certification - Aws: AWS Certified Data Engineer") in snippets
+
+
+def test_stems_and_keys_find_the_right_snippet():
+    retriever = ResumeRetriever(RESUME, top_k=1)
+    keys = lambda query: [retriever.snippets[i][0] for i in retriever.retrieve(query)]
+    assert keys("Are you willing to relocate?") == ["relocation"]
+    assert keys("Expected CTC") == ["expected_salary"]
+    assert keys("What is your notice period?") == ["notice_period"]
+
+
+def test_context_keeps_pinned_snippets_in_resume_order():
+    retriever = ResumeRetriever(RESUME, top_k=1)
+    context = retriever.context_for(["What is your notice period?", "Are you willing to relocate?"])
+    assert context.splitlines() == [
+        "Job title: Data Engineer",
+        "Location: Bangalore",
+        "Notice period: 30 days",
+        "Relocation: Yes",
+    ]
+
+
+def test_unmatched_query_falls_back_to_the_full_summary():
+    retriever = ResumeRetriever(RESUME)
+    assert retriever.context_for(["What is your notice period?", "Describe your hobbies"]) is None
@@ -0,0 +1,47 @@
+from schema_cache import SchemaCache
+
+
+def field(label, tag="input", type_="text", options=()):
+    return {"label": label, "tag": tag, "type": type_, "options": list(options)}
+
+
+STEP = [
+    field("Notice period (in days)"),
+    field("Are you willing to relocate?", "fieldset", "radio", ["Yes", "No"]),
+]
+
+
+def test_fingerprint_follows_structure_not_formatting():
+    same = [
+        field("notice period (in days) "),
+        field("Are you willing to relocate", "fieldset", "RADIO", ["No", "Yes"]),
+    ]
+    assert SchemaCache.fingerprint(same) == SchemaCache.fingerprint(STEP)
+
+
+def test_fingerprint_changes_with_fields_order_options_and_resume():
+    fingerprint = SchemaCache.fingerprint(STEP)
+    assert SchemaCache.fingerprint(STEP[::-1]) != fingerprint
+    assert SchemaCache.fingerprint(STEP[:1]) != fingerprint
+    assert SchemaCache.fingerprint([STEP[0], field(STEP[1]["label"], "fieldset", "radio", ["Yes", "No", "Maybe"])]) \
+        != fingerprint
+    assert SchemaCache.fingerprint(STEP, resume_hash="abc") != fingerprint
+
+
+def test_peek_has_no_side_effects(tmp_path):
+    steps = SchemaCache(str(tmp_path / "schema_cache.json"), max_entries=2, config_path=None)
+    steps.put("a", ["30", "Yes"])
+    steps.put("b", ["15", None])
+    assert "a" in steps and "z" not in steps
+    assert steps.peek("a") == ["30", "Yes"]
+    assert steps.stats()["hits"] == 0 and steps.stats()["misses"] == 0
+    # Peeking didn't make "a" recently used, so it is still the one evicted
+    steps.put("c", ["0", "No"])
+    assert steps.peek("a") is None and "b" in steps
+
+
+def test_peek_respects_ttl(tmp_path):
+    steps = SchemaCache(str(tmp_path / "schema_cache.json"), ttl_seconds=60, config_path=None)
+    steps.put("a", ["30", "Yes"])
+    steps._entries["a"]["stored_at"] -= 61
+    assert "a" not in steps
@@ -0,0 +1,49 @@
+from search_planner import SearchPlanner, filter_params
+
+
+def planner(tmp_path, **kwargs):
+    return SearchPlanner(["Data Engineer", "ETL Developer"], ["Pune", "Bangalore"],
+                         cache_path=str(tmp_path / "search_cache.json"), **kwargs)
+
+
+def test_filter_params():
+    assert filter_params({"date_posted": "week", "experience": ["entry", "mid_senior"]}) == {
+        "f_TPR": "r604800", "f_E": "2,4",
+    }
+    assert filter_params(None) == {}
+
+
+def test_plan_interleaves_by_priority(tmp_path):
+    queries = planner(tmp_path, geo_ids={"Pune": "1"}).plan()
+    assert [(q["title"], q["location"]) for q in queries] == [
+        ("Data Engineer", "Pune"),
+        ("Data Engineer", "Bangalore"),
+        ("ETL Developer", "Pune"),
+        ("ETL Developer", "Bangalore"),
+    ]
+    assert [q["geo_id"] for q in queries] == ["1", None, "1", None]
+
+
+def test_exhausted_queries_are_skipped_until_they_find_jobs(tmp_path):
+    first = planner(tmp_path)
+    query = first.plan()[0]
+    first.record(query, new_jobs=0)
+    assert query not in planner(tmp_path).plan()
+
+    first.record(query, new_jobs=3)
+    assert planner(tmp_path).plan()[0] == query
+
+
+def test_exhausted_entries_expire(tmp_path):
+    first = planner(tmp_path)
+    query = first.plan()[0]
+    first.record(query, new_jobs=0)
+    assert planner(tmp_path, exhausted_ttl=0).plan()[0] == query
+
+
+def test_from_config_falls_back_to_resume_locations():
+    config = {"job_title": "Data Engineer", "location": "India", "location_preference": ["Pune", "India"]}
+    search = SearchPlanner.from_config(config, cache_path=None)
+    assert search.titles == ["Data Engineer"]
+    assert search.locations == ["Pune", "India"]
+    assert search.filters == [{}]
@@ -0,0 +1,281 @@
+import json
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from metrics import percentile
+
+# Per-action ceilings in seconds. These are upper bounds, not delays: a wait
+# returns as soon as its condition holds. Tune them from wait_stats.json.
+DEFAULT_TIMEOUTS = {
+    "login_page": 10,
+    "login_submit": 15,
+    "login_challenge": 60,
+    "search_results": 15,
+    "job_cards_loaded": 10,
+    "job_page": 10,
+    "job_panel": 6,
+    "dropdown_open": 3,
+    "modal_open": 10,
+    "modal_ready": 5,
+    "modal_step_change": 8,
+    "field_validation": 1.5,
+    "checkbox_toggle": 2,
+    "submit_confirmed": 8,
+    "modal_closed": 3,
+}
+
+MODAL_SIGNATURE_JS = r"""
+const signatureOf = modal => {
+    const progress = modal.querySelector('[role="progressbar"], progress');
+    const parts = [progress ? (progress.getAttribute('aria-valuenow') || progress.value || '') : ''];
+    modal.querySelectorAll('h3, label, legend, button[aria-label]').forEach(el => {
+        parts.push(el.getAttribute('aria-label') || (el.innerText || '').trim());
+    });
+    return parts.join('|');
+};
+"""
+
+MODAL_SIGNATURE_SCRIPT = MODAL_SIGNATURE_JS + r"""
+const modal = document.querySelector(arguments[0]);
+return modal ? signatureOf(modal) : null;
+"""
+
+MODAL_ERRORS_JS = r"""
+const errorsIn = modal => Array.from(modal.querySelectorAll('.artdeco-inline-feedback'))
+    .map(el => (el.innerText || el.textContent || '').trim()).filter(Boolean);
+"""
+
+# Signature plus whether the step shows inline errors, for waits that end on a rejected step too
+MODAL_PROGRESS_SCRIPT = MODAL_SIGNATURE_JS + MODAL_ERRORS_JS + r"""
+const modal = document.querySelector(arguments[0]);
+return modal ? [signatureOf(modal), errorsIn(modal).length > 0] : null;
+"""
+
+# The buttons that move the Easy Apply modal along, in the order they are tried
+MODAL_ACTIONS_JS = r"""
+const ACTIONS = ['continue', 'review', 'submit', 'submit_alt'];
+const findAction = (modal, name) => {
+    const usable = el => el && !el.disabled && el.getClientRects().length > 0 ? el : null;
+    if (name === 'continue') return usable(modal.querySelector("button[aria-label='Continue to next step']"));
+    if (name === 'review') return usable(modal.querySelector("button[aria-label='Review your application']"));
+    if (name === 'submit') return usable(modal.querySelector("button[aria-label='Submit application']"));
+    return usable(Array.from(modal.querySelectorAll('button')).find(b => (b.textContent || '').includes('Submit')));
+};
+"""
+
+# Everything a modal step needs to decide its next move, in one round trip
+MODAL_STATE_SCRIPT = MODAL_SIGNATURE_JS + MODAL_ACTIONS_JS + MODAL_ERRORS_JS + r"""
+const modal = document.querySelector(arguments[0]);
+if (!modal) return null;
+const empty = el => {
+    if (el.tagName === 'FIELDSET') return !el.querySelector('input:checked');
+    if (el.tagName === 'SELECT') return el.selectedIndex <= 0;
+    return (el.value || '').trim() === '';
+};
+const follow = document.getElementById('follow-company-checkbox');
+return {
+    signature: signatureOf(modal),
+    actions: ACTIONS.filter(name => findAction(modal, name)),
+    empty_required: Array.from(modal.querySelectorAll(arguments[1])).filter(empty).length,
+    errors: errorsIn(modal),
+    follow_checked: !!(follow && follow.checked)
+};
+"""
+
+DETAIL_PANE_SCRIPT = r"""
+const jobId = arguments[0];
+const pane = document.querySelector('.jobs-search__job-details, .jobs-search__job-details--container');
+if (!pane) return false;
+// The URL's currentJobId changes before the pane content does, so look for the job inside the pane
+const shown = pane.querySelector('[data-job-id="' + jobId + '"], a[href*="/jobs/view/' + jobId + '"]');
+const button = pane.querySelector('#jobs-apply-button-id, button.jobs-apply-button');
+return !!(shown && button && button.getClientRects().length);
+"""
+
+
+def document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def modal_signature(driver, modal_selector=".jobs-easy-apply-modal"):
+    """Short text fingerprint of the modal's current step (progress, headings, labels, buttons)."""
+    return driver.execute_script(MODAL_SIGNATURE_SCRIPT, modal_selector)
+
+
+def modal_state(driver, required_selector, modal_selector=".jobs-easy-apply-modal"):
+    """
+    The modal's current step in one call: its signature (as modal_signature), the
+    actions available ("continue", "review", "submit", "submit_alt"), how many
+    required fields are empty, the inline error messages shown and whether
+    "Follow company" is ticked. None once the modal is closed.
+    """
+    return driver.execute_script(MODAL_STATE_SCRIPT, modal_selector, required_selector)
+
+
+class modal_step_changed:
+    def __init__(self, previous_signature, modal_selector=".jobs-easy-apply-modal", stop_on_errors=False):
+        """
+        True once the modal shows a different step, or has closed (returns "closed").
+        With `stop_on_errors`, also returns "errors" as soon as the step shows inline
+        errors, i.e. the form rejected the click instead of moving on.
+        """
+        self.previous = previous_signature
+        self.modal_selector = modal_selector
+        self.stop_on_errors = stop_on_errors
+
+    def __call__(self, driver):
+        if not self.stop_on_errors:
+            current = modal_signature(driver, self.modal_selector)
+            if current is None:
+                return "closed"
+            return current if current != self.previous else False
+        progress = driver.execute_script(MODAL_PROGRESS_SCRIPT, self.modal_selector)
+        if progress is None:
+            return "closed"
+        current, has_errors = progress
+        if current != self.previous:
+            return current
+        return "errors" if has_errors else False
+
+
+class detail_pane_shows:
+    def __init__(self, job_id):
+        """True once the search page's detail pane shows this job with its apply button rendered."""
+        self.job_id = str(job_id)
+
+    def __call__(self, driver):
+        return driver.execute_script(DETAIL_PANE_SCRIPT, self.job_id)
+
+
+class css_count_stable:
+    def __init__(self, css_selector, min_count=1, stable_for=0.5):
+        """True once at least `min_count` elements match and the count stops changing for `stable_for` seconds."""
+        self.css_selector = css_selector
+        self.min_count = min_count
+        self.stable_for = stable_for
+        self.last_count = None
+        self.stable_since = None
+
+    def __call__(self, driver):
+        count = driver.execute_script("return document.querySelectorAll(arguments[0]).length", self.css_selector)
+        now = time.monotonic()
+        if count != self.last_count:
+            self.last_count = count
+            self.stable_since = now
+            return False
+        if count >= self.min_count and now - self.stable_since >= self.stable_for:
+            return count
+        return False
+
+
+class network_idle:
+    def __init__(self, idle_time=0.5, long_poll_after=5.0):
+        """
+        True once no request has been in flight for `idle_time` seconds.
+
+        Reads CDP Network events from Chrome's performance log (enabled in
+        LinkedInBot._setup_driver). Requests open longer than `long_poll_after`
+        seconds are treated as long-polls and ignored. Falls back to watching the
+        Resource Timing buffer when the performance log is unavailable.
+        """
+        self.idle_time = idle_time
+        self.long_poll_after = long_poll_after
+        self.in_flight = {}
+        self.last_activity = time.monotonic()
+        self.resource_count = None
+        self.use_cdp = True
+
+    def _poll_cdp(self, driver, now):
+        wall_now = time.time()
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method", "")
+            request_id = message.get("params", {}).get("requestId")
+            # The log is buffered: place each event at its own time (entry["timestamp"] is epoch ms),
+            # so requests logged before this wait started don't count as just started
+            at = now - max(0.0, wall_now - entry["timestamp"] / 1000)
+            if method == "Network.requestWillBeSent":
+                self.in_flight[request_id] = at
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                self.in_flight.pop(request_id, None)
+            else:
+                continue
+            self.last_activity = max(self.last_activity, at)
+        for request_id, started in list(self.in_flight.items()):
+            if now - started > self.long_poll_after:
+                del self.in_flight[request_id]
+
+    def _poll_resource_timing(self, driver, now):
+        count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        if count != self.resource_count:
+            self.resource_count = count
+            self.last_activity = now
+
+    def __call__(self, driver):
+        now = time.monotonic()
+        if self.use_cdp:
+            try:
+                self._poll_cdp(driver, now)
+            except WebDriverException:
+                self.use_cdp = False
+        if not self.use_cdp:
+            self._poll_resource_timing(driver, now)
+        return not self.in_flight and now - self.last_activity >= self.idle_time
+
+
+class WaitEngine:
+    def __init__(self, driver, timeouts=None, poll_frequency=0.1, stats_path="wait_stats.json"):
+        """
+        Condition-based waits with per-action timeouts and timing records.
+
+        Args:
+            driver: The WebDriver instance.
+            timeouts (dict): Overrides for DEFAULT_TIMEOUTS, keyed by action name.
+            poll_frequency (float): Seconds between condition checks.
+            stats_path (str): Where save() writes the per-action timing summary.
+        """
+        self.driver = driver
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.poll_frequency = poll_frequency
+        self.stats_path = stats_path
+        self.records = defaultdict(list)
+        self.timeout_counts = defaultdict(int)
+
+    def until(self, action, condition, timeout=None):
+        """
+        Waits for `condition(driver)` to return something truthy.
+
+        Returns:
+            The condition's value, or None if the action's timeout elapsed first.
+        """
+        timeout = timeout if timeout is not None else self.timeouts.get(action, 10)
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+        except TimeoutException:
+            result = None
+            self.timeout_counts[action] += 1
+        self.records[action].append(time.monotonic() - start)
+        return result
+
+    def summary(self):
+        report = {}
+        for action, durations in self.records.items():
+            ordered = sorted(durations)
+            report[action] = {
+                "count": len(ordered),
+                "timeouts": self.timeout_counts.get(action, 0),
+                "timeout_s": self.timeouts.get(action, 10),
+                "mean_s": round(sum(ordered) / len(ordered), 3),
+                "p50_s": round(percentile(ordered, 0.50), 3),
+                "p95_s": round(percentile(ordered, 0.95), 3),
+                "max_s": round(ordered[-1], 3),
+            }
+        return report
+
+    def save(self):
+        with open(self.stats_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
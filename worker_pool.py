@@ -0,0 +1,236 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+
+from answer_cache import AnswerCache
+from gemini_prompter import compile_profile
+from schema_cache import SchemaCache
+from job_tracker import JobTracker
+from linkedin_bot import LinkedInBot
+from metrics import Metrics
+
+_DONE = object()
+
+
+class WorkerPool:
+    def __init__(self, resume_context, workers=2, pacing_seconds=0.0, headless=False, tracker_backend="jsonl",
+                 tracker_path="applied_jobs.json", answer_cache_path="answer_cache.json",
+                 schema_cache_path="schema_cache.json", profile_root="chrome_profiles", bot_kwargs=None,
+                 llm_client=None, job_ranker=None):
+        """
+        Runs N browser workers that apply to jobs pulled from one shared queue.
+
+        Args:
+            resume_context (dict): Compiled once and shared by every worker's LinkedInBot.
+            workers (int): Number of browsers.
+            pacing_seconds (float): Minimum time between two applications of the same worker.
+            headless (bool): Run the browsers headless.
+            tracker_backend (str): Backend for the shared JobTracker.
+            tracker_path (str): Legacy JSON path the tracker store is derived from.
+            answer_cache_path (str): File for the shared AnswerCache.
+            schema_cache_path (str): File for the shared SchemaCache of known form steps.
+            profile_root (str): Each worker gets its own Chrome profile under this directory.
+            bot_kwargs (dict): Extra LinkedInBot arguments (e.g. base_url for the mock site).
+            llm_client: Shared LLMClient so all workers draw from one rate limit. Defaults to
+                the first worker's client.
+            job_ranker (JobRanker): Orders the queue best first and drops low-relevance cards.
+        """
+        self.resume_context = compile_profile(resume_context)
+        self.worker_count = max(1, workers)
+        self.pacing_seconds = pacing_seconds
+        self.headless = headless
+        self.profile_root = profile_root
+        self.bot_kwargs = bot_kwargs or {}
+        self.logger = LinkedInBot._setup_logger()
+        self.tracker = JobTracker(tracker_path, backend=tracker_backend)
+        self.answer_cache = AnswerCache(answer_cache_path)
+        self.schema_cache = SchemaCache(schema_cache_path)
+        self.metrics = Metrics()  # one span log for all workers; spans carry the job id
+        self.llm_client = llm_client
+        self.job_ranker = job_ranker
+        self.jobs = queue.Queue()
+        self.bots = []
+        self.results = []
+        self.results_lock = threading.Lock()
+
+    def _make_bot(self, worker_id):
+        bot = LinkedInBot(
+            headless=self.headless,
+            resume_context=self.resume_context,
+            profile_dir=os.path.join(self.profile_root, f"worker-{worker_id}"),
+            tracker=self.tracker,
+            answer_cache=self.answer_cache,
+            schema_cache=self.schema_cache,
+            llm_client=self.llm_client,
+            logger=_WorkerLogger(self.logger, worker_id),
+            job_ranker=self.job_ranker,
+            metrics=self.metrics,
+            **self.bot_kwargs,
+        )
+        bot.waits.stats_path = f"wait_stats_worker{worker_id}.json"
+        if self.llm_client is None:
+            # First worker's client becomes the shared one
+            self.llm_client = bot.llm
+            bot._owned.discard("llm")
+        return bot
+
+    def _record(self, worker_id, job, submitted, seconds):
+        with self.results_lock:
+            self.results.append({"worker": worker_id, "job_id": job["job_id"], "submitted": submitted,
+                                 "seconds": seconds})
+
+    def _work(self, worker_id, bot, email, password, feed=None):
+        try:
+            bot.login(email, password)
+        except Exception as e:
+            bot.logger.error(f"❌ Worker login failed: {e}")
+            if feed:
+                self.jobs.put(_DONE)  # nobody else will fill the queue
+            return
+        if feed:
+            self._feed(bot, *feed)
+        last_started = 0.0
+        while True:
+            job = self.jobs.get()
+            if job is _DONE:
+                self.jobs.put(_DONE)  # let the other workers see it too
+                return
+            if not self.tracker.claim(job["job_id"], worker=f"worker-{worker_id}"):
+                bot.logger.info(f"⏭️ Already applied or claimed: {job['title']} at {job['company']} (skipping)")
+                continue
+            wait = self.pacing_seconds - (time.monotonic() - last_started)
+            if wait > 0:
+                time.sleep(wait)  # deliberate per-worker pacing, not a page wait
+            last_started = time.monotonic()
+            submitted = False
+            try:
+                submitted = bot.apply_to_job(job)
+            finally:
+                # apply_to_job marks the job as applied (which drops the claim) once the modal was attempted
+                self.tracker.release(job["job_id"])
+                self._record(worker_id, job, submitted, time.monotonic() - last_started)
+
+    def _feed(self, bot, job_title, location, max_jobs, planner):
+        try:
+            if planner is not None:
+                cards = planner.iter_job_cards(bot)
+            else:
+                bot.search_jobs(job_title, location)
+                cards = bot.iter_job_cards()
+            # Cards stream into the queue as they are found, so other workers start right away
+            for job in bot.iter_ranked_job_cards(max_jobs=max_jobs, cards=cards):
+                self.jobs.put(job)
+        except Exception as e:
+            bot.logger.error(f"❌ Job collection failed: {e}")
+        finally:
+            self.jobs.put(_DONE)
+
+    def run(self, email, password, job_title=None, location=None, max_jobs=10, planner=None):
+        """
+        Logs every worker in and applies in parallel. The first worker runs the search and
+        fills the queue before it starts applying; the others start as soon as jobs arrive.
+
+        Args:
+            planner (SearchPlanner): Run its queries instead of the single job_title/location search.
+
+        Returns:
+            dict: Aggregate throughput report.
+        """
+        started = time.monotonic()
+        self.bots = [self._make_bot(worker_id) for worker_id in range(1, self.worker_count + 1)]
+        threads = []
+        try:
+            for worker_id, bot in enumerate(self.bots, 1):
+                feed = (job_title, location, max_jobs, planner) if worker_id == 1 else None
+                thread = threading.Thread(target=self._work, args=(worker_id, bot, email, password, feed),
+                                          name=f"worker-{worker_id}", daemon=True)
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+        finally:
+            for bot in self.bots:
+                try:
+                    bot.close()
+                except Exception as e:
+                    self.logger.error(f"❌ Error closing worker browser: {e}")
+            self.answer_cache.save()
+            self.schema_cache.save()
+            if self.llm_client is not None:
+                self.llm_client.shutdown()
+            self.tracker.close()
+            self.metrics.close()
+
+        report = self.report(time.monotonic() - started)
+        self.logger.info(f"🏁 Worker pool report: {report}")
+        return report
+
+    def report(self, elapsed):
+        with self.results_lock:
+            results = list(self.results)
+        submitted = sum(1 for r in results if r["submitted"])
+        per_worker = {}
+        for r in results:
+            stats = per_worker.setdefault(r["worker"], {"attempted": 0, "submitted": 0, "busy_s": 0.0})
+            stats["attempted"] += 1
+            stats["submitted"] += int(r["submitted"])
+            stats["busy_s"] = round(stats["busy_s"] + r["seconds"], 1)
+        # How each field was answered (rules, cache, schema_cache, llm_batch, ...), over all workers
+        answer_sources = sum((bot.answer_sources for bot in self.bots), Counter())
+        return {
+            "workers": self.worker_count,
+            "attempted": len(results),
+            "submitted": submitted,
+            "elapsed_s": round(elapsed, 1),
+            "applications_per_minute": round(submitted / (elapsed / 60), 2) if elapsed else 0.0,
+            "per_worker": per_worker,
+            "answer_sources": dict(answer_sources),
+            "spans": self.metrics.summary()["phases"],
+        }
+
+
+class _WorkerLogger(logging.LoggerAdapter):
+    def __init__(self, logger, worker_id):
+        super().__init__(logger, {})
+        self.prefix = f"[worker-{worker_id}] "
+
+    def process(self, msg, kwargs):
+        return self.prefix + str(msg), kwargs
+
+
+if __name__ == "__main__":
+    # Offline run against the mock site and a fake model:
+    # python worker_pool.py [workers] [jobs]
+    import sys
+    import tempfile
+
+    from config_loader import get_resume_profile, load_config
+    from fake_gemini import FakeGeminiModel
+    from llm_client import LLMClient
+    from mock_linkedin import MockLinkedIn
+
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    job_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    state_dir = tempfile.mkdtemp(prefix="worker_pool_")
+
+    with MockLinkedIn(job_count=job_count) as site:
+        pool = WorkerPool(
+            get_resume_profile(load_config()),
+            workers=workers,
+            headless=True,
+            tracker_backend="sqlite",
+            tracker_path=os.path.join(state_dir, "applied_jobs.json"),
+            answer_cache_path=os.path.join(state_dir, "answer_cache.json"),
+            profile_root=os.path.join(state_dir, "profiles"),
+            bot_kwargs={"base_url": site.base_url, "lean": True},
+            llm_client=LLMClient(FakeGeminiModel(latency=0.3), requests_per_minute=600),
+        )
+        report = pool.run("mock@example.com", "mock-password", "Data Engineer", "India", max_jobs=job_count)
+        duplicates = {job_id: n for job_id, n in site.submissions.items() if n > 1}
+
+    print(json.dumps(report, indent=2))
+    print(f"Submissions received by mock site: {len(site.submissions)} (duplicates: {duplicates or 'none'})")